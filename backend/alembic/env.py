@@ -13,6 +13,7 @@ from blog.infra.database import Base # <--- Ajuste seu caminho aqui!
 from blog.infra.models.bedroom_model import BedroomModel # <--- Ajuste seu caminho aqui!
 from blog.infra.models.reservation_model import ReservationModel # <--- Ajuste seu caminho aqui! 
 from blog.infra.models.user_model import UserModel # <--- Ajuste seu caminho aqui!
+from blog.infra.models.bedroom_rate_model import BedroomRateModel
 
 config = context.config
 if config.config_file_name is not None:
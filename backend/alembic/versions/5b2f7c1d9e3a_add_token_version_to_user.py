@@ -0,0 +1,31 @@
+"""Add token_version to User
+
+Revision ID: 5b2f7c1d9e3a
+Revises: 179723f9816d
+Create Date: 2026-10-18 09:12:41.220417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2f7c1d9e3a'
+down_revision: Union[str, Sequence[str], None] = '179723f9816d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column('token_version', sa.Integer(), server_default='0', nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,46 @@
+"""Link reservations to bedrooms and reject overlapping stays
+
+Revision ID: 8c4e1a7f2b6d
+Revises: 5b2f7c1d9e3a
+Create Date: 2026-10-18 10:02:17.514903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e1a7f2b6d'
+down_revision: Union[str, Sequence[str], None] = '5b2f7c1d9e3a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('reservations', sa.Column('bedroom_id', sa.String(), nullable=True))
+    op.create_foreign_key(
+        'reservations_bedroom_id_fkey', 'reservations', 'bedrooms', ['bedroom_id'], ['id']
+    )
+    op.create_index(
+        'ix_reservations_bedroom_id_check_in', 'reservations', ['bedroom_id', 'check_in']
+    )
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute(
+        """
+        ALTER TABLE reservations
+        ADD CONSTRAINT reservations_bedroom_no_overlap
+        EXCLUDE USING gist (bedroom_id WITH =, tsrange(check_in, check_out) WITH &&)
+        WHERE (status <> 'cancelled')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('reservations_bedroom_no_overlap', 'reservations')
+    op.drop_index('ix_reservations_bedroom_id_check_in', table_name='reservations')
+    op.drop_constraint('reservations_bedroom_id_fkey', 'reservations', type_='foreignkey')
+    op.drop_column('reservations', 'bedroom_id')
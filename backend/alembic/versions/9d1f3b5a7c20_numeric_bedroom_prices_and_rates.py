@@ -0,0 +1,89 @@
+"""Store bedroom prices as integer cents and add rate overrides
+
+Revision ID: 9d1f3b5a7c20
+Revises: 8c4e1a7f2b6d
+Create Date: 2026-10-18 11:20:44.108321
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from blog.domain.value_objects.money import Money
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d1f3b5a7c20'
+down_revision: Union[str, Sequence[str], None] = '8c4e1a7f2b6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def price_cents(price: str) -> int:
+    try:
+        return Money.parse(price).cents
+    except ValueError:
+        return 0
+
+
+def backfill_price_cents(connection) -> None:
+    # Mesma regra do Money.parse: "R$ 99" -> 9900, "R$ 1.280,50" -> 128050.
+    # Tirar todo caractere não numérico no SQL faria de "R$ 99" 99 centavos.
+    bedrooms = sa.table(
+        'bedrooms', sa.column('id'), sa.column('price'), sa.column('price_cents')
+    )
+    rows = connection.execute(sa.select(bedrooms.c.id, bedrooms.c.price)).all()
+    if not rows:
+        return
+    connection.execute(
+        bedrooms.update()
+        .where(bedrooms.c.id == sa.bindparam('bedroom_id'))
+        .values(price_cents=sa.bindparam('cents')),
+        [{'bedroom_id': id, 'cents': price_cents(price or '')} for id, price in rows],
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bedrooms', sa.Column('price_cents', sa.Integer(), nullable=True))
+    op.add_column(
+        'bedrooms',
+        sa.Column('currency', sa.String(length=3), server_default='BRL', nullable=False),
+    )
+    backfill_price_cents(op.get_bind())
+    op.alter_column('bedrooms', 'price_cents', nullable=False)
+    op.drop_column('bedrooms', 'price')
+
+    op.create_table('bedroom_rates',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('bedroom_id', sa.String(), nullable=False),
+    sa.Column('price_cents', sa.Integer(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=True),
+    sa.Column('end_date', sa.Date(), nullable=True),
+    sa.Column('weekdays', sa.Integer(), nullable=True),
+    sa.Column('priority', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['bedroom_id'], ['bedrooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_bedroom_rates_bedroom_id'), 'bedroom_rates', ['bedroom_id'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_bedroom_rates_bedroom_id'), table_name='bedroom_rates')
+    op.drop_table('bedroom_rates')
+
+    op.add_column('bedrooms', sa.Column('price', sa.String(), nullable=True))
+    op.execute(
+        """
+        UPDATE bedrooms
+        SET price = 'R$ ' || (price_cents / 100)::text || ','
+            || lpad((price_cents % 100)::text, 2, '0')
+        """
+    )
+    op.alter_column('bedrooms', 'price', nullable=False)
+    op.drop_column('bedrooms', 'currency')
+    op.drop_column('bedrooms', 'price_cents')
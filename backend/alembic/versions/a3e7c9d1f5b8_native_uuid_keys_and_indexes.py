@@ -0,0 +1,80 @@
+"""Native UUID keys, reservation indexes and case-insensitive e-mail
+
+Revision ID: a3e7c9d1f5b8
+Revises: 9d1f3b5a7c20
+Create Date: 2026-10-18 14:02:37.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e7c9d1f5b8'
+down_revision: Union[str, Sequence[str], None] = '9d1f3b5a7c20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (tabela, coluna) que passam de varchar para uuid.
+UUID_COLUMNS = [
+    ('users', 'id'),
+    ('bedrooms', 'id'),
+    ('reservations', 'id'),
+    ('reservations', 'user_id'),
+    ('reservations', 'bedroom_id'),
+    ('bedroom_rates', 'id'),
+    ('bedroom_rates', 'bedroom_id'),
+]
+
+# (nome, tabela, coluna, tabela referenciada)
+FOREIGN_KEYS = [
+    ('reservations_user_id_fkey', 'reservations', 'user_id', 'users'),
+    ('reservations_bedroom_id_fkey', 'reservations', 'bedroom_id', 'bedrooms'),
+    ('bedroom_rates_bedroom_id_fkey', 'bedroom_rates', 'bedroom_id', 'bedrooms'),
+]
+
+
+def _convert_ids(sql_type: str) -> None:
+    # O tipo das FKs precisa mudar junto com o das PKs: as constraints saem
+    # antes e voltam depois. Índices e a exclusion constraint são recriados
+    # pelo próprio ALTER COLUMN ... TYPE.
+    for name, table, _, _ in FOREIGN_KEYS:
+        op.drop_constraint(name, table, type_='foreignkey')
+    for table, column in UUID_COLUMNS:
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {sql_type} USING {column}::{sql_type}'
+        )
+    for name, table, column, referred in FOREIGN_KEYS:
+        op.create_foreign_key(name, table, referred, [column], ['id'])
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _convert_ids('uuid')
+
+    op.create_index(
+        'ix_reservations_user_id_check_in', 'reservations', ['user_id', 'check_in']
+    )
+    op.create_index(
+        'ix_reservations_status_check_out', 'reservations', ['status', 'check_out']
+    )
+
+    # Falha se já houver e-mails que só diferem na caixa: resolva-os antes.
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+    op.create_index(
+        'ix_users_email_lower', 'users', [sa.text('lower(email)')], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_email_lower', table_name='users')
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+
+    op.drop_index('ix_reservations_status_check_out', table_name='reservations')
+    op.drop_index('ix_reservations_user_id_check_in', table_name='reservations')
+
+    _convert_ids('varchar')
@@ -0,0 +1,55 @@
+"""Natural catalog key for bedrooms
+
+Revision ID: b6f4d2e8a1c3
+Revises: a3e7c9d1f5b8
+Create Date: 2026-10-18 15:11:02.384117
+
+"""
+import re
+import unicodedata
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6f4d2e8a1c3'
+down_revision: Union[str, Sequence[str], None] = 'a3e7c9d1f5b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _slugify(text: str) -> str:
+    # Cópia de blog.infra.seeding.bedroom_catalog.slugify, congelada aqui.
+    ascii_text = (
+        unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    )
+    return re.sub(r'[^a-z0-9]+', '-', ascii_text.lower()).strip('-')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bedrooms', sa.Column('code', sa.String(), nullable=True))
+    op.create_unique_constraint('bedrooms_code_key', 'bedrooms', ['code'])
+
+    # Quartos já semeados recebem o código derivado do título, para que o
+    # seed idempotente os reconheça em vez de duplicá-los.
+    bind = op.get_bind()
+    bedrooms = sa.table('bedrooms', sa.column('id'), sa.column('title'), sa.column('code'))
+    seen = set()
+    for bedroom_id, title in bind.execute(
+        sa.select(bedrooms.c.id, bedrooms.c.title).order_by(bedrooms.c.id)
+    ):
+        code = _slugify(title)
+        if code and code not in seen:
+            seen.add(code)
+            bind.execute(
+                bedrooms.update().where(bedrooms.c.id == bedroom_id).values(code=code)
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('bedrooms_code_key', 'bedrooms', type_='unique')
+    op.drop_column('bedrooms', 'code')
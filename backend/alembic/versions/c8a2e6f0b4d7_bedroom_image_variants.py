@@ -0,0 +1,28 @@
+"""Image variants for bedroom photos
+
+Revision ID: c8a2e6f0b4d7
+Revises: b6f4d2e8a1c3
+Create Date: 2026-10-18 19:42:10.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8a2e6f0b4d7'
+down_revision: Union[str, Sequence[str], None] = 'b6f4d2e8a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('bedrooms', sa.Column('image_variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('bedrooms', 'image_variants')
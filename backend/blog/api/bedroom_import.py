@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import csv
+import json
+from pathlib import Path
+from typing import Any, Iterator, TextIO, Tuple, Union
+
+from pydantic import ValidationError
+
+from blog.api.schemas.bedroom_schema import BedroomImportOutput, BedroomImportRow
+from blog.api.settings import settings
+from blog.domain.entities.bedroom import Bedroom
+from blog.domain.value_objects.money import Money
+from blog.infra.seeding.bedroom_catalog import catalog_id, slugify
+from blog.usecases.bedroom.bulk_import_bedrooms import ImportRow
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+
+def iter_records(file: TextIO, fmt: str) -> Iterator[Tuple[int, Union[Any, str]]]:
+    """Lê o arquivo em streaming: (linha, registro) ou (linha, mensagem de erro)."""
+    if fmt == "csv":
+        reader = csv.DictReader(file)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            yield line, json.loads(text)
+        except ValueError:
+            yield line, "Invalid JSON."
+
+
+def _error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'row'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+def to_bedroom(row: BedroomImportRow) -> Bedroom:
+    money = (
+        Money(row.price_cents, row.currency)
+        if row.price_cents is not None
+        else Money.parse(row.price or "", row.currency)
+    )
+    code = row.code or slugify(row.title)
+    return Bedroom(
+        id=catalog_id(code),
+        title=row.title,
+        description=row.description,
+        price=money.format(),
+        image=row.image,
+        price_cents=money.cents,
+        currency=money.currency,
+        code=code,
+    )
+
+
+def validate_rows(file: TextIO, fmt: str) -> Iterator[ImportRow]:
+    for line, record in iter_records(file, fmt):
+        if isinstance(record, str):
+            yield line, record
+            continue
+        try:
+            yield line, to_bedroom(BedroomImportRow.model_validate(record))
+        except ValidationError as e:
+            yield line, _error_message(e)
+        except ValueError as e:
+            yield line, str(e)
+
+
+async def _main(path: str, chunk_size: int) -> None:
+    from blog.infra.database import async_session, engine
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
+        SQLAlchemyBedroomRepository,
+    )
+    from blog.infra.services.process_pool_image_processor import image_processor
+    from blog.usecases.bedroom.bulk_import_bedrooms import BulkImportBedrooms
+
+    fmt = Path(path).suffix.lower().lstrip(".")
+    if fmt == "ndjson":
+        fmt = "jsonl"
+    if fmt not in IMPORT_FORMATS:
+        raise SystemExit(f"Formato não suportado: {path}")
+
+    with open(path, encoding="utf-8-sig", newline="") as file:
+        async with async_session() as session:
+            report = await BulkImportBedrooms(
+                SQLAlchemyBedroomRepository(session), image_processor
+            ).execute(validate_rows(file, fmt), chunk_size)
+    await engine.dispose()
+    image_processor.shutdown()
+    print(BedroomImportOutput.from_entity(report).model_dump_json(indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa quartos de parceiros.")
+    parser.add_argument("path", help="Arquivo .csv ou .jsonl")
+    parser.add_argument(
+        "--chunk-size", type=int, default=settings.BEDROOM_IMPORT_CHUNK_SIZE
+    )
+    args = parser.parse_args()
+    asyncio.run(_main(args.path, args.chunk_size))
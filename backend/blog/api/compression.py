@@ -0,0 +1,146 @@
+import zlib
+from typing import Callable, Optional, Tuple
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Em ordem de preferência do servidor quando o cliente dá o mesmo peso.
+ENCODINGS = ("br", "gzip")
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+Encoder = Tuple[Callable[[bytes], bytes], Callable[[], bytes]]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Escolhe br ou gzip pelo Accept-Encoding, respeitando os pesos (q=)."""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        if name.strip():
+            weights[name.strip()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    return content_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def weak_etag(etag: str) -> str:
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """Comprime com brotli ou gzip as respostas textuais acima de `minimum_size`.
+
+    Respostas em streaming (exportação) são comprimidas pedaço a pedaço. O que
+    já vem com Content-Encoding (estáticos pré-comprimidos) passa intacto.
+
+    O corpo comprimido não é byte a byte o original: o ETag forte vira fraco
+    (W/"..."). Um 304 devolve o ETag na forma que o cliente mandou no
+    If-None-Match, para não trocar o validador que ele guardou.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def encoder(self, encoding: str) -> Encoder:
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=self.brotli_quality)
+            return compressor.process, compressor.finish
+        deflate = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+        return deflate.compress, deflate.flush
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        if_none_match = request_headers.get("if-none-match", "")
+        start: Optional[Message] = None
+        encoder: Optional[Encoder] = None
+        started = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, started
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if not started:
+                started = True
+                headers = MutableHeaders(raw=start["headers"])
+                compressible = is_compressible(headers.get("content-type", ""))
+                if compressible:
+                    headers.add_vary_header("Accept-Encoding")
+                etag = headers.get("etag")
+                if (
+                    start["status"] == 304
+                    and etag is not None
+                    and weak_etag(etag) in if_none_match
+                ):
+                    headers["ETag"] = weak_etag(etag)
+                if (
+                    encoding is not None
+                    and compressible
+                    and start["status"] not in (204, 304)
+                    and "content-encoding" not in headers
+                    and (more_body or len(body) >= self.minimum_size)
+                ):
+                    encoder = self.encoder(encoding)
+                    headers["Content-Encoding"] = encoding
+                    if etag is not None:
+                        headers["ETag"] = weak_etag(etag)
+                    if more_body:
+                        del headers["content-length"]
+                    else:
+                        body = encoder[0](body) + encoder[1]()
+                        headers["Content-Length"] = str(len(body))
+                        await send(start)
+                        await send({**message, "body": body})
+                        return
+                await send(start)
+
+            if encoder is not None:
+                compress, finish = encoder
+                body = compress(body) + (b"" if more_body else finish())
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -16,8 +16,17 @@ from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
 )
 from sqlalchemy.ext.asyncio import AsyncSession
 from blog.infra.database import async_session
+from blog.domain.services.password_hasher import PasswordHasher
+from blog.infra.services.process_pool_password_hasher import password_hasher
+from blog.domain.services.image_processor import ImageProcessor
+from blog.infra.services.process_pool_image_processor import image_processor
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
+from blog.infra.services.bitmap_occupancy_calendar import occupancy_calendar
+from blog.infra.cache.principal_cache import principal_cache, token_version_cache
 from blog.domain.entities.user import User
+from blog.domain.entities.principal import Principal
 from collections.abc import AsyncGenerator
+from typing import Optional
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -25,10 +34,23 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_password_hasher() -> PasswordHasher:
+    return password_hasher
+
+
+def get_occupancy_calendar() -> OccupancyCalendar:
+    return occupancy_calendar
+
+
+def get_image_processor() -> ImageProcessor:
+    return image_processor
+
+
 async def get_user_repository(
     db: AsyncSession = Depends(get_db_session),
+    hasher: PasswordHasher = Depends(get_password_hasher),
 ) -> SQLAlchemyUserRepository:
-    return SQLAlchemyUserRepository(db)
+    return SQLAlchemyUserRepository(db, hasher)
 
 
 async def get_reservation_repository(
@@ -46,31 +68,68 @@ async def get_bedroom_repository(
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/users/login")
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    user_repo: UserRepository = Depends(get_user_repository),
-) -> User:
-    credentials_exception = HTTPException(
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        user_id: str = str(payload.get("sub"))
-        if user_id is None:
-            raise credentials_exception
+    except JWTError:
+        raise credentials_exception()
+    if payload.get("sub") is None:
+        raise credentials_exception()
+    return payload
+
+
+async def load_principal(user_id: str, user_repo: UserRepository) -> Principal:
+    async def load() -> Optional[Principal]:
         user = await user_repo.get_by_id(user_id)
         if user is None:
-            raise credentials_exception
-        await user_repo.set_current_user(user)
-    except JWTError:
-        raise credentials_exception
+            return None
+        return Principal(id=user.id, role=user.role, token_version=user.token_version)
+
+    principal = await principal_cache.get_or_load(user_id, load, scope=user_id)
+    if principal is None:
+        raise credentials_exception()
+    return principal
 
-    user = await user_repo.get_current_user()
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> User:
+    # Perfil completo (GET /users/me): vem do banco, o cache guarda só o Principal.
+    payload = decode_token(token)
+    user = await user_repo.get_by_id(str(payload["sub"]))
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
+    await user_repo.set_current_user(user)
     return user
+
+
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    user_repo: UserRepository = Depends(get_user_repository),
+) -> Principal:
+    payload = decode_token(token)
+    user_id = str(payload["sub"])
+
+    # Tokens sem role/ver (formato antigo) continuam carregando o usuário.
+    if "role" not in payload or "ver" not in payload:
+        return await load_principal(user_id, user_repo)
+
+    version = await token_version_cache.get_or_load(
+        user_id, lambda: user_repo.get_token_version(user_id), scope=user_id
+    )
+    if version is None:
+        raise credentials_exception()
+    if version != payload["ver"]:
+        raise credentials_exception()
+    return Principal(id=user_id, role=payload["role"], token_version=version)
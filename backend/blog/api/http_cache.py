@@ -0,0 +1,31 @@
+from typing import Optional
+
+from fastapi import Request, Response, status
+
+from blog.api.settings import settings
+from blog.infra.cache.bedroom_catalog_cache import CachedBody
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match usa comparação fraca: W/"x" (corpo comprimido) casa com "x".
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def cache_control() -> str:
+    max_age = settings.BEDROOM_CACHE_MAX_AGE_SECONDS
+    return f"public, max-age={max_age}" if max_age > 0 else "public, no-cache"
+
+
+def cached_json_response(request: Request, entry: CachedBody) -> Response:
+    """Devolve os bytes já serializados, ou 304 se o cliente tem a versão atual."""
+    headers = {"ETag": entry.etag, "Cache-Control": cache_control()}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(entry.body, media_type="application/json", headers=headers)
@@ -3,78 +3,106 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import sqlalchemy as sa
-from typing import Union, Sequence
+from typing import Iterable, Union, Sequence
 from datetime import datetime
-import uuid
+import asyncio
+import time
 
 
-from fastapi.staticfiles import StaticFiles
-
 from blog.api.routes import (
     reservation_route,
     user_route,
     bedroom_route,
+    internal_route,
 )
 
 from blog.api.openapi_tags import openapi_tags
+from blog.api.compression import CompressionMiddleware
+from blog.api.static_assets import PrecompressedStaticFiles
 from blog.api.bedrooms_mock import BedroomMock
-from blog.infra.models.bedroom_model import BedroomModel
+from blog.infra.seeding.bedroom_catalog import read_catalog, seed_bedrooms
 from blog.infra.database import async_session, engine
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+from blog.infra.cache.cache import close_cache_backend
+from blog.infra.services.process_pool_password_hasher import password_hasher
+from blog.infra.services.process_pool_image_processor import image_processor
+from blog.infra.services.bitmap_occupancy_calendar import occupancy_calendar
+from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+    SQLAlchemyReservationRepository,
+)
+from blog.usecases.bedroom.rebuild_occupancy_calendar import RebuildOccupancyCalendar
+from blog.api.settings import settings
+
+
+async def load_occupancy_calendar() -> int:
+    async with async_session() as db:
+        return await RebuildOccupancyCalendar(
+            SQLAlchemyReservationRepository(db), occupancy_calendar
+        ).execute(
+            since=datetime(datetime.now().year - 1, 1, 1),
+            chunk_size=settings.RESERVATION_EXPORT_CHUNK_SIZE,
+        )
+
+
+async def refresh_occupancy_calendar(interval_seconds: int) -> None:
+    # Cada worker tem o seu calendário: a recarga traz as escritas dos outros.
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await load_occupancy_calendar()
+        except Exception as e:
+            print(f"Erro ao recarregar o calendário de ocupação: {e}")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Database tables checked/created on startup.")
 
-    async with async_session() as db:
-        try:
-            total_bedrooms_result = await db.execute(
-                sa.select(sa.func.count()).select_from(BedroomModel)
-            )
-            qtd_quartos = total_bedrooms_result.scalar_one()
-
-            if qtd_quartos == 0:
-                print(
-                    "Banco de dados vazio. Populando com dados iniciais de quartos..."
+    if settings.SEED_BEDROOMS:
+        async with async_session() as db:
+            try:
+                started = time.perf_counter()
+                catalog: Iterable[dict] = (
+                    read_catalog(settings.SEED_CATALOG_PATH)
+                    if settings.SEED_CATALOG_PATH
+                    else BedroomMock
                 )
-
-                for bedroom_data in BedroomMock:
-                    bedroom_id = uuid.uuid4()
-
-                    await db.execute(
-                        sa.text(
-                            """
-                            INSERT INTO bedrooms (id, title, description, price, image)
-                            VALUES (:id, :title, :description, :price, :image)
-                            """
-                        ),
-                        {
-                            "id": str(bedroom_id),
-                            "title": bedroom_data["title"],
-                            "description": bedroom_data["description"],
-                            "price": bedroom_data["price"],
-                            "image": bedroom_data["image"],
-                        },
-                    )
-
-                await db.commit()
-                print("Quartos mockados adicionados com sucesso.")
-            else:
+                inserted = await seed_bedrooms(db, catalog, settings.SEED_BATCH_SIZE)
+                elapsed_ms = (time.perf_counter() - started) * 1000
                 print(
-                    f"Banco de dados já contém {qtd_quartos} quartos. Nenhuma população necessária."
+                    f"Catálogo de quartos verificado: {inserted} novos em {elapsed_ms:.0f} ms."
                 )
-
-        except Exception as e:
-            print(f"Erro ao inserir dados iniciais de quartos: {e}")
-            await db.rollback()
-        finally:
-            pass
+            except Exception as e:
+                print(f"Erro ao inserir dados iniciais de quartos: {e}")
+                await db.rollback()
+
+    # O cache do catálogo é por processo: começa vazio a cada subida.
+    await bedroom_catalog_cache.clear()
+
+    try:
+        # O calendário vive em memória: é recriado a cada subida da API.
+        occupied = await load_occupancy_calendar()
+        print(f"Calendário de ocupação carregado com {occupied} reservas.")
+    except Exception as e:
+        print(f"Erro ao carregar o calendário de ocupação: {e}")
+    refresh = (
+        asyncio.create_task(
+            refresh_occupancy_calendar(settings.OCCUPANCY_CALENDAR_REFRESH_SECONDS)
+        )
+        if settings.OCCUPANCY_CALENDAR_REFRESH_SECONDS > 0
+        else None
+    )
 
     yield
 
+    if refresh is not None:
+        refresh.cancel()
+
     await engine.dispose()
     print("Database engine disposed on shutdown.")
+    await close_cache_backend()
+    password_hasher.shutdown()
+    image_processor.shutdown()
 
 
 app = FastAPI(
@@ -90,7 +118,14 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
-app.mount("/static", StaticFiles(directory="blog/api/static"), name="static")
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(
+        directory=settings.STATIC_DIR,
+        immutable_max_age=settings.STATIC_IMMUTABLE_MAX_AGE_SECONDS,
+    ),
+    name="static",
+)
 
 
 origins = ["http://localhost:5173", "https://web-front-omega.vercel.app"]
@@ -103,6 +138,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+)
+
 
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -130,3 +172,4 @@ app.include_router(bedroom_route.router, prefix="/bedrooms", tags=["Bedrooms"])
 app.include_router(
     reservation_route.router, prefix="/reservations", tags=["Reservation"]
 )
+app.include_router(internal_route.router, prefix="/internal", tags=["Internal"])
@@ -11,4 +11,8 @@ openapi_tags = [
         "name": "Bedrooms",
         "description": "Operações de listagem e obtenção de detalhes de quartos.",
     },
+    {
+        "name": "Internal",
+        "description": "Métricas operacionais restritas a administradores.",
+    },
 ]
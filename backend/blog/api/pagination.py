@@ -0,0 +1,20 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(check_in: datetime, reservation_id: str) -> str:
+    raw = f"{check_in.isoformat()}|{reservation_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        check_in, reservation_id = (
+            base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        )
+        return datetime.fromisoformat(check_in), str(uuid.UUID(reservation_id))
+    except ValueError:
+        raise ValueError("Invalid pagination cursor.")
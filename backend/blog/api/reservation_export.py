@@ -0,0 +1,40 @@
+import csv
+import io
+from typing import AsyncIterator, List
+
+from blog.api.responses import dump_json
+from blog.api.schemas.reservation_schema import ReservationOutput
+from blog.domain.entities.reservation import Reservation
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CSV_COLUMNS = list(ReservationOutput.model_fields)
+
+
+async def iter_ndjson(chunks: AsyncIterator[List[Reservation]]) -> AsyncIterator[bytes]:
+    async for chunk in chunks:
+        yield b"".join(dump_json(ReservationOutput.row(r)) + b"\n" for r in chunk)
+
+
+async def iter_csv(chunks: AsyncIterator[List[Reservation]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+    async for chunk in chunks:
+        for reservation in chunk:
+            row = ReservationOutput.row(reservation)
+            writer.writerow([row[column] for column in CSV_COLUMNS])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_reservations(
+    chunks: AsyncIterator[List[Reservation]], export_format: str
+) -> AsyncIterator[bytes]:
+    return iter_csv(chunks) if export_format == "csv" else iter_ndjson(chunks)
@@ -0,0 +1,17 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content)
+
+
+class ORJSONResponse(JSONResponse):
+    """Resposta serializada com orjson a partir de dicts já no formato de saída
+    (`Output.row(...)`). Devolvida direto pela rota, não passa de novo pela
+    validação do response_model, que fica só para a documentação."""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
@@ -1,3 +1,4 @@
 from . import user_route
 from . import reservation_route
 from . import bedroom_route
+from . import internal_route
@@ -1,18 +1,61 @@
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+import io
+from datetime import datetime
+from typing import Literal, Optional
 from blog.usecases.bedroom.get_bedroom_by_id import GetBedroomById
 from blog.usecases.bedroom.list_bedroom import ListBedroom
+from blog.usecases.bedroom.list_available_bedroom import ListAvailableBedroom
+from blog.usecases.bedroom.quote_stays import QuoteStays
+from blog.usecases.bedroom.add_rate_override import AddRateOverride
+from blog.usecases.bedroom.bulk_import_bedrooms import BulkImportBedrooms
+from blog.usecases.bedroom.update_bedroom_image import UpdateBedroomImage
+from blog.api.bedroom_import import validate_rows
+from blog.api.http_cache import cached_json_response
+from blog.api.responses import ORJSONResponse, dump_json
+from blog.infra.cache.bedroom_catalog_cache import (
+    CachedBody,
+    bedroom_catalog_cache,
+)
+from blog.api.settings import settings
 from blog.domain.entities.bedroom import Bedroom
 from sqlalchemy.ext.asyncio import AsyncSession
-from blog.api.deps import get_db_session, get_bedroom_repository, get_current_user
+from blog.api.deps import (
+    get_db_session,
+    get_bedroom_repository,
+    get_current_user,
+    get_current_principal,
+    get_occupancy_calendar,
+    get_image_processor,
+)
 from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
     SQLAlchemyBedroomRepository,
 )
+from blog.api.schemas.id_schema import ResourceId
 from blog.api.schemas.bedroom_schema import (
     BedroomOutput,
+    BedroomCalendarOutput,
+    BedroomImportOutput,
     MessageBedroomResponse,
+    QuoteInput,
+    QuoteResponse,
+    RateOverrideInput,
+    RateOverrideOutput,
+    StayQuoteOutput,
 )
 from blog.domain.repositories.bedroom_repository import BedroomRepository
 from blog.domain.entities.user import User
+from blog.domain.entities.principal import Principal
+from blog.domain.entities.rate_override import RateOverride
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
+from blog.domain.services.image_processor import ImageProcessor
 
 
 router = APIRouter()
@@ -24,25 +67,186 @@ router = APIRouter()
     summary="Listar todos os quartos",
 )
 async def list_all_bedrooms_endpoint(
+    request: Request,
+    bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+):
+    async def render() -> CachedBody:
+        bedrooms = await ListBedroom(bedroom_repo).execute()
+        return CachedBody(
+            dump_json(
+                MessageBedroomResponse.content(
+                    message="Bedrooms retrieved successfully",
+                    bedrooms=[BedroomOutput.row(b) for b in bedrooms],
+                )
+            )
+        )
+
+    entry = await bedroom_catalog_cache.get_or_load("list", render)
+    assert entry is not None
+    return cached_json_response(request, entry)
+
+
+@router.get(
+    "/available",
+    response_model=MessageBedroomResponse,
+    summary="Listar quartos livres no período",
+)
+async def list_available_bedrooms_endpoint(
+    check_in: datetime = Query(..., description="Data de check-in (ISO 8601)"),
+    check_out: datetime = Query(..., description="Data de check-out (ISO 8601)"),
     bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
 ):
-    bedrooms = await ListBedroom(bedroom_repo).execute()
-    return MessageBedroomResponse(
-        message="Bedrooms retrieved successfully",
-        bedrooms=[BedroomOutput.from_entity(b) for b in bedrooms],
+    try:
+        bedrooms = await ListAvailableBedroom(bedroom_repo).execute(check_in, check_out)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse(
+        MessageBedroomResponse.content(
+            message="Available bedrooms retrieved successfully",
+            bedrooms=[BedroomOutput.row(b) for b in bedrooms],
+        )
     )
 
 
+@router.post(
+    "/quote",
+    response_model=QuoteResponse,
+    summary="Orçar uma ou várias estadias",
+)
+async def quote_stays_endpoint(
+    data: QuoteInput,
+    bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+):
+    try:
+        quotes = await QuoteStays(bedroom_repo, settings.QUOTE_MAX_WINDOW_DAYS).execute(
+            [(stay.bedroom_id, stay.check_in, stay.check_out) for stay in data.stays]
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({"quotes": [StayQuoteOutput.row(q) for q in quotes]})
+
+
+@router.post(
+    "/import",
+    response_model=BedroomImportOutput,
+    summary="Importar catálogo de quartos de parceiros (CSV/JSONL)",
+)
+async def import_bedrooms_endpoint(
+    file: UploadFile,
+    import_format: Literal["csv", "jsonl"] = Query(
+        "csv", alias="format", description="Formato do arquivo enviado"
+    ),
+    current_user: Principal = Depends(get_current_principal),
+    bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+    image_processor: ImageProcessor = Depends(get_image_processor),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can import bedrooms")
+    # O upload fica num arquivo temporário e é lido linha a linha, em lotes.
+    text = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        report = await BulkImportBedrooms(bedroom_repo, image_processor).execute(
+            validate_rows(text, import_format),
+            chunk_size=settings.BEDROOM_IMPORT_CHUNK_SIZE,
+            max_errors=settings.BEDROOM_IMPORT_MAX_ERRORS,
+        )
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 encoded.")
+    finally:
+        text.detach()
+    return BedroomImportOutput.from_entity(report)
+
+
 @router.get(
     "/{bedroom_id}",  # Caminho ajustado para ser relativo ao prefixo /bedrooms
     response_model=BedroomOutput,
     summary="Obter detalhes de um quarto por ID",
 )
 async def get_bedroom_by_id_endpoint(
-    bedroom_id: str,
+    request: Request,
+    bedroom_id: ResourceId,
+    bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+):
+    async def render() -> Optional[CachedBody]:
+        bedroom = await GetBedroomById(bedroom_repo).execute(bedroom_id)
+        if not bedroom:
+            return None
+        return CachedBody(dump_json(BedroomOutput.row(bedroom)))
+
+    entry = await bedroom_catalog_cache.get_or_load(
+        f"detail:{bedroom_id.lower()}", render
+    )
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Bedroom not found")
+    return cached_json_response(request, entry)
+
+
+@router.get(
+    "/{bedroom_id}/calendar",
+    response_model=BedroomCalendarOutput,
+    summary="Calendário de ocupação do quarto no mês",
+)
+async def get_bedroom_calendar_endpoint(
+    bedroom_id: ResourceId,
+    year: int = Query(..., ge=1, le=9999, description="Ano (ex: 2025)"),
+    month: int = Query(..., ge=1, le=12, description="Mês (1-12)"),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
+):
+    # Servido direto do bitmap em memória, sem consulta ao banco.
+    return BedroomCalendarOutput(
+        bedroom_id=bedroom_id,
+        year=year,
+        month=month,
+        occupied=calendar.month(bedroom_id, year, month),
+    )
+
+
+@router.post(
+    "/{bedroom_id}/rates",
+    response_model=RateOverrideOutput,
+    status_code=status.HTTP_201_CREATED,
+    summary="Cadastrar diária especial (temporada, fim de semana)",
+)
+async def add_rate_override_endpoint(
+    bedroom_id: ResourceId,
+    data: RateOverrideInput,
+    current_user: Principal = Depends(get_current_principal),
+    bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can manage rates")
+    try:
+        override = await AddRateOverride(bedroom_repo).execute(
+            RateOverride(id=None, bedroom_id=bedroom_id, **data.model_dump())
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return RateOverrideOutput.from_entity(override)
+
+
+@router.put(
+    "/{bedroom_id}/image",
+    response_model=BedroomOutput,
+    summary="Enviar a foto do quarto (gera miniaturas em AVIF/WebP)",
+)
+async def update_bedroom_image_endpoint(
+    bedroom_id: ResourceId,
+    file: UploadFile,
+    current_user: Principal = Depends(get_current_principal),
     bedroom_repo: BedroomRepository = Depends(get_bedroom_repository),
+    image_processor: ImageProcessor = Depends(get_image_processor),
 ):
-    bedroom = await GetBedroomById(bedroom_repo).execute(bedroom_id)
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can upload images")
+    data = await file.read(settings.IMAGE_UPLOAD_MAX_BYTES + 1)
+    if len(data) > settings.IMAGE_UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail="Image is too large.")
+    try:
+        bedroom = await UpdateBedroomImage(bedroom_repo, image_processor).execute(
+            bedroom_id, data
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not bedroom:
         raise HTTPException(status_code=404, detail="Bedroom not found")
-    return BedroomOutput.from_entity(bedroom)
+    return ORJSONResponse(BedroomOutput.row(bedroom))
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, HTTPException, Depends
+from blog.api.deps import (
+    get_current_principal,
+    get_occupancy_calendar,
+    get_reservation_repository,
+)
+from blog.api.settings import settings
+from blog.domain.entities.principal import Principal
+from blog.infra.cache.principal_cache import principal_cache, token_version_cache
+from blog.infra.cache.reservation_cache import reservation_list_cache
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+from blog.infra.database import pool_status
+from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
+from blog.usecases.bedroom.rebuild_occupancy_calendar import RebuildOccupancyCalendar
+
+router = APIRouter()
+
+
+def require_admin(
+    current_user: Principal = Depends(get_current_principal),
+) -> Principal:
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=403, detail="Only admins can view internal metrics"
+        )
+    return current_user
+
+
+@router.get(
+    "/principal-cache",
+    summary="Métricas do cache de usuários autenticados",
+)
+async def principal_cache_metrics_endpoint(admin: Principal = Depends(require_admin)):
+    return await principal_cache.stats()
+
+
+@router.get(
+    "/bedroom-cache",
+    summary="Métricas do cache do catálogo de quartos",
+)
+async def bedroom_cache_metrics_endpoint(admin: Principal = Depends(require_admin)):
+    return await bedroom_catalog_cache.stats()
+
+
+@router.get(
+    "/cache",
+    summary="Métricas de todos os caches (hits, misses, evictions, single-flight)",
+)
+async def cache_metrics_endpoint(admin: Principal = Depends(require_admin)):
+    return {
+        cache.namespace: await cache.stats()
+        for cache in (
+            principal_cache,
+            token_version_cache,
+            bedroom_catalog_cache,
+            reservation_list_cache,
+        )
+    }
+
+
+@router.get(
+    "/pool",
+    summary="Estado do pool de conexões com o banco",
+)
+async def pool_metrics_endpoint(admin: Principal = Depends(require_admin)):
+    return pool_status()
+
+
+@router.post(
+    "/occupancy-calendar/rebuild",
+    summary="Recriar o calendário de ocupação a partir do banco",
+)
+async def rebuild_occupancy_calendar_endpoint(
+    admin: Principal = Depends(require_admin),
+    reservation_repo: ReservationRepository = Depends(get_reservation_repository),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
+):
+    occupied = await RebuildOccupancyCalendar(reservation_repo, calendar).execute(
+        chunk_size=settings.RESERVATION_EXPORT_CHUNK_SIZE
+    )
+    return {"reservations": occupied}
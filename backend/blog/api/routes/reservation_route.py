@@ -1,17 +1,26 @@
-from fastapi import APIRouter, HTTPException, Depends, status, Response
+from fastapi import APIRouter, HTTPException, Depends, Query, status, Response
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import Literal, Optional
 from blog.usecases.reservation.create_reservation import CreateReservation
 from blog.usecases.reservation.get_user_reservation_by_id import GetUserReservationById
 from blog.usecases.reservation.cancel_reservation import CancelReservation
 from blog.usecases.reservation.update_reservation import UpdateReservation
 from blog.usecases.reservation.delete_reservation import DeleteReservation
-from blog.usecases.reservation.list_reservation import ListReservation
+from blog.usecases.reservation.list_reservation_page import ListReservationPage
+from blog.api.pagination import encode_cursor, decode_cursor
+from blog.api.reservation_export import EXPORT_MEDIA_TYPES, export_reservations
+from blog.api.responses import ORJSONResponse, dump_json
+from blog.api.settings import settings
+from blog.infra.cache.reservation_cache import reservation_list_cache
 from blog.domain.entities.reservation import Reservation
 from sqlalchemy.ext.asyncio import AsyncSession
 from blog.api.deps import (
     get_db_session,
     get_reservation_repository,
     get_user_repository,
-    get_current_user,
+    get_current_principal,
+    get_occupancy_calendar,
 )
 from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
     SQLAlchemyReservationRepository,
@@ -19,20 +28,31 @@ from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import
 from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
+from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
+    SQLAlchemyBedroomRepository,
+)
+from blog.api.schemas.id_schema import UUID_PATTERN, CanonicalUuid, ResourceId
 from blog.api.schemas.reservation_schema import (
     ReservationCreateInput,
     ReservationUpdateInput,
     ReservationOutput,
     MessageReservationResponse,
 )
-from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.repositories.reservation_repository import (
+    ReservationRepository,
+    ReservationPermissionError,
+    ReservationConflictError,
+)
 from blog.domain.repositories.user_repository import UserRepository
-from blog.domain.entities.user import User
+from blog.domain.entities.principal import Principal
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
 import sys
 import traceback
 
 router = APIRouter()
 
+BEDROOM_UNAVAILABLE = "Bedroom is not available for the selected dates"
+
 
 @router.post(
     "/",
@@ -41,63 +61,181 @@ router = APIRouter()
 )
 async def create_reservation_endpoint(
     data: ReservationCreateInput,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db_session),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
 ):
     try:
         reservation_repo = SQLAlchemyReservationRepository(db)
         user_repo = SQLAlchemyUserRepository(db)
-        usecase = CreateReservation(reservation_repo, user_repo)
+        bedroom_repo = SQLAlchemyBedroomRepository(db)
+        usecase = CreateReservation(reservation_repo, user_repo, bedroom_repo, calendar)
         reservation = await usecase.execute(
             user_id=current_user.id,
             title=data.title,
             address=data.address,
             check_in_str=data.check_in,
             check_out_str=data.check_out,
+            bedroom_id=data.bedroom_id,
         )
-        return Response(
-            content=MessageReservationResponse(
+        return ORJSONResponse(
+            MessageReservationResponse.content(
                 message="Reservation created successfully",
-                reservation=ReservationOutput.from_entity(reservation),
-            ).model_dump_json(),
+                reservation=ReservationOutput.row(reservation),
+            ),
             status_code=status.HTTP_201_CREATED,
-            media_type="application/json",
         )
+    except ReservationConflictError:
+        raise HTTPException(status_code=409, detail=BEDROOM_UNAVAILABLE)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+class ReservationPageParams:
+    def __init__(
+        self,
+        limit: int = Query(
+            settings.RESERVATION_PAGE_SIZE,
+            ge=1,
+            le=settings.RESERVATION_PAGE_SIZE_MAX,
+            description="Quantidade máxima de reservas na página",
+        ),
+        cursor: Optional[str] = Query(
+            None, description="Cursor retornado em next_cursor pela página anterior"
+        ),
+        status_filter: Optional[str] = Query(
+            None, alias="status", description="Filtra pelo status da reserva"
+        ),
+        check_in_from: Optional[datetime] = Query(
+            None, description="Check-in a partir desta data (ISO 8601)"
+        ),
+        check_in_to: Optional[datetime] = Query(
+            None, description="Check-in antes desta data (ISO 8601)"
+        ),
+    ):
+        self.limit = limit
+        self.cursor = cursor
+        self.status = status_filter
+        self.check_in_from = check_in_from
+        self.check_in_to = check_in_to
+
+    def cache_key(self) -> str:
+        return "|".join(
+            str(value)
+            for value in (
+                self.limit,
+                self.cursor,
+                self.status,
+                self.check_in_from,
+                self.check_in_to,
+            )
+        )
+
+
+async def list_reservation_page(
+    reservation_repo: ReservationRepository,
+    params: ReservationPageParams,
+    message: str,
+    user_id: Optional[str] = None,
+) -> dict:
+    try:
+        after = decode_cursor(params.cursor) if params.cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    reservations, next_key = await ListReservationPage(reservation_repo).execute(
+        limit=params.limit,
+        user_id=user_id,
+        status=params.status,
+        check_in_from=params.check_in_from,
+        check_in_to=params.check_in_to,
+        after=after,
+    )
+    return MessageReservationResponse.content(
+        message=message,
+        reservations=[ReservationOutput.row(r) for r in reservations],
+        next_cursor=encode_cursor(*next_key) if next_key else None,
+    )
+
+
 @router.get(
     "/me",
     response_model=MessageReservationResponse,
     summary="Listar reservas do usuário atual",
 )
 async def list_my_reservations_endpoint(
-    current_user: User = Depends(get_current_user),
+    params: ReservationPageParams = Depends(),
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
 ):
-    try:
-        reservations = await reservation_repo.get_reservations_by_user_id(
-            current_user.id
-        )
-        return MessageReservationResponse(
+    async def render() -> bytes:
+        page = await list_reservation_page(
+            reservation_repo,
+            params,
             message="User reservations retrieved successfully",
-            reservations=[ReservationOutput.from_entity(r) for r in reservations],
+            user_id=current_user.id,
+        )
+        return dump_json(page)
+
+    try:
+        body = await reservation_list_cache.get_or_load(
+            f"{current_user.id}:{params.cache_key()}", render, scope=current_user.id
         )
+        assert body is not None
+        return Response(body, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get(
+    "/export",
+    summary="Exportar reservas (NDJSON ou CSV)",
+    response_class=StreamingResponse,
+)
+async def export_reservations_endpoint(
+    export_format: Literal["ndjson", "csv"] = Query(
+        "ndjson", alias="format", description="Formato do arquivo exportado"
+    ),
+    check_in_from: Optional[datetime] = Query(
+        None, description="Check-in a partir desta data (ISO 8601)"
+    ),
+    check_in_to: Optional[datetime] = Query(
+        None, description="Check-in antes desta data (ISO 8601)"
+    ),
+    current_user: Principal = Depends(get_current_principal),
+    reservation_repo: ReservationRepository = Depends(get_reservation_repository),
+):
+    if current_user.role != "admin":
+        raise HTTPException(
+            status_code=403, detail="Only admins can export reservations"
+        )
+
+    chunks = reservation_repo.stream_reservations(
+        settings.RESERVATION_EXPORT_CHUNK_SIZE,
+        check_in_from=check_in_from,
+        check_in_to=check_in_to,
+    )
+    return StreamingResponse(
+        export_reservations(chunks, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="reservations.{export_format}"'
+        },
+    )
+
+
 @router.get(
     "/{reservation_id}",
     response_model=ReservationOutput,
     summary="Obter detalhes da reserva",
 )
 async def get_reservation_by_id_endpoint(
-    reservation_id: str,
-    current_user: User = Depends(get_current_user),
+    reservation_id: ResourceId,
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
 ):
     reservation = await GetUserReservationById(reservation_repo).execute(reservation_id)
@@ -117,7 +255,13 @@ async def get_reservation_by_id_endpoint(
     summary="Listar todas as reservas",
 )
 async def list_all_reservations_endpoint(
-    current_user: User = Depends(get_current_user),
+    params: ReservationPageParams = Depends(),
+    user_id: Optional[CanonicalUuid] = Query(
+        None,
+        pattern=UUID_PATTERN,
+        description="Filtra pelas reservas deste usuário",
+    ),
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
 ):
     if current_user.role != "admin":
@@ -125,11 +269,13 @@ async def list_all_reservations_endpoint(
             status_code=403, detail="Only admins can list all reservations"
         )
 
-    reservations = await ListReservation(reservation_repo).execute()
-    return MessageReservationResponse(
+    page = await list_reservation_page(
+        reservation_repo,
+        params,
         message="All reservations retrieved successfully",
-        reservations=[ReservationOutput.from_entity(r) for r in reservations],
+        user_id=user_id,
     )
+    return ORJSONResponse(page)
 
 
 @router.put(
@@ -138,13 +284,16 @@ async def list_all_reservations_endpoint(
     summary="Atualizar reserva",
 )
 async def update_reservation_endpoint(
-    reservation_id: str,
+    reservation_id: ResourceId,
     data: ReservationUpdateInput,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
 ):
     try:
-        updated_reservation = await UpdateReservation(reservation_repo).execute(
+        updated_reservation = await UpdateReservation(
+            reservation_repo, calendar
+        ).execute(
             reservation_id=reservation_id,
             new_title=data.title,
             new_address=data.address,
@@ -156,10 +305,14 @@ async def update_reservation_endpoint(
             raise HTTPException(
                 status_code=404, detail="Reservation not found or could not be updated"
             )
-        return MessageReservationResponse(
-            message="Reservation updated successfully",
-            reservation=ReservationOutput.from_entity(updated_reservation),
+        return ORJSONResponse(
+            MessageReservationResponse.content(
+                message="Reservation updated successfully",
+                reservation=ReservationOutput.row(updated_reservation),
+            )
         )
+    except ReservationConflictError:
+        raise HTTPException(status_code=409, detail=BEDROOM_UNAVAILABLE)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -173,34 +326,31 @@ async def update_reservation_endpoint(
     summary="Cancelar reserva",
 )
 async def cancel_reservation_endpoint(
-    reservation_id: str,
-    current_user: User = Depends(get_current_user),
+    reservation_id: ResourceId,
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
 ):
-    reservation = await GetUserReservationById(reservation_repo).execute(reservation_id)
-    if not reservation:
-        raise HTTPException(status_code=404, detail="Reservation not found")
-
-    if current_user.role != "admin" and reservation.user_id != current_user.id:
+    owner_id = None if current_user.role == "admin" else current_user.id
+    try:
+        canceled_reservation = await CancelReservation(
+            reservation_repo, calendar
+        ).execute(reservation_id, owner_id)
+    except ReservationPermissionError:
         raise HTTPException(
             status_code=403, detail="Not authorized to cancel this reservation"
         )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-    try:
-        canceled_reservation = await CancelReservation(reservation_repo).execute(
-            reservation_id
-        )
-        if not canceled_reservation:
-            raise HTTPException(
-                status_code=404,
-                detail="Reservation not found or could not be cancelled",
-            )
-        return MessageReservationResponse(
+    if not canceled_reservation:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    return ORJSONResponse(
+        MessageReservationResponse.content(
             message="Reservation cancelled successfully",
-            reservation=ReservationOutput.from_entity(canceled_reservation),
+            reservation=ReservationOutput.row(canceled_reservation),
         )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    )
 
 
 @router.delete(
@@ -210,22 +360,21 @@ async def cancel_reservation_endpoint(
     status_code=status.HTTP_200_OK,
 )
 async def delete_reservation_endpoint(
-    reservation_id: str,
-    current_user: User = Depends(get_current_user),
+    reservation_id: ResourceId,
+    current_user: Principal = Depends(get_current_principal),
     reservation_repo: ReservationRepository = Depends(get_reservation_repository),
+    calendar: OccupancyCalendar = Depends(get_occupancy_calendar),
 ):
-    reservation = await GetUserReservationById(reservation_repo).execute(reservation_id)
-    if not reservation:
-        raise HTTPException(status_code=404, detail="Reservation not found")
-
-    if current_user.role != "admin" and reservation.user_id != current_user.id:
+    owner_id = None if current_user.role == "admin" else current_user.id
+    try:
+        deleted = await DeleteReservation(reservation_repo, calendar).execute(
+            reservation_id, owner_id
+        )
+    except ReservationPermissionError:
         raise HTTPException(
             status_code=403, detail="Not authorized to delete this reservation"
         )
 
-    deleted = await DeleteReservation(reservation_repo).execute(reservation_id)
     if not deleted:
-        raise HTTPException(
-            status_code=404, detail="Reservation not found or could not be deleted"
-        )
+        raise HTTPException(status_code=404, detail="Reservation not found")
     return MessageReservationResponse(message="Reservation deleted successfully")
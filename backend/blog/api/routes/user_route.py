@@ -3,23 +3,36 @@ from blog.usecases.user.register_user import RegisterUserUseCase
 from blog.usecases.user.login_user import LoginUserUseCase
 from blog.usecases.user.logout_user import LogoutUserUseCase
 from blog.usecases.user.get_current_user import GetCurrentUserUseCase
+from blog.usecases.user.bulk_register_users import BulkRegisterUsers
 from blog.domain.entities.user import User
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password, PasswordValidationError
 import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from blog.api.deps import get_db_session, get_user_repository, get_current_user
+from blog.api.deps import (
+    get_db_session,
+    get_user_repository,
+    get_current_user,
+    get_current_principal,
+    get_password_hasher,
+)
+from blog.api.settings import settings
+from blog.domain.entities.principal import Principal
+from blog.domain.services.password_hasher import PasswordHasher
 from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
     SQLAlchemyUserRepository,
 )
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from blog.api.schemas.user_schema import (
+    BulkRegisterError,
+    BulkRegisterInput,
+    BulkRegisterOutput,
     RegisterUserInput,
     UserOutput,
     MessageUserResponse,
 )
 from blog.api.schemas.token_schema import TokenResponse
-from blog.api.security import create_access_token
+from blog.api.security import create_access_token, build_token_claims
 from blog.domain.repositories.user_repository import UserRepository
 from blog.api.schemas.user_schema import LoginUserInput
 from blog.api.security import verify_token
@@ -36,11 +49,13 @@ router = APIRouter()
     description="Cria um novo usuário com nome, email e senha forte.",
 )
 async def register_user(
-    data: RegisterUserInput, db: AsyncSession = Depends(get_db_session)
+    data: RegisterUserInput,
+    db: AsyncSession = Depends(get_db_session),
+    hasher: PasswordHasher = Depends(get_password_hasher),
 ):
     try:
-        user_repo = SQLAlchemyUserRepository(db)
-        usecase = RegisterUserUseCase(user_repo)
+        user_repo = SQLAlchemyUserRepository(db, hasher)
+        usecase = RegisterUserUseCase(user_repo, hasher)
         # As linhas 50-52 estão corretas devido à alteração na entidade User
         user = User(
             id=str(uuid.uuid4()),
@@ -62,6 +77,62 @@ async def register_user(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/bulk-register",
+    response_model=BulkRegisterOutput,
+    summary="Registrar usuários em massa (migração de sistemas legados)",
+    description=(
+        "Aceita senhas em texto (hasheadas em paralelo no pool de processos) "
+        "ou hashes bcrypt legados. E-mails já cadastrados são ignorados."
+    ),
+)
+async def bulk_register_users(
+    data: BulkRegisterInput,
+    current_user: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db_session),
+    hasher: PasswordHasher = Depends(get_password_hasher),
+):
+    if current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can import users")
+
+    users = []
+    errors = []
+    for index, item in enumerate(data.users):
+        try:
+            password = (
+                Password.from_hash(item.password_hash)
+                if item.password_hash is not None
+                else Password(item.password or "")
+            )
+            users.append(
+                User(
+                    id=str(uuid.uuid4()),
+                    name=item.name,
+                    email=Email(item.email),
+                    password=password,
+                    role=item.role,
+                    phone=item.phone,
+                    document=item.document,
+                    address=item.address,
+                )
+            )
+        except (PasswordValidationError, ValueError) as e:
+            # Uma linha inválida não derruba o lote: volta no relatório.
+            errors.append(BulkRegisterError(index=index, message=str(e)))
+
+    report = await BulkRegisterUsers(
+        SQLAlchemyUserRepository(db, hasher), hasher
+    ).execute(users, settings.USER_IMPORT_BATCH_SIZE)
+    return BulkRegisterOutput(
+        received=len(data.users),
+        registered=report.registered,
+        duplicates=report.duplicates,
+        errors=errors,
+        elapsed_ms=round(report.elapsed_seconds * 1000, 1),
+        users_per_second=round(report.users_per_second, 1),
+    )
+
+
 @router.post(
     "/login",
     response_model=TokenResponse,
@@ -74,13 +145,13 @@ async def login_user(
 ):
     try:
         usecase = LoginUserUseCase(user_repo)
-        user = await usecase.execute(Email(data.email), Password(data.password))
+        user = await usecase.execute(
+            Email(data.email), Password.for_login(data.password)
+        )
         if not user:
             raise HTTPException(status_code=401, detail="Invalid credentials")
-        token = create_access_token(data={"sub": user.id})
+        token = create_access_token(data=build_token_claims(user))
         return TokenResponse(access_token=token, token_type="bearer")
-    except PasswordValidationError as p:
-        raise HTTPException(status_code=400, detail=str(p))
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
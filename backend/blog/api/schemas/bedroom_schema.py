@@ -1,5 +1,29 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Dict, Optional, List
+from datetime import date
+
+from blog.api.schemas.id_schema import UUID_PATTERN, CanonicalUuid
+from blog.api.static_assets import asset_url
+from blog.api.settings import settings
+from blog.domain.entities.bedroom import ImageVariants
+
+
+def srcset(variants: Optional[ImageVariants]) -> Optional[Dict[str, str]]:
+    if not variants:
+        return None
+    return {
+        mime_type: ", ".join(
+            f"{urls[width]} {width}w" for width in sorted(urls, key=int)
+        )
+        for mime_type, urls in variants.items()
+    }
+
+
+def thumbnail(variants: Optional[ImageVariants]) -> Optional[str]:
+    if not variants:
+        return None
+    urls = variants.get("image/webp") or next(iter(variants.values()))
+    return urls[min(urls, key=int)]
 
 
 class BedroomOutput(BaseModel):
@@ -11,22 +35,195 @@ class BedroomOutput(BaseModel):
         ..., min_length=10, description="Descrição detalhada do quarto"
     )
     price: str = Field(..., description="Preço do quarto por noite (ex: 'R$ 150.00')")
+    price_cents: int = Field(..., description="Diária em centavos (ex: 15000)")
+    currency: str = Field(..., description="Moeda da diária (ISO 4217, ex: 'BRL')")
     image: str = Field(
         ..., description="URL ou nome do arquivo da imagem principal do quarto"
     )
+    code: Optional[str] = Field(None, description="Código do quarto no catálogo")
+    thumbnail: Optional[str] = Field(
+        None, description="Menor variante WebP da imagem, para as listagens"
+    )
+    srcset: Optional[Dict[str, str]] = Field(
+        None,
+        description="srcset por tipo de imagem (ex: image/avif: 'url 320w, url 640w')",
+    )
+
+    @staticmethod
+    def row(entity) -> dict:
+        return {
+            "id": entity.id,
+            "title": entity.title,
+            "description": entity.description,
+            "price": entity.price,
+            "price_cents": entity.price_cents,
+            "currency": entity.currency,
+            "image": asset_url(entity.image),
+            "code": entity.code,
+            "thumbnail": thumbnail(entity.image_variants),
+            "srcset": srcset(entity.image_variants),
+        }
 
     @classmethod
     def from_entity(cls, entity):
-        return cls(
-            id=entity.id,
-            title=entity.title,
-            description=entity.description,
-            price=entity.price,
-            image=entity.image,
-        )
+        return cls(**cls.row(entity))
 
 
 class MessageBedroomResponse(BaseModel):
     message: str
     bedroom: Optional[BedroomOutput] = None
     bedrooms: Optional[List[BedroomOutput]] = None
+
+    @staticmethod
+    def content(
+        message: str,
+        bedroom: Optional[dict] = None,
+        bedrooms: Optional[List[dict]] = None,
+    ) -> dict:
+        return {"message": message, "bedroom": bedroom, "bedrooms": bedrooms}
+
+
+class BedroomCalendarOutput(BaseModel):
+    bedroom_id: str = Field(..., description="ID do quarto")
+    year: int = Field(..., description="Ano do calendário")
+    month: int = Field(..., description="Mês do calendário (1-12)")
+    occupied: List[bool] = Field(
+        ..., description="Uma posição por dia do mês; true quando a noite está ocupada"
+    )
+
+
+class RateOverrideInput(BaseModel):
+    price_cents: int = Field(..., ge=0, description="Diária especial em centavos")
+    start_date: Optional[date] = Field(
+        None, description="Primeira noite em que a diária vale (ISO 8601)"
+    )
+    end_date: Optional[date] = Field(
+        None, description="Noite seguinte à última em que a diária vale (ISO 8601)"
+    )
+    weekdays: Optional[List[int]] = Field(
+        None,
+        description="Dias da semana em que a diária vale (0 = segunda, 6 = domingo)",
+    )
+    priority: int = Field(0, description="Regras de maior prioridade prevalecem")
+
+
+class RateOverrideOutput(RateOverrideInput):
+    id: str = Field(..., description="ID da regra de diária")
+    bedroom_id: str = Field(..., description="ID do quarto")
+
+    @classmethod
+    def from_entity(cls, entity):
+        return cls(
+            id=entity.id,
+            bedroom_id=entity.bedroom_id,
+            price_cents=entity.price_cents,
+            start_date=entity.start_date,
+            end_date=entity.end_date,
+            weekdays=sorted(entity.weekdays) if entity.weekdays is not None else None,
+            priority=entity.priority,
+        )
+
+
+class StayQuoteInput(BaseModel):
+    bedroom_id: CanonicalUuid = Field(
+        ..., pattern=UUID_PATTERN, description="ID do quarto"
+    )
+    check_in: date = Field(..., description="Data de check-in (ISO 8601)")
+    check_out: date = Field(..., description="Data de check-out (ISO 8601)")
+
+    @model_validator(mode="after")
+    def limit_nights(self):
+        if (self.check_out - self.check_in).days > settings.QUOTE_MAX_NIGHTS:
+            raise ValueError(
+                f"A stay can have at most {settings.QUOTE_MAX_NIGHTS} nights"
+            )
+        return self
+
+
+class QuoteInput(BaseModel):
+    stays: List[StayQuoteInput] = Field(
+        ..., min_length=1, max_length=settings.QUOTE_MAX_STAYS
+    )
+
+
+class StayQuoteOutput(StayQuoteInput):
+    nights: int = Field(..., description="Quantidade de noites")
+    total_cents: int = Field(..., description="Total da estadia em centavos")
+    currency: str = Field(..., description="Moeda do total")
+
+    @staticmethod
+    def row(entity) -> dict:
+        return {
+            "bedroom_id": entity.bedroom_id,
+            "check_in": entity.check_in,
+            "check_out": entity.check_out,
+            "nights": entity.nights,
+            "total_cents": entity.total_cents,
+            "currency": entity.currency,
+        }
+
+    @classmethod
+    def from_entity(cls, entity):
+        return cls(**cls.row(entity))
+
+
+class QuoteResponse(BaseModel):
+    quotes: List[StayQuoteOutput]
+
+
+class BedroomImportRow(BaseModel):
+    """Linha de catálogo importada: mesmas regras de BedroomOutput."""
+
+    code: Optional[str] = Field(
+        None, max_length=100, description="Código do quarto; padrão: título normalizado"
+    )
+    title: str = Field(..., min_length=3, max_length=100)
+    description: str = Field(..., min_length=10)
+    price: Optional[str] = Field(None, description="Diária para exibição")
+    price_cents: Optional[int] = Field(None, ge=0, description="Diária em centavos")
+    currency: str = Field("BRL", pattern=r"^[A-Z]{3}$")
+    image: str = Field(..., min_length=1)
+
+    @field_validator("code", "price", "price_cents", "currency", mode="before")
+    @classmethod
+    def empty_as_missing(cls, value, info):
+        # Células vazias do CSV chegam como "".
+        if value == "":
+            return cls.model_fields[info.field_name].default
+        return value
+
+    @model_validator(mode="after")
+    def require_price(self):
+        if self.price_cents is None and self.price is None:
+            raise ValueError("price or price_cents is required")
+        return self
+
+
+class BedroomImportErrorOutput(BaseModel):
+    line: int = Field(..., description="Linha do arquivo (cabeçalho do CSV = 1)")
+    message: str
+
+
+class BedroomImportOutput(BaseModel):
+    rows: int = Field(..., description="Linhas lidas do arquivo")
+    imported: int = Field(..., description="Quartos inseridos ou atualizados")
+    failed: int = Field(..., description="Linhas recusadas")
+    elapsed_ms: float
+    rows_per_second: float
+    errors: List[BedroomImportErrorOutput] = Field(
+        ..., description="Primeiros erros por linha (limitados)"
+    )
+
+    @classmethod
+    def from_entity(cls, entity):
+        return cls(
+            rows=entity.rows,
+            imported=entity.imported,
+            failed=entity.failed,
+            elapsed_ms=round(entity.elapsed_seconds * 1000, 1),
+            rows_per_second=round(entity.rows_per_second, 1),
+            errors=[
+                BedroomImportErrorOutput(line=line, message=message)
+                for line, message in entity.errors
+            ],
+        )
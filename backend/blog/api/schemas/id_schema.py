@@ -0,0 +1,21 @@
+import uuid
+from typing import Annotated
+from fastapi import Path
+from pydantic import AfterValidator
+
+# As chaves primárias são UUID nativos no Postgres: um id malformado chegaria
+# ao banco como erro de conversão (500); aqui ele é recusado na validação.
+UUID_PATTERN = (
+    r"^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$"
+)
+
+
+def canonical_uuid(value: str) -> str:
+    # O Postgres aceita maiúsculas e ids sem hífens, mas caches, o calendário e
+    # o tarifador comparam o texto: todos recebem a forma que o banco devolve.
+    return str(uuid.UUID(value))
+
+
+CanonicalUuid = Annotated[str, AfterValidator(canonical_uuid)]
+
+ResourceId = Annotated[CanonicalUuid, Path(pattern=UUID_PATTERN)]
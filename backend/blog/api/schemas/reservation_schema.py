@@ -1,6 +1,8 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Literal
 from datetime import datetime
+from functools import lru_cache
+from blog.api.schemas.id_schema import UUID_PATTERN, CanonicalUuid
 
 
 class ReservationCreateInput(BaseModel):
@@ -23,6 +25,9 @@ class ReservationCreateInput(BaseModel):
         pattern=r"^\d{2}/\d{2}/\d{4} às \d{2}h\d{2}$",
         description="Data e hora de check-out (ex: 30/12/2024 às 11h00)",
     )
+    bedroom_id: Optional[CanonicalUuid] = Field(
+        None, pattern=UUID_PATTERN, description="ID do quarto reservado"
+    )
 
 
 type ReservationStatusBackendInput = Literal["confirmed", "cancelled", "completed"]
@@ -52,6 +57,17 @@ class ReservationUpdateInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=4096)
+def format_datetime(value) -> str:
+    # Equivalente a strftime("%d/%m/%Y às %Hh%M"), sem depender do locale.
+    if not isinstance(value, datetime):
+        return value
+    return (
+        f"{value.day:02d}/{value.month:02d}/{value.year} "
+        f"às {value.hour:02d}h{value.minute:02d}"
+    )
+
+
 class ReservationOutput(BaseModel):
     id: str = Field(..., description="ID da reserva")
     user_id: str = Field(..., description="ID do usuário que fez a reserva")
@@ -60,29 +76,45 @@ class ReservationOutput(BaseModel):
     check_in: str = Field(..., description="Data e hora de check-in")
     check_out: str = Field(..., description="Data e hora de check-out")
     status: str = Field(..., description="Status atual da reserva")
+    bedroom_id: Optional[str] = Field(None, description="ID do quarto reservado")
+
+    @staticmethod
+    def row(entity) -> dict:
+        """Saída pronta para JSON, sem instanciar (e validar) o modelo."""
+        return {
+            "id": entity.id,
+            "user_id": entity.user_id,
+            "title": entity.title,
+            "address": entity.address,
+            "check_in": format_datetime(entity.check_in),
+            "check_out": format_datetime(entity.check_out),
+            "status": entity.status,
+            "bedroom_id": entity.bedroom_id,
+        }
 
     @classmethod
     def from_entity(cls, entity):
-        return cls(
-            id=entity.id,
-            user_id=entity.user_id,
-            title=entity.title,
-            address=entity.address,
-            check_in=(
-                entity.check_in.strftime("%d/%m/%Y às %Hh%M")
-                if isinstance(entity.check_in, datetime)
-                else entity.check_in
-            ),
-            check_out=(
-                entity.check_out.strftime("%d/%m/%Y às %Hh%M")
-                if isinstance(entity.check_out, datetime)
-                else entity.check_out
-            ),
-            status=entity.status,
-        )
+        return cls(**cls.row(entity))
 
 
 class MessageReservationResponse(BaseModel):
     message: str
     reservation: Optional[ReservationOutput] = None
     reservations: Optional[List[ReservationOutput]] = None
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor opaco da próxima página (ausente na última)"
+    )
+
+    @staticmethod
+    def content(
+        message: str,
+        reservation: Optional[dict] = None,
+        reservations: Optional[List[dict]] = None,
+        next_cursor: Optional[str] = None,
+    ) -> dict:
+        return {
+            "message": message,
+            "reservation": reservation,
+            "reservations": reservations,
+            "next_cursor": next_cursor,
+        }
@@ -1,5 +1,10 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Literal, Optional
+from pydantic import BaseModel, EmailStr, Field, model_validator
+from typing import List, Literal, Optional
+
+from blog.api.settings import settings
+
+# Hashes bcrypt de sistemas legados ($2a$, $2b$, $2y$), aceitos como estão.
+BCRYPT_HASH_PATTERN = r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$"
 
 
 class RegisterUserInput(BaseModel):
@@ -46,3 +51,55 @@ class UserOutput(BaseModel):
 class MessageUserResponse(BaseModel):
     message: str
     user: Optional[UserOutput] = None
+
+
+class BulkUserInput(BaseModel):
+    name: str = Field(..., min_length=3, max_length=50, description="Nome do usuário")
+    email: EmailStr = Field(..., description="Email do usuário")
+    password: Optional[str] = Field(
+        None, min_length=8, description="Senha em texto (será hasheada)"
+    )
+    password_hash: Optional[str] = Field(
+        None, pattern=BCRYPT_HASH_PATTERN, description="Hash bcrypt legado"
+    )
+    role: Literal["user", "admin"] = "user"
+    phone: Optional[str] = Field(None, description="Número de telefone do usuário")
+    document: Optional[str] = Field(None, description="Número de documento do usuário")
+    address: Optional[str] = Field(None, description="Endereço completo do usuário")
+
+    @model_validator(mode="after")
+    def exactly_one_password(self):
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("Provide either password or password_hash")
+        return self
+
+
+class BulkRegisterInput(BaseModel):
+    users: List[BulkUserInput] = Field(
+        ..., min_length=1, max_length=settings.USER_IMPORT_MAX_USERS
+    )
+
+    @model_validator(mode="after")
+    def limit_plain_passwords(self):
+        plain = sum(1 for user in self.users if user.password is not None)
+        if plain > settings.USER_IMPORT_MAX_PLAIN_PASSWORDS:
+            raise ValueError(
+                "At most "
+                f"{settings.USER_IMPORT_MAX_PLAIN_PASSWORDS} users per request "
+                "can send a plain password; send password_hash instead"
+            )
+        return self
+
+
+class BulkRegisterError(BaseModel):
+    index: int = Field(..., description="Posição do usuário na lista enviada")
+    message: str
+
+
+class BulkRegisterOutput(BaseModel):
+    received: int
+    registered: int
+    duplicates: List[str] = Field(..., description="E-mails já cadastrados")
+    errors: List[BulkRegisterError]
+    elapsed_ms: float
+    users_per_second: float
@@ -15,6 +15,10 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+def get_password_hashes(passwords):
+    return [pwd_context.hash(password) for password in passwords]
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
     expire = datetime.now() + (expires_delta or timedelta(minutes=15))
@@ -22,6 +26,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def build_token_claims(user) -> dict:
+    claims = {"sub": user.id}
+    if settings.JWT_CLAIMS_MODE:
+        claims.update({"role": user.role, "ver": user.token_version})
+    return claims
+
+
 def verify_token(token: str) -> Optional[dict]:
     try:
         payload = jwt.decode(
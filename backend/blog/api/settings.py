@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import ClassVar
+from typing import ClassVar, List
 
 
 class Settings(BaseSettings):
@@ -16,6 +16,14 @@ class Settings(BaseSettings):
     DATABASE_URL_ALEMBIC: str  # psycopg2 para Alembic
     DATABASE_URL_TEST: str
 
+    # Pool de conexões do engine assíncrono
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+
     # PGADMIN_DEFAULT_EMAIL: str
     # PGADMIN_DEFAULT_PASSWORD: str
     # PGADMIN_PORT: int
@@ -24,6 +32,83 @@ class Settings(BaseSettings):
     ALGORITHM: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int
 
+    # Processos dedicados ao bcrypt (0 = executor padrão de threads)
+    PASSWORD_HASH_WORKERS: int = 2
+    # Pool separado para o cadastro em massa, para não atrasar os logins
+    PASSWORD_BULK_HASH_WORKERS: int = 1
+
+    # Backend dos caches: vazio = LRU em memória por processo; com uma URL
+    # redis://[:senha@]host:6379/0 os workers compartilham Redis/Valkey.
+    CACHE_URL: str = ""
+    CACHE_POOL_SIZE: int = 10
+    CACHE_TIMEOUT_SECONDS: float = 0.25
+
+    # Cache de usuários autenticados (get_current_principal)
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+
+    # Tokens com role e versão do usuário nas claims (dispensa carregar o usuário)
+    JWT_CLAIMS_MODE: bool = False
+
+    # Cache das respostas do catálogo de quartos (GET /bedrooms)
+    BEDROOM_CACHE_ENABLED: bool = True
+    BEDROOM_CACHE_TTL_SECONDS: int = 30
+    BEDROOM_CACHE_MAX_SIZE: int = 1000
+    # max-age do Cache-Control (0 = o cliente sempre revalida com If-None-Match)
+    BEDROOM_CACHE_MAX_AGE_SECONDS: int = 0
+
+    # Cache das páginas de GET /reservations/me, por usuário
+    RESERVATION_CACHE_TTL_SECONDS: int = 30
+    RESERVATION_CACHE_MAX_SIZE: int = 10_000
+
+    # Compressão das respostas (brotli/gzip) a partir deste tamanho em bytes
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Arquivos estáticos; `make static` gera os nomes com hash e os .br/.gz
+    STATIC_DIR: str = "blog/api/static"
+    STATIC_IMMUTABLE_MAX_AGE_SECONDS: int = 31_536_000
+
+    # Fotos dos quartos: variantes geradas no upload/importação, em processos
+    # dedicados (0 = executor padrão de threads)
+    IMAGE_WORKERS: int = 2
+    IMAGE_VARIANT_WIDTHS: List[int] = [320, 640, 1280]
+    IMAGE_VARIANT_FORMATS: List[str] = ["avif", "webp"]
+    IMAGE_VARIANT_QUALITY: int = 70
+    IMAGE_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+
+    # Paginação das listagens de reservas
+    RESERVATION_PAGE_SIZE: int = 50
+    RESERVATION_PAGE_SIZE_MAX: int = 200
+    RESERVATION_EXPORT_CHUNK_SIZE: int = 1000
+
+    # O calendário de ocupação é por processo: com vários workers, cada um só
+    # vê as escritas dos outros na recarga. A recarga periódica relê toda a
+    # janela em cada worker, por isso é opcional (0 = só na subida)
+    OCCUPANCY_CALENDAR_REFRESH_SECONDS: int = 0
+
+    # Orçamento de estadias: máximo de estadias por requisição
+    QUOTE_MAX_STAYS: int = 10_000
+    # Noites por estadia e dias entre o primeiro check-in e o último check-out
+    QUOTE_MAX_NIGHTS: int = 365
+    QUOTE_MAX_WINDOW_DAYS: int = 730
+
+    # Catálogo de quartos semeado na subida (vazio = catálogo embutido)
+    SEED_BEDROOMS: bool = True
+    SEED_CATALOG_PATH: str = ""
+    SEED_BATCH_SIZE: int = 1000
+
+    # Importação de catálogos de parceiros (POST /bedrooms/import)
+    BEDROOM_IMPORT_CHUNK_SIZE: int = 5000
+    BEDROOM_IMPORT_MAX_ERRORS: int = 1000
+
+    # Cadastro de usuários em massa (POST /auth/bulk-register)
+    USER_IMPORT_MAX_USERS: int = 10_000
+    # Senhas em texto custam um bcrypt cada: bem menos que hashes prontos
+    USER_IMPORT_MAX_PLAIN_PASSWORDS: int = 500
+    USER_IMPORT_BATCH_SIZE: int = 1000
+
     # env_file = ".env"
     # extra = "forbid"
     # model_config = {
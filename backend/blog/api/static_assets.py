@@ -0,0 +1,183 @@
+import argparse
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+import brotli
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from blog.api.compression import negotiate_encoding
+from blog.api.settings import settings
+
+STATIC_PREFIX = "/static/"
+MANIFEST_NAME = "manifest.json"
+
+# nome.<12 hex>.ext, exatamente como hashed_name() grava: o hash fica sempre
+# logo antes da última extensão. Nomes que só são hexadecimais não contam.
+BUILD_NAME = re.compile(r"(?P<stem>.+)\.(?P<digest>[0-9a-f]{12})(?P<suffix>\.[^.]+)?")
+
+PRECOMPRESSED_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+# O mesmo nome com os irmãos .br/.gz, como servido pelo StaticFiles.
+SERVED_BUILD_NAME = re.compile(BUILD_NAME.pattern + r"(?:\.br|\.gz)?")
+
+# derived/ab/<sha256>.ext das variantes de imagens (image_derivatives).
+DERIVED_NAME = re.compile(r"derived/(?:sources/)?([0-9a-f]{2})/\1[0-9a-f]{62}\.\w+")
+
+# Formatos já comprimidos: os irmãos .br/.gz não compensam.
+ALREADY_COMPRESSED = {
+    ".avif",
+    ".br",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".webp",
+    ".woff2",
+    ".zip",
+}
+
+# O irmão só é gravado se ficar abaixo desta fração do original.
+MAX_COMPRESSED_RATIO = 0.9
+
+
+def hashed_name(path: Path, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()[:12]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def _matches_content(path: Path) -> bool:
+    match = BUILD_NAME.fullmatch(path.name)
+    if match is None or not path.is_file():
+        return False
+    original = path.with_name(match["stem"] + (match["suffix"] or ""))
+    return hashed_name(original, path.read_bytes()) == path.name
+
+
+def is_build_output(path: Path) -> bool:
+    """Arquivo gravado pelo build: o hash do nome confere com o conteúdo (ou,
+    nos irmãos .br/.gz, com o do original ao lado)."""
+    if _matches_content(path):
+        return True
+    return path.suffix in (".br", ".gz") and _matches_content(path.with_name(path.stem))
+
+
+def is_immutable(path: str) -> bool:
+    """Nomes com o hash do conteúdo no formato que o build ou as variantes de
+    imagens gravam; o conteúdo de um nome desses nunca muda."""
+    path = path.replace(os.sep, "/")
+    return bool(
+        DERIVED_NAME.fullmatch(path)
+        or SERVED_BUILD_NAME.fullmatch(posixpath.basename(path))
+    )
+
+
+def precompress(path: Path, data: bytes) -> None:
+    if path.suffix.lower() in ALREADY_COMPRESSED:
+        return
+    for suffix, compressed in (
+        (".br", brotli.compress(data, quality=11)),
+        (".gz", gzip.compress(data, compresslevel=9, mtime=0)),
+    ):
+        if len(compressed) < len(data) * MAX_COMPRESSED_RATIO:
+            path.with_name(path.name + suffix).write_bytes(compressed)
+
+
+def build_static_assets(directory: str) -> Dict[str, str]:
+    """Copia cada arquivo para nome.<hash>.ext, grava os irmãos .br/.gz e o
+    manifest (nome original -> nome com hash). Rodar de novo é seguro: arquivos
+    gerados são ignorados e versões antigas ficam para clientes em cache."""
+    root = Path(directory)
+    manifest = {}
+    for path in sorted(root.rglob("*")):
+        if (
+            not path.is_file()
+            or path.name == MANIFEST_NAME
+            or DERIVED_NAME.fullmatch(path.relative_to(root).as_posix())
+            or is_build_output(path)
+        ):
+            continue
+        data = path.read_bytes()
+        target = path.with_name(hashed_name(path, data))
+        if not target.exists():
+            target.write_bytes(data)
+            precompress(target, data)
+        manifest[path.relative_to(root).as_posix()] = target.relative_to(
+            root
+        ).as_posix()
+    (root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    load_manifest.cache_clear()
+    return manifest
+
+
+@lru_cache(maxsize=8)
+def load_manifest(directory: str) -> Dict[str, str]:
+    try:
+        return json.loads((Path(directory) / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(url: str) -> str:
+    """/static/images/q.png -> /static/images/q.<hash>.png depois do build."""
+    if not url.startswith(STATIC_PREFIX):
+        return url
+    hashed = load_manifest(settings.STATIC_DIR).get(url[len(STATIC_PREFIX) :])
+    return STATIC_PREFIX + hashed if hashed else url
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles que serve o irmão .br/.gz quando o cliente aceita e marca
+    como imutáveis os arquivos com hash no nome."""
+
+    def __init__(self, *, directory: str, immutable_max_age: int):
+        super().__init__(directory=directory)
+        self.immutable_max_age = immutable_max_age
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        response = None
+        if encoding is not None:
+            suffix = PRECOMPRESSED_SUFFIXES[encoding]
+            full_path, stat_result = self.lookup_path(path + suffix)
+            if stat_result is not None and os.path.isfile(full_path):
+                response = self.file_response(full_path, stat_result, scope)
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Content-Type"] = (
+                    mimetypes.guess_type(path)[0] or "text/plain"
+                )
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        if response.status_code in (200, 304):
+            if any(
+                self.lookup_path(path + suffix)[1] is not None
+                for suffix in PRECOMPRESSED_SUFFIXES.values()
+            ):
+                response.headers.add_vary_header("Accept-Encoding")
+            if is_immutable(path):
+                response.headers["Cache-Control"] = (
+                    f"public, max-age={self.immutable_max_age}, immutable"
+                )
+        return response
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Gera nomes com hash e versões .br/.gz dos arquivos estáticos."
+    )
+    parser.add_argument("directory", nargs="?", default=settings.STATIC_DIR)
+    args = parser.parse_args()
+    built = build_static_assets(args.directory)
+    print(f"{len(built)} arquivos estáticos processados em {args.directory}.")
@@ -1,7 +1,74 @@
+from typing import Dict, Optional
+
+from blog.domain.value_objects.money import Money
+
+# Tipo MIME -> largura em px -> URL da variante da imagem.
+type ImageVariants = Dict[str, Dict[str, str]]
+
+
 class Bedroom:
-    def __init__(self, id: str, title: str, description: str, price: str, image: str):
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "price",
+        "image",
+        "price_cents",
+        "currency",
+        "code",
+        "image_variants",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        title: str,
+        description: str,
+        price: str,
+        image: str,
+        price_cents: Optional[int] = None,
+        currency: str = "BRL",
+        code: Optional[str] = None,
+        image_variants: Optional[ImageVariants] = None,
+    ):
         self.id = id
         self.title = title
         self.description = description
         self.price = price
         self.image = image
+        # Valor numérico da diária; `price` fica só como texto de exibição.
+        money = (
+            Money(price_cents, currency)
+            if price_cents is not None
+            else Money.parse(price, currency)
+        )
+        self.price_cents = money.cents
+        self.currency = money.currency
+        # Chave natural do quarto nos catálogos importados.
+        self.code = code
+        self.image_variants = image_variants
+
+    @classmethod
+    def hydrate(
+        cls,
+        id: str,
+        title: str,
+        description: str,
+        price_cents: int,
+        currency: str,
+        image: str,
+        code: Optional[str] = None,
+        image_variants: Optional[ImageVariants] = None,
+    ) -> "Bedroom":
+        # Caminho rápido para linhas já persistidas (valores já validados).
+        bedroom = cls.__new__(cls)
+        bedroom.id = id
+        bedroom.title = title
+        bedroom.description = description
+        bedroom.price = Money(price_cents, currency).format()
+        bedroom.image = image
+        bedroom.price_cents = price_cents
+        bedroom.currency = currency
+        bedroom.code = code
+        bedroom.image_variants = image_variants
+        return bedroom
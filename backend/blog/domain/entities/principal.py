@@ -0,0 +1,7 @@
+class Principal:
+    __slots__ = ("id", "role", "token_version")
+
+    def __init__(self, id: str, role: str, token_version: int = 0):
+        self.id = id
+        self.role = role
+        self.token_version = token_version
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import FrozenSet, Iterable, Optional
+
+
+class RateOverride:
+    """Diária especial de um quarto (temporada, fins de semana...).
+
+    ``start_date``/``end_date`` delimitam as noites [início, fim) e ``weekdays``
+    restringe a regra a dias da semana (0 = segunda). Quando várias regras
+    valem para a mesma noite, vence a de maior ``priority`` (no empate, o maior ``id``).
+    """
+
+    def __init__(
+        self,
+        id: Optional[str],
+        bedroom_id: str,
+        price_cents: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        weekdays: Optional[Iterable[int]] = None,
+        priority: int = 0,
+    ):
+        if price_cents < 0:
+            raise ValueError("Price must not be negative.")
+        if start_date and end_date and end_date <= start_date:
+            raise ValueError("Rate end date must be after its start date.")
+        self.id = id
+        self.bedroom_id = bedroom_id
+        self.price_cents = price_cents
+        self.start_date = start_date
+        self.end_date = end_date
+        self.weekdays: Optional[FrozenSet[int]] = (
+            frozenset(weekdays) if weekdays is not None else None
+        )
+        if self.weekdays is not None and not self.weekdays <= set(range(7)):
+            raise ValueError("Weekdays must be between 0 (Monday) and 6 (Sunday).")
+        self.priority = priority
+
+    def applies_to(self, day: date) -> bool:
+        if self.start_date is not None and day < self.start_date:
+            return False
+        if self.end_date is not None and day >= self.end_date:
+            return False
+        return self.weekdays is None or day.weekday() in self.weekdays
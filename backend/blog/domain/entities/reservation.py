@@ -1,16 +1,77 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
+
+DATETIME_FORMAT = "%d/%m/%Y às %Hh%M"
+
+
+def parse_datetime(value: Union[str, datetime]) -> datetime:
+    """Aceita o formato da API ("25/12/2024 às 14h00") ou um datetime pronto."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.strptime(value, DATETIME_FORMAT)
 
 
 class Reservation:
-    def __init__(self, id, user_id, title, address, check_in, check_out, status):
+    # Sem __dict__ por instância: listagens grandes alocam bem menos memória.
+    __slots__ = (
+        "id",
+        "user_id",
+        "title",
+        "address",
+        "check_in",
+        "check_out",
+        "status",
+        "bedroom_id",
+    )
+
+    def __init__(
+        self,
+        id,
+        user_id,
+        title,
+        address,
+        check_in,
+        check_out,
+        status,
+        bedroom_id: Optional[str] = None,
+    ):
         self.id = id
         self.user_id = user_id
         self.title = title
         self.address = address
-        self.check_in = datetime.strptime(check_in, "%d/%m/%Y às %Hh%M")
-        self.check_out = datetime.strptime(check_out, "%d/%m/%Y às %Hh%M")
+        self.check_in = parse_datetime(check_in)
+        self.check_out = parse_datetime(check_out)
         self.status = status
+        self.bedroom_id = bedroom_id
+
+    @classmethod
+    def hydrate(
+        cls,
+        id: str,
+        user_id: str,
+        title: str,
+        address: str,
+        check_in: datetime,
+        check_out: datetime,
+        status: str,
+        bedroom_id: Optional[str] = None,
+    ) -> "Reservation":
+        # Caminho rápido para linhas já persistidas: datas nativas, sem parsing.
+        reservation = cls.__new__(cls)
+        reservation.id = id
+        reservation.user_id = user_id
+        reservation.title = title
+        reservation.address = address
+        reservation.check_in = check_in
+        reservation.check_out = check_out
+        reservation.status = status
+        reservation.bedroom_id = bedroom_id
+        return reservation
+
+    @property
+    def blocks_bedroom(self) -> bool:
+        # Só reservas ativas e ligadas a um quarto ocupam a agenda.
+        return self.bedroom_id is not None and self.status != "cancelled"
 
     def cancel_reservation(self):
         if self.status != "cancelled":
@@ -20,8 +81,8 @@ class Reservation:
         self,
         new_title: Optional[str] = None,
         new_address: Optional[str] = None,
-        new_check_in_str: Optional[str] = None,
-        new_check_out_str: Optional[str] = None,
+        new_check_in_str: Optional[Union[str, datetime]] = None,
+        new_check_out_str: Optional[Union[str, datetime]] = None,
         new_status: Optional[str] = None,
     ):
         if new_title is not None:
@@ -29,8 +90,8 @@ class Reservation:
         if new_address is not None:
             self.address = new_address
         if new_check_in_str is not None:
-            self.check_in = datetime.strptime(new_check_in_str, "%d/%m/%Y às %Hh%M")
+            self.check_in = parse_datetime(new_check_in_str)
         if new_check_out_str is not None:
-            self.check_out = datetime.strptime(new_check_out_str, "%d/%m/%Y às %Hh%M")
+            self.check_out = parse_datetime(new_check_out_str)
         if new_status is not None:
             self.status = new_status
@@ -4,6 +4,18 @@ from blog.domain.value_objects.password import Password
 
 
 class User:
+    __slots__ = (
+        "id",
+        "name",
+        "email",
+        "password",
+        "role",
+        "phone",
+        "document",
+        "address",
+        "token_version",
+    )
+
     def __init__(
         self,
         id: str,
@@ -14,6 +26,7 @@ class User:
         phone: Optional[str],
         document: Optional[str],
         address: Optional[str],
+        token_version: int = 0,
     ):
         if role not in ["admin", "user"]:
             raise ValueError("Role must be 'admin' or 'user'.")
@@ -26,3 +39,4 @@ class User:
         self.phone = phone
         self.document = document
         self.address = address
+        self.token_version = token_version
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
+from datetime import date, datetime
 from typing import List, Optional
-from blog.domain.entities.bedroom import Bedroom
+from blog.domain.entities.bedroom import Bedroom, ImageVariants
+from blog.domain.entities.rate_override import RateOverride
+
+
+class BedroomImportError(Exception):
+    """O banco recusou um lote da importação de quartos."""
 
 
 class BedroomRepository(ABC):
@@ -8,6 +14,17 @@ class BedroomRepository(ABC):
     async def create_bedroom(self, bedroom: Bedroom) -> Bedroom:
         pass
 
+    @abstractmethod
+    async def bulk_import_bedrooms(self, bedrooms: List[Bedroom]) -> int:
+        """Insere ou atualiza (pelo `code`) um lote de quartos já validados."""
+        pass
+
+    @abstractmethod
+    async def update_bedroom_image(
+        self, bedroom_id: str, image: str, image_variants: ImageVariants
+    ) -> Optional[Bedroom]:
+        pass
+
     @abstractmethod
     async def get_bedroom_by_id(self, bedroom_id: str) -> Optional[Bedroom]:
         pass
@@ -15,3 +32,23 @@ class BedroomRepository(ABC):
     @abstractmethod
     async def get_all_bedrooms(self) -> List[Bedroom]:
         pass
+
+    @abstractmethod
+    async def get_available_bedrooms(
+        self, check_in: datetime, check_out: datetime
+    ) -> List[Bedroom]:
+        pass
+
+    @abstractmethod
+    async def get_bedrooms_by_ids(self, bedroom_ids: List[str]) -> List[Bedroom]:
+        pass
+
+    @abstractmethod
+    async def add_rate_override(self, override: RateOverride) -> RateOverride:
+        pass
+
+    @abstractmethod
+    async def get_rate_overrides(
+        self, bedroom_ids: List[str], start: date, end: date
+    ) -> List[RateOverride]:
+        pass
@@ -1,13 +1,32 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Tuple
 from blog.domain.entities.reservation import Reservation
 
 
+class ReservationPermissionError(Exception):
+    pass
+
+
+class ReservationConflictError(Exception):
+    """O quarto já está ocupado em parte do período pedido."""
+
+
 class ReservationRepository(ABC):
     @abstractmethod
     async def create_reservation(self, reservation: Reservation) -> Reservation:
         pass
 
+    @abstractmethod
+    async def is_bedroom_available(
+        self,
+        bedroom_id: str,
+        check_in: datetime,
+        check_out: datetime,
+        ignore_id: Optional[str] = None,
+    ) -> bool:
+        pass
+
     @abstractmethod
     async def get_reservation_by_id(self, reservation_id: str) -> Optional[Reservation]:
         pass
@@ -18,14 +37,54 @@ class ReservationRepository(ABC):
 
     @abstractmethod
     async def update_reservation(
-        self, reservation: Reservation
+        self,
+        reservation_id: str,
+        title: Optional[str] = None,
+        address: Optional[str] = None,
+        check_in: Optional[datetime] = None,
+        check_out: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> Optional[Tuple[Reservation, Reservation]]:
+        """Grava só os campos informados e devolve (anterior, atualizada).
+
+        None se a reserva não existe; ValueError se o check-out não ficar
+        depois do check-in; ReservationConflictError se o quarto estiver ocupado.
+        """
+
+    @abstractmethod
+    async def cancel_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
     ) -> Optional[Reservation]:
         pass
 
     @abstractmethod
-    async def delete_reservation(self, reservation_id: str) -> bool:
+    async def delete_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
+    ) -> Optional[Reservation]:
         pass
 
     @abstractmethod
     async def get_all_reservations(self) -> List[Reservation]:
         pass
+
+    @abstractmethod
+    async def list_reservations_page(
+        self,
+        limit: int,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+    ) -> List[Reservation]:
+        pass
+
+    @abstractmethod
+    def stream_reservations(
+        self,
+        chunk_size: int,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        check_out_after: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Reservation]]:
+        pass
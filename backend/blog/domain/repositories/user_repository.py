@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from blog.domain.entities.user import User
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password
-from typing import Optional
+from typing import List, Optional, Set
 
 
 class UserRepository(ABC):
@@ -12,6 +12,14 @@ class UserRepository(ABC):
     @abstractmethod
     async def register(self, user: User) -> User: ...
 
+    @abstractmethod
+    async def register_many(self, users: List[User]) -> List[str]:
+        """Insere um lote; devolve os e-mails (minúsculos) efetivamente criados."""
+
+    @abstractmethod
+    async def get_existing_emails(self, emails: List[Email]) -> Set[str]:
+        """E-mails do lote que já existem, em minúsculas, numa única consulta."""
+
     @abstractmethod
     async def logout(self) -> None: ...
 
@@ -26,3 +34,12 @@ class UserRepository(ABC):
 
     @abstractmethod
     async def get_by_id(self, id: str) -> Optional[User]: ...
+
+    @abstractmethod
+    async def get_token_version(self, id: str) -> Optional[int]: ...
+
+    @abstractmethod
+    async def update_credentials(
+        self, id: str, password: Optional[Password] = None, role: Optional[str] = None
+    ) -> Optional[User]:
+        """Troca senha e/ou papel e avança token_version (revoga os tokens)."""
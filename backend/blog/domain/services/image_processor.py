@@ -0,0 +1,25 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from blog.domain.entities.bedroom import ImageVariants
+
+
+class ImageProcessor(ABC):
+    @abstractmethod
+    async def store(self, data: bytes) -> Tuple[str, ImageVariants]:
+        """Guarda a imagem enviada e gera as variantes: (URL do original, variantes).
+
+        Levanta ValueError se os bytes não forem uma imagem válida.
+        """
+
+    @abstractmethod
+    async def derive(self, image: str) -> Optional[ImageVariants]:
+        """Variantes de uma imagem já publicada; None se ela não é um arquivo local."""
+
+    async def derive_many(
+        self, images: List[str]
+    ) -> Dict[str, Optional[ImageVariants]]:
+        unique = list(dict.fromkeys(images))
+        variants = await asyncio.gather(*(self.derive(image) for image in unique))
+        return dict(zip(unique, variants))
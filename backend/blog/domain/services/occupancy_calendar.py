@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List
+
+from blog.domain.entities.reservation import Reservation
+
+
+class OccupancyCalendar(ABC):
+    @abstractmethod
+    def occupy(self, reservation: Reservation) -> None: ...
+
+    @abstractmethod
+    def release(self, reservation: Reservation) -> None: ...
+
+    @abstractmethod
+    def month(self, bedroom_id: str, year: int, month: int) -> List[bool]: ...
+
+    @abstractmethod
+    async def rebuild(self, chunks: AsyncIterator[List[Reservation]]) -> int: ...
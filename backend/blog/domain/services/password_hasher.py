@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class PasswordHasher(ABC):
+    @abstractmethod
+    async def hash(self, plain_password: str) -> str: ...
+
+    @abstractmethod
+    async def verify(self, plain_password: str, hashed_password: str) -> bool: ...
+
+    async def hash_many(self, plain_passwords: List[str]) -> List[str]:
+        return [await self.hash(password) for password in plain_passwords]
@@ -0,0 +1,106 @@
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate
+from typing import Dict, Iterable, List, Tuple
+
+from blog.domain.entities.bedroom import Bedroom
+from blog.domain.entities.rate_override import RateOverride
+
+type Stay = Tuple[str, date, date]
+
+
+class StayQuote:
+    def __init__(
+        self,
+        bedroom_id: str,
+        check_in: date,
+        check_out: date,
+        nights: int,
+        total_cents: int,
+        currency: str,
+    ):
+        self.bedroom_id = bedroom_id
+        self.check_in = check_in
+        self.check_out = check_out
+        self.nights = nights
+        self.total_cents = total_cents
+        self.currency = currency
+
+
+class StayPricer:
+    """Precifica um lote de estadias de uma só vez.
+
+    Para cada quarto monta-se, uma única vez, a diária de cada noite da janela
+    coberta pelo lote (regras aplicadas por fatias) e a soma acumulada dessas
+    diárias. O total de qualquer estadia vira então uma subtração de dois
+    elementos, independente do número de noites ou de estadias no lote.
+    """
+
+    def __init__(self, bedrooms: Iterable[Bedroom], overrides: Iterable[RateOverride]):
+        self._bedrooms = {bedroom.id: bedroom for bedroom in bedrooms}
+        self._overrides: Dict[str, List[RateOverride]] = {}
+        for override in overrides:
+            self._overrides.setdefault(override.bedroom_id, []).append(override)
+
+    def _prefix_sums(self, bedroom: Bedroom, start: date, end: date) -> array:
+        days = (end - start).days
+        nightly = [bedroom.price_cents] * days
+        # Empate de prioridade: o ID desempata, sem depender da ordem das linhas.
+        overrides = sorted(
+            self._overrides.get(bedroom.id, []),
+            key=lambda o: (o.priority, o.id or ""),
+        )
+        for override in overrides:
+            lo = (
+                max((override.start_date - start).days, 0) if override.start_date else 0
+            )
+            hi = (
+                min((override.end_date - start).days, days)
+                if override.end_date
+                else days
+            )
+            if lo >= hi:
+                continue
+            if override.weekdays is None:
+                nightly[lo:hi] = [override.price_cents] * (hi - lo)
+                continue
+            for weekday in override.weekdays:
+                first = lo + (weekday - (start + timedelta(days=lo)).weekday()) % 7
+                count = len(range(first, hi, 7))
+                nightly[first:hi:7] = [override.price_cents] * count
+        return array("q", accumulate(nightly, initial=0))
+
+    def quote(self, stays: List[Stay]) -> List[StayQuote]:
+        windows: Dict[str, Tuple[date, date]] = {}
+        for bedroom_id, check_in, check_out in stays:
+            if bedroom_id not in self._bedrooms:
+                raise ValueError(f"Bedroom not found: {bedroom_id}")
+            if check_out <= check_in:
+                raise ValueError("Check-out must be after check-in.")
+            lo, hi = windows.get(bedroom_id, (check_in, check_out))
+            windows[bedroom_id] = (min(lo, check_in), max(hi, check_out))
+
+        prefixes = {
+            bedroom_id: (
+                start,
+                self._prefix_sums(self._bedrooms[bedroom_id], start, end),
+            )
+            for bedroom_id, (start, end) in windows.items()
+        }
+
+        quotes = []
+        for bedroom_id, check_in, check_out in stays:
+            start, prefix = prefixes[bedroom_id]
+            first = (check_in - start).days
+            nights = (check_out - check_in).days
+            quotes.append(
+                StayQuote(
+                    bedroom_id=bedroom_id,
+                    check_in=check_in,
+                    check_out=check_out,
+                    nights=nights,
+                    total_cents=prefix[first + nights] - prefix[first],
+                    currency=self._bedrooms[bedroom_id].currency,
+                )
+            )
+        return quotes
@@ -0,0 +1,40 @@
+import re
+
+CURRENCY_SYMBOLS = {"BRL": "R$"}
+
+
+class Money:
+    def __init__(self, cents: int, currency: str = "BRL"):
+        if cents < 0:
+            raise ValueError("Price must not be negative.")
+        self.cents = cents
+        self.currency = currency
+
+    @classmethod
+    def parse(cls, display: str, currency: str = "BRL") -> "Money":
+        """Converte preços de exibição ("R$ 1.280,00", "R$ 200.00") em centavos."""
+        amount = re.sub(r"[^\d,.]", "", display)
+        if not re.search(r"\d", amount):
+            raise ValueError("Invalid price.")
+        fraction = "00"
+        match = re.search(r"[.,](\d{1,2})$", amount)
+        if match:
+            fraction = match.group(1).ljust(2, "0")
+            amount = amount[: match.start()]
+        integer = re.sub(r"\D", "", amount) or "0"
+        return cls(int(integer) * 100 + int(fraction), currency)
+
+    def format(self) -> str:
+        integer, fraction = divmod(self.cents, 100)
+        symbol = CURRENCY_SYMBOLS.get(self.currency, self.currency)
+        return f"{symbol} {integer:,}".replace(",", ".") + f",{fraction:02d}"
+
+    def __eq__(self, other) -> bool:
+        return (
+            isinstance(other, Money)
+            and self.cents == other.cents
+            and self.currency == other.currency
+        )
+
+    def __str__(self) -> str:
+        return self.format()
@@ -1,5 +1,7 @@
 import re
+from typing import List, Optional
 from blog.api.security import get_password_hash, verify_password
+from blog.domain.services.password_hasher import PasswordHasher
 
 
 class PasswordValidationError(Exception):
@@ -9,11 +11,49 @@ class PasswordValidationError(Exception):
 class Password:
     def __init__(self, plain_password: str, hashed: bool = False):
         self._plain_password = plain_password
+        self._hash: Optional[str] = None
         if not hashed:
             self.validate(plain_password)
-            self._hashed = get_password_hash(plain_password)
         else:
-            self._hashed = plain_password
+            self._hash = plain_password
+
+    @classmethod
+    def for_login(cls, plain_password: str) -> "Password":
+        # Credencial digitada no login: só é verificada contra o hash salvo,
+        # sem regras de força (senhas legadas) e sem gerar um novo bcrypt.
+        password = cls.__new__(cls)
+        password._plain_password = plain_password
+        password._hash = None
+        return password
+
+    @classmethod
+    def from_hash(cls, hashed_password: str) -> "Password":
+        # Hash já persistido: não passa pelas regras de força nem pelo bcrypt.
+        return cls(hashed_password, hashed=True)
+
+    @property
+    def _hashed(self) -> str:
+        # Fallback síncrono; no fluxo da API o hash é gerado via hash_with().
+        if self._hash is None:
+            self._hash = get_password_hash(self._plain_password)
+        return self._hash
+
+    async def hash_with(self, hasher: PasswordHasher) -> "Password":
+        if self._hash is None:
+            self._hash = await hasher.hash(self._plain_password)
+        return self
+
+    @property
+    def is_hashed(self) -> bool:
+        return self._hash is not None
+
+    @staticmethod
+    async def hash_many(passwords: List["Password"], hasher: PasswordHasher) -> None:
+        # Importações em massa: um único hash_many para todas as senhas do lote.
+        pending = [password for password in passwords if not password.is_hashed]
+        hashes = await hasher.hash_many([p._plain_password for p in pending])
+        for password, hashed in zip(pending, hashes):
+            password._hash = hashed
 
     def validate(self, password: str):
         if len(password) < 8:
@@ -36,6 +76,9 @@ class Password:
     def verify(self, db: str) -> bool:
         return verify_password(self._plain_password, db)
 
+    async def verify_with(self, hasher: PasswordHasher, db: str) -> bool:
+        return await hasher.verify(self._plain_password, db)
+
     def __eq__(self, other) -> bool:
         return isinstance(other, Password) and self._hashed == other._hashed
 
@@ -0,0 +1,36 @@
+import hashlib
+from typing import Optional
+
+from blog.api.settings import settings
+from blog.infra.cache.cache import Cache, cache_backend
+
+
+class CachedBody:
+    """Resposta JSON já serializada, com o ETag forte calculado uma única vez."""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes, etag: Optional[str] = None):
+        self.body = body
+        self.etag = etag or f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    def encode(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def decode(cls, data: bytes) -> "CachedBody":
+        etag, body = data.split(b"\n", 1)
+        return cls(body, etag.decode())
+
+
+# Listagem ("list") e detalhe ("detail:<id>") do catálogo. Toda escrita no
+# catálogo chama clear() depois do commit; o TTL cobre instâncias que usam o
+# LRU local e não enxergam a invalidação das outras.
+bedroom_catalog_cache: Cache[CachedBody] = Cache(
+    "bedrooms",
+    cache_backend(settings.BEDROOM_CACHE_MAX_SIZE),
+    ttl_seconds=settings.BEDROOM_CACHE_TTL_SECONDS,
+    encode=CachedBody.encode,
+    decode=CachedBody.decode,
+    enabled=settings.BEDROOM_CACHE_ENABLED,
+)
@@ -0,0 +1,235 @@
+import asyncio
+import secrets
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from blog.api.settings import settings
+from blog.infra.cache.cache_backend import CacheBackend, CacheBackendError
+from blog.infra.cache.lru_cache_backend import LRUCacheBackend
+from blog.infra.cache.resp_cache_backend import RespCacheBackend
+
+V = TypeVar("V")
+
+_shared_backend: Optional[CacheBackend] = None
+
+
+def cache_backend(max_size: int) -> CacheBackend:
+    """Com CACHE_URL, todos os caches dividem o mesmo servidor (coerente entre
+    workers); sem ele, cada cache tem seu próprio LRU no processo."""
+    global _shared_backend
+    if not settings.CACHE_URL:
+        return LRUCacheBackend(max_size)
+    if _shared_backend is None:
+        _shared_backend = RespCacheBackend(
+            settings.CACHE_URL,
+            pool_size=settings.CACHE_POOL_SIZE,
+            timeout_seconds=settings.CACHE_TIMEOUT_SECONDS,
+        )
+    return _shared_backend
+
+
+async def close_cache_backend() -> None:
+    if _shared_backend is not None:
+        await _shared_backend.close()
+
+
+class Cache(Generic[V]):
+    """Cache de um namespace sobre um CacheBackend.
+
+    `get_or_load` faz read-through com single-flight: misses simultâneos da
+    mesma chave no processo esperam uma única carga. Falhas do backend contam
+    como miss (a requisição segue pelo banco) e ficam em `errors`.
+
+    Valores com `scope` são gravados com a geração do escopo, um token
+    aleatório guardado no backend com o mesmo TTL dos valores; o valor e a
+    geração vêm juntos num único MGET. `invalidate(scope)` troca o token (um
+    SET, sem SCAN): uma carga que leu a geração antiga, em qualquer worker,
+    grava um valor que não confere mais. Geração ausente (expirada ou
+    despejada pelo LRU/maxmemory) faz de todo o escopo um miss.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        backend: CacheBackend,
+        ttl_seconds: float,
+        encode: Callable[[V], bytes],
+        decode: Callable[[bytes], V],
+        enabled: bool = True,
+    ):
+        self.namespace = namespace
+        self.backend = backend
+        self.enabled = enabled
+        self._ttl = ttl_seconds
+        self._encode = encode
+        self._decode = decode
+        self._flights: Dict[str, "asyncio.Future[Optional[V]]"] = {}
+        # Cargas iniciadas antes de um clear() não gravam o resultado antigo.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _generation_key(self, scope: str) -> str:
+        return self._key(f"generation:{scope}")
+
+    async def _get_scoped(
+        self, key: str, scope: str
+    ) -> Tuple[Optional[bytes], Optional[V]]:
+        """(geração vigente do escopo, valor gravado nela); a geração é None se
+        o backend falhou ou se outra carga acabou de criá-la."""
+        generation_key = self._generation_key(scope)
+        try:
+            generation, data = await self.backend.get_many(
+                [generation_key, self._key(key)]
+            )
+            if generation is None:
+                generation = secrets.token_hex(8).encode()
+                if not await self.backend.add(generation_key, generation, self._ttl):
+                    generation = None
+        except CacheBackendError:
+            self.errors += 1
+            generation, data = None, None
+        tag = generation + b":" if generation is not None else None
+        if data is None or tag is None or not data.startswith(tag):
+            self.misses += 1
+            return generation, None
+        self.hits += 1
+        return generation, self._decode(data[len(tag) :])
+
+    async def get(self, key: str) -> Optional[V]:
+        if not self.enabled:
+            return None
+        try:
+            data = await self.backend.get(self._key(key))
+        except CacheBackendError:
+            self.errors += 1
+            data = None
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._decode(data)
+
+    async def set(self, key: str, value: V) -> None:
+        if not self.enabled or self._ttl <= 0:
+            return
+        try:
+            await self.backend.set(self._key(key), self._encode(value), self._ttl)
+        except CacheBackendError:
+            self.errors += 1
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[Optional[V]]],
+        scope: Optional[str] = None,
+    ) -> Optional[V]:
+        """Valores None (ex.: registro inexistente) não são guardados."""
+        scope_generation: Optional[bytes] = None
+        flight_key = key
+        if not self.enabled:
+            value = None
+        elif scope is None:
+            value = await self.get(key)
+        else:
+            scope_generation, value = await self._get_scoped(key, scope)
+            if scope_generation is not None:
+                flight_key = f"{key}#{scope_generation.decode()}"
+        if value is not None:
+            return value
+
+        flight = self._flights.get(flight_key)
+        if flight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # A carga líder foi cancelada (cliente desconectou): carrega.
+                return await self.get_or_load(key, load, scope)
+
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[flight_key] = flight
+        generation = self._generation
+        try:
+            value = await load()
+            if value is not None and generation == self._generation:
+                if scope is None:
+                    await self.set(key, value)
+                elif scope_generation is not None:
+                    await self._set_scoped(key, scope_generation, value)
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # marca como consumida se ninguém esperava
+            raise
+        else:
+            flight.set_result(value)
+        finally:
+            if not flight.done():
+                flight.cancel()
+            if self._flights.get(flight_key) is flight:
+                del self._flights[flight_key]
+        return value
+
+    async def _set_scoped(self, key: str, generation: bytes, value: V) -> None:
+        if self._ttl <= 0:
+            return
+        try:
+            await self.backend.set(
+                self._key(key), generation + b":" + self._encode(value), self._ttl
+            )
+        except CacheBackendError:
+            self.errors += 1
+
+    async def delete(self, *keys: str) -> None:
+        self._generation += 1
+        for key in keys:
+            self._flights.pop(key, None)
+        try:
+            await self.backend.delete([self._key(key) for key in keys])
+        except CacheBackendError:
+            self.errors += 1
+
+    async def invalidate(self, scope: str) -> None:
+        try:
+            await self.backend.set(
+                self._generation_key(scope), secrets.token_hex(8).encode(), self._ttl
+            )
+        except CacheBackendError:
+            self.errors += 1
+
+    async def clear(self, prefix: str = "") -> None:
+        self._generation += 1
+        for key in [key for key in self._flights if key.startswith(prefix)]:
+            del self._flights[key]
+        try:
+            await self.backend.delete_prefix(self._key(prefix))
+        except CacheBackendError:
+            self.errors += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    async def stats(self) -> dict:
+        try:
+            backend = await self.backend.stats()
+        except CacheBackendError:
+            self.errors += 1
+            backend = {}
+        return {
+            **backend,
+            "namespace": self.namespace,
+            "ttl_seconds": self._ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "hit_ratio": self.hit_ratio,
+        }
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class CacheBackendError(Exception):
+    """O backend do cache não respondeu; quem chama trata como miss."""
+
+
+class CacheBackend(ABC):
+    """Armazenamento chave -> bytes com TTL, local ou compartilhado entre workers."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]: ...
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Lê as chaves numa única operação atômica (MGET)."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None: ...
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Grava só se a chave não existir (SET NX); diz se gravou."""
+
+    @abstractmethod
+    async def delete(self, keys: List[str]) -> None: ...
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None: ...
+
+    @abstractmethod
+    async def stats(self) -> dict: ...
+
+    async def close(self) -> None:
+        pass
@@ -0,0 +1,149 @@
+import argparse
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from blog.infra.cache.cache_backend import CacheBackendError
+from blog.infra.cache.resp_cache_backend import read_reply
+
+
+def _encode_reply(value: Any) -> bytes:
+    if isinstance(value, CacheBackendError):
+        return b"-ERR %s\r\n" % str(value).encode()
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, bool):
+        return b"+OK\r\n"
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, bytes):
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+    return b"*%d\r\n" % len(value) + b"".join(_encode_reply(v) for v in value)
+
+
+def _glob(pattern: str) -> "re.Pattern[str]":
+    # Glob do Redis (sem classes [...]): \x escapa, * e ? são curingas.
+    parts, i = [], 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        parts.append({"*": ".*", "?": "."}.get(char) or re.escape(char))
+        i += 1
+    return re.compile("".join(parts) + r"\Z", re.DOTALL)
+
+
+class FakeRedisServer:
+    """Servidor em memória com o subconjunto do RESP usado pelo RespCacheBackend.
+
+    Substitui o Redis nos testes e no desenvolvimento local com vários workers:
+    `python -m blog.infra.cache.fake_redis_server --port 6379`.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._host = host
+        self._port = port
+        self._data: Dict[bytes, Tuple[Optional[float], bytes]] = {}
+        self._server: Optional[asyncio.Server] = None
+        self.commands = 0
+        self.expired_keys = 0
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> "FakeRedisServer":
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+        return self
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                command = await read_reply(reader)
+                self.commands += 1
+                try:
+                    reply = self._execute(command[0].upper().decode(), command[1:])
+                except CacheBackendError as e:
+                    reply = e
+                writer.write(_encode_reply(reply))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _alive(self, key: bytes) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] is not None and entry[0] < time.monotonic():
+            del self._data[key]
+            self.expired_keys += 1
+            return None
+        return entry[1]
+
+    def _execute(self, name: str, args: List[bytes]) -> Any:
+        if name in ("PING", "AUTH", "SELECT", "FLUSHDB"):
+            if name == "FLUSHDB":
+                self._data.clear()
+            return True
+        if name == "GET":
+            return self._alive(args[0])
+        if name == "MGET":
+            return [self._alive(key) for key in args]
+        if name == "SET":
+            options = [arg.upper() for arg in args[2:]]
+            if b"NX" in options and self._alive(args[0]) is not None:
+                return None
+            expires = None
+            if b"PX" in options:
+                expires = (
+                    time.monotonic() + int(options[options.index(b"PX") + 1]) / 1000
+                )
+            self._data[args[0]] = (expires, args[1])
+            return True
+        if name == "DEL":
+            return sum(self._data.pop(key, None) is not None for key in args)
+        if name == "SCAN":
+            pattern = _glob(
+                args[args.index(b"MATCH") + 1].decode() if b"MATCH" in args else "*"
+            )
+            keys = [
+                key
+                for key in list(self._data)
+                if pattern.match(key.decode()) and self._alive(key) is not None
+            ]
+            return [b"0", keys]
+        if name == "DBSIZE":
+            return len(self._data)
+        if name == "INFO":
+            return f"# Stats\r\nexpired_keys:{self.expired_keys}\r\nevicted_keys:0\r\n"
+        raise CacheBackendError(f"unknown command '{name}'")
+
+
+async def _main(host: str, port: int) -> None:
+    server = await FakeRedisServer(host, port).start()
+    print(f"FakeRedisServer ouvindo em {server.url}")
+    await asyncio.Event().wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stand-in local do Redis.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port))
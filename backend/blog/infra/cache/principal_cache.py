@@ -0,0 +1,39 @@
+import json
+
+from blog.api.settings import settings
+from blog.domain.entities.principal import Principal
+from blog.infra.cache.cache import Cache, cache_backend
+
+
+def encode_principal(principal: Principal) -> bytes:
+    # Só o necessário para autorizar: nada de hash de senha ou dados pessoais.
+    return json.dumps([principal.id, principal.role, principal.token_version]).encode()
+
+
+def decode_principal(data: bytes) -> Principal:
+    id, role, version = json.loads(data)
+    return Principal(id, role, version)
+
+
+# Usuários autenticados (tokens sem claims), indexados pelo `sub` do token.
+principal_cache: Cache[Principal] = Cache(
+    "principal",
+    cache_backend(settings.PRINCIPAL_CACHE_MAX_SIZE),
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    encode=encode_principal,
+    decode=decode_principal,
+)
+
+# Versão vigente dos tokens de cada usuário, usada no modo de claims do JWT.
+token_version_cache: Cache[int] = Cache(
+    "token_version",
+    cache_backend(settings.PRINCIPAL_CACHE_MAX_SIZE),
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    encode=lambda version: str(version).encode(),
+    decode=int,
+)
+
+
+async def invalidate_principal(user_id: str) -> None:
+    await principal_cache.invalidate(user_id)
+    await token_version_cache.invalidate(user_id)
@@ -0,0 +1,17 @@
+from blog.api.settings import settings
+from blog.infra.cache.cache import Cache, cache_backend
+
+# Páginas de GET /reservations/me já serializadas, com chave
+# "<user_id>:<parâmetros da página>" no escopo do usuário; cada escrita nas
+# reservas dele troca a geração do escopo.
+reservation_list_cache: Cache[bytes] = Cache(
+    "reservations:me",
+    cache_backend(settings.RESERVATION_CACHE_MAX_SIZE),
+    ttl_seconds=settings.RESERVATION_CACHE_TTL_SECONDS,
+    encode=bytes,
+    decode=bytes,
+)
+
+
+async def invalidate_user_reservations(user_id: str) -> None:
+    await reservation_list_cache.invalidate(user_id)
@@ -0,0 +1,149 @@
+import asyncio
+import re
+from typing import Any, List, Optional, Union
+from urllib.parse import urlparse
+
+from blog.infra.cache.cache_backend import CacheBackend, CacheBackendError
+
+Arg = Union[str, bytes, int]
+
+SCAN_COUNT = 1000
+
+
+def encode_command(args: tuple) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts += [b"$%d\r\n" % len(data), data, b"\r\n"]
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Any:
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        raise CacheBackendError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind == b"$":
+        size = int(payload)
+        return None if size < 0 else (await reader.readexactly(size + 2))[:-2]
+    if kind == b"*":
+        size = int(payload)
+        return None if size < 0 else [await read_reply(reader) for _ in range(size)]
+    raise CacheBackendError(f"Unexpected reply: {line!r}")
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: Arg) -> Any:
+        self.writer.write(encode_command(args))
+        await self.writer.drain()
+        return await read_reply(self.reader)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RespCacheBackend(CacheBackend):
+    """Backend compartilhado que fala o protocolo do Redis (RESP2).
+
+    Funciona com Redis, Valkey, KeyDB ou o FakeRedisServer dos testes. Cada
+    comando usa uma conexão do pool; erros de rede e timeouts viram
+    CacheBackendError e a conexão envolvida é descartada.
+    """
+
+    def __init__(self, url: str, pool_size: int, timeout_seconds: float):
+        parsed = urlparse(url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 6379
+        self._password = parsed.password
+        self._db = int(parsed.path.lstrip("/") or 0)
+        self._timeout = timeout_seconds
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: List[_Connection] = []
+
+    async def _connect(self) -> _Connection:
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        connection = _Connection(reader, writer)
+        if self._password:
+            await connection.execute("AUTH", self._password)
+        if self._db:
+            await connection.execute("SELECT", self._db)
+        return connection
+
+    async def execute(self, *args: Arg) -> Any:
+        async with self._slots:
+            connection: Optional[_Connection] = None
+            try:
+                async with asyncio.timeout(self._timeout):
+                    connection = self._idle.pop() if self._idle else None
+                    connection = connection or await self._connect()
+                    reply = await connection.execute(*args)
+            except CacheBackendError:
+                # Erro do servidor: o protocolo segue íntegro na conexão.
+                if connection is not None:
+                    self._idle.append(connection)
+                raise
+            except (OSError, EOFError, TimeoutError, ValueError) as e:
+                if connection is not None:
+                    connection.close()
+                raise CacheBackendError(f"{type(e).__name__}: {e}") from e
+            except BaseException:
+                # Cancelada no meio do comando: a resposta pendente corromperia
+                # o próximo uso da conexão.
+                if connection is not None:
+                    connection.close()
+                raise
+            self._idle.append(connection)
+            return reply
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.execute("GET", key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self.execute("MGET", *keys)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        await self.execute("SET", key, value, "PX", max(1, int(ttl_seconds * 1000)))
+
+    async def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        reply = await self.execute(
+            "SET", key, value, "PX", max(1, int(ttl_seconds * 1000)), "NX"
+        )
+        return reply is not None
+
+    async def delete(self, keys: List[str]) -> None:
+        if keys:
+            await self.execute("DEL", *keys)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.execute(
+                "SCAN", cursor, "MATCH", pattern, "COUNT", SCAN_COUNT
+            )
+            await self.delete(keys)
+            if cursor == b"0":
+                return
+
+    async def stats(self) -> dict:
+        info = (await self.execute("INFO", "stats")).decode()
+        fields = dict(line.split(":", 1) for line in info.splitlines() if ":" in line)
+        return {
+            "backend": "resp",
+            "address": f"{self._host}:{self._port}/{self._db}",
+            "size": await self.execute("DBSIZE"),
+            "evictions": int(fields.get("evicted_keys", 0)),
+            "expirations": int(fields.get("expired_keys", 0)),
+        }
+
+    async def close(self) -> None:
+        while self._idle:
+            self._idle.pop().close()
@@ -1,15 +1,121 @@
+import time
+from typing import Dict
+from greenlet import getcurrent
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.engine import URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 import os
 
+from blog.api.settings import settings
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
 if DATABASE_URL is None:
     raise ValueError("DATABASE_URL must be set")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
 
-async_session = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+class PoolWaitMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "checkouts": self.checkouts,
+            "avg_wait_ms": (
+                self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0
+            ),
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+
+pool_wait_metrics = PoolWaitMetrics()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """QueuePool que mede quanto tempo cada requisição esperou por uma conexão.
+
+    Só a espera na fila conta: quando o checkout abre uma conexão nova
+    (pool vazio ou overflow), o tempo do connect é descontado.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Tempo de connect de cada checkout em andamento, por greenlet: o
+        # connect do driver async cede o loop para outros checkouts.
+        self._connect_time: Dict[object, float] = {}
+
+    def _do_get(self):
+        checkout = getcurrent()
+        if checkout in self._connect_time:
+            return super()._do_get()  # nova tentativa dentro do mesmo checkout
+        self._connect_time[checkout] = 0.0
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            connect = self._connect_time.pop(checkout)
+            pool_wait_metrics.record(time.perf_counter() - start - connect)
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            checkout = getcurrent()
+            if checkout in self._connect_time:
+                self._connect_time[checkout] += time.perf_counter() - start
+
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+
+class AppSession(Session):
+    """Session síncrona por trás das AsyncSession da API. Listeners que só
+    funcionam dentro do greenlet da AsyncSession se registram nela, não na
+    Session global (migrações e scripts usam Sessions síncronas comuns)."""
+
+
+async_session = async_sessionmaker(
+    engine,
+    expire_on_commit=False,
+    class_=AsyncSession,
+    sync_session_class=AppSession,
+)
 
 Base = declarative_base()
+
+
+def pool_status() -> dict:
+    pool = engine.sync_engine.pool
+    status = {
+        "size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "timeout_seconds": settings.DB_POOL_TIMEOUT,
+    }
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(
+            {
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+            }
+        )
+    status.update(pool_wait_metrics.as_dict())
+    return status
@@ -2,7 +2,7 @@ import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
 import uuid
 from blog.infra.database import Base
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # A importação da classe Bedroom é necessária aqui APENAS para o type checking do Pylance/MyPy.
@@ -13,30 +13,47 @@ class BedroomModel(Base):
     __tablename__ = "bedrooms"
 
     id: Mapped[str] = mapped_column(
-        sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
+        sa.Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
+    # Chave natural dos catálogos importados (seed, arquivos JSON/CSV).
+    code: Mapped[Optional[str]] = mapped_column(sa.String, unique=True, nullable=True)
     title: Mapped[str] = mapped_column(sa.String, nullable=False)
     description: Mapped[str] = mapped_column(sa.String, nullable=False)
-    price: Mapped[str] = mapped_column(sa.String, nullable=False)
+    price_cents: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    currency: Mapped[str] = mapped_column(
+        sa.String(3), nullable=False, default="BRL", server_default="BRL"
+    )
     image: Mapped[str] = mapped_column(sa.String, nullable=False)
+    # Derivadas da imagem (tipo -> largura -> URL), geradas no upload/importação.
+    image_variants: Mapped[Optional[dict]] = mapped_column(sa.JSON, nullable=True)
+
+    @staticmethod
+    def columns_from_entity(entity: "Bedroom") -> dict:
+        return {
+            "id": entity.id or str(uuid.uuid4()),
+            "code": entity.code,
+            "title": entity.title,
+            "description": entity.description,
+            "price_cents": entity.price_cents,
+            "currency": entity.currency,
+            "image": entity.image,
+            "image_variants": entity.image_variants,
+        }
 
     @classmethod
     def from_entity(cls, entity: "Bedroom") -> "BedroomModel":  # "Bedroom" como string
-        return cls(
-            id=entity.id,
-            title=entity.title,
-            description=entity.description,
-            price=entity.price,
-            image=entity.image,
-        )
+        return cls(**cls.columns_from_entity(entity))
 
     def to_entity(self) -> "Bedroom":
         from blog.domain.entities.bedroom import Bedroom
 
-        return Bedroom(
+        return Bedroom.hydrate(
             id=self.id,
             title=self.title,
             description=self.description,
-            price=self.price,
+            price_cents=self.price_cents,
+            currency=self.currency,
             image=self.image,
+            code=self.code,
+            image_variants=self.image_variants,
         )
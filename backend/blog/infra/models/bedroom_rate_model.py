@@ -0,0 +1,64 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+import uuid
+from blog.infra.database import Base
+from datetime import date
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from blog.domain.entities.rate_override import RateOverride
+
+
+class BedroomRateModel(Base):
+    __tablename__ = "bedroom_rates"
+
+    id: Mapped[str] = mapped_column(
+        sa.Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
+    )
+    bedroom_id: Mapped[str] = mapped_column(
+        sa.Uuid(as_uuid=False),
+        sa.ForeignKey("bedrooms.id"),
+        nullable=False,
+        index=True,
+    )
+    price_cents: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    start_date: Mapped[Optional[date]] = mapped_column(sa.Date, nullable=True)
+    end_date: Mapped[Optional[date]] = mapped_column(sa.Date, nullable=True)
+    # Bit n ligado = vale para o dia da semana n (0 = segunda); NULL = todos.
+    weekdays: Mapped[Optional[int]] = mapped_column(sa.Integer, nullable=True)
+    priority: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
+
+    @staticmethod
+    def columns_from_entity(entity: "RateOverride") -> dict:
+        return {
+            "id": entity.id or str(uuid.uuid4()),
+            "bedroom_id": entity.bedroom_id,
+            "price_cents": entity.price_cents,
+            "start_date": entity.start_date,
+            "end_date": entity.end_date,
+            "weekdays": (
+                sum(1 << day for day in entity.weekdays)
+                if entity.weekdays is not None
+                else None
+            ),
+            "priority": entity.priority,
+        }
+
+    def to_entity(self) -> "RateOverride":
+        from blog.domain.entities.rate_override import RateOverride
+
+        return RateOverride(
+            id=self.id,
+            bedroom_id=self.bedroom_id,
+            price_cents=self.price_cents,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            weekdays=(
+                [day for day in range(7) if self.weekdays >> day & 1]
+                if self.weekdays is not None
+                else None
+            ),
+            priority=self.priority,
+        )
@@ -1,9 +1,10 @@
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import uuid
 from blog.infra.database import Base
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from blog.domain.entities.reservation import Reservation
@@ -11,42 +12,78 @@ if TYPE_CHECKING:
 
 class ReservationModel(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        sa.Index("ix_reservations_bedroom_id_check_in", "bedroom_id", "check_in"),
+        # /reservations/me: filtra por usuário e pagina por (check_in, id).
+        sa.Index("ix_reservations_user_id_check_in", "user_id", "check_in"),
+        # Varreduras por situação das estadias que terminam num intervalo.
+        sa.Index("ix_reservations_status_check_out", "status", "check_out"),
+        # No Postgres o próprio banco rejeita estadias sobrepostas no mesmo
+        # quarto (índice GiST sobre o intervalo [check_in, check_out)).
+        ExcludeConstraint(
+            (sa.column("bedroom_id"), "="),
+            (sa.func.tsrange(sa.column("check_in"), sa.column("check_out")), "&&"),
+            name="reservations_bedroom_no_overlap",
+            using="gist",
+            where=sa.text("status <> 'cancelled'"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(
-        sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
+        sa.Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     user_id: Mapped[str] = mapped_column(
-        sa.String, sa.ForeignKey("users.id"), nullable=False
+        sa.Uuid(as_uuid=False), sa.ForeignKey("users.id"), nullable=False
     )
     title: Mapped[str] = mapped_column(sa.String, nullable=False)
     address: Mapped[str] = mapped_column(sa.String, nullable=False)
     check_in: Mapped[datetime] = mapped_column(sa.DateTime, nullable=False)
     check_out: Mapped[datetime] = mapped_column(sa.DateTime, nullable=False)
     status: Mapped[str] = mapped_column(sa.String, default="Pendente")
+    bedroom_id: Mapped[Optional[str]] = mapped_column(
+        sa.Uuid(as_uuid=False), sa.ForeignKey("bedrooms.id"), nullable=True
+    )
 
     user = relationship("UserModel", back_populates="reservations")
 
+    @staticmethod
+    def columns_from_entity(entity: "Reservation") -> dict:
+        return {
+            "id": entity.id or str(uuid.uuid4()),
+            "user_id": entity.user_id,
+            "title": entity.title,
+            "address": entity.address,
+            "check_in": entity.check_in,
+            "check_out": entity.check_out,
+            "status": entity.status,
+            "bedroom_id": entity.bedroom_id,
+        }
+
     @classmethod
     def from_entity(cls, entity: "Reservation") -> "ReservationModel":
-        return cls(
-            id=entity.id,
-            user_id=entity.user_id,
-            title=entity.title,
-            address=entity.address,
-            check_in=entity.check_in,
-            check_out=entity.check_out,
-            status=entity.status,
-        )
+        return cls(**cls.columns_from_entity(entity))
 
     def to_entity(self) -> "Reservation":
         from blog.domain.entities.reservation import Reservation
 
-        return Reservation(
+        return Reservation.hydrate(
             id=self.id,
             user_id=self.user_id,
             title=self.title,
             address=self.address,
-            check_in=self.check_in.strftime("%d/%m/%Y às %Hh%M"),
-            check_out=self.check_out.strftime("%d/%m/%Y às %Hh%M"),
+            check_in=self.check_in,
+            check_out=self.check_out,
             status=self.status,
+            bedroom_id=self.bedroom_id,
         )
+
+
+# O "=" sobre bedroom_id (uuid) na exclusion constraint GiST vem da extensão
+# btree_gist.
+sa.event.listen(
+    ReservationModel.__table__,
+    "before_create",
+    sa.DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(
+        dialect="postgresql"
+    ),
+)
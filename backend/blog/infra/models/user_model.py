@@ -1,10 +1,14 @@
 import sqlalchemy as sa
-from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy import event
+from sqlalchemy.orm import relationship, Mapped, mapped_column, object_session
+from sqlalchemy.orm.attributes import get_history
+from sqlalchemy.util import await_only
 from blog.domain.entities.user import User
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password
 import uuid
-from blog.infra.database import Base
+from blog.infra.database import AppSession, Base
+from blog.infra.cache.principal_cache import invalidate_principal
 from typing import Optional
 
 
@@ -12,42 +16,94 @@ class UserModel(Base):
     __tablename__ = "users"
 
     id: Mapped[str] = mapped_column(
-        sa.String, primary_key=True, default=lambda: str(uuid.uuid4())
+        sa.Uuid(as_uuid=False), primary_key=True, default=lambda: str(uuid.uuid4())
     )
     name: Mapped[str] = mapped_column(sa.String, nullable=False)
-    email: Mapped[str] = mapped_column(sa.String, unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(sa.String, nullable=False)
     password: Mapped[str] = mapped_column(sa.String, nullable=False)
     role: Mapped[str] = mapped_column(sa.String, default="user")
 
     phone: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     document: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
     address: Mapped[Optional[str]] = mapped_column(sa.String, nullable=True)
+    token_version: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, default=0, server_default="0"
+    )
 
     reservations = relationship(
         "ReservationModel", back_populates="user", cascade="all, delete"
     )
 
+    @staticmethod
+    def columns_from_entity(entity: User) -> dict:
+        return {
+            "id": entity.id or str(uuid.uuid4()),
+            "name": entity.name,
+            "email": str(entity.email),
+            "password": str(entity.password),
+            "role": entity.role,
+            "phone": entity.phone,
+            "document": entity.document,
+            "address": entity.address,
+            "token_version": entity.token_version,
+        }
+
     @classmethod
     def from_entity(cls, entity: User) -> "UserModel":
-        return cls(
-            id=entity.id,
-            name=entity.name,
-            email=str(entity.email),
-            password=str(entity.password),
-            role=entity.role,
-            phone=entity.phone,
-            document=entity.document,
-            address=entity.address,
-        )
+        return cls(**cls.columns_from_entity(entity))
 
     def to_entity(self) -> User:
         return User(
             id=self.id,
             name=self.name,
             email=Email(self.email),
-            password=Password(self.password),
+            password=Password.from_hash(self.password),
             role=self.role,
             phone=self.phone,
             document=self.document,
             address=self.address,
+            token_version=self.token_version,
         )
+
+
+# Unicidade sem diferenciar maiúsculas; as buscas por e-mail usam lower(email).
+sa.Index("ix_users_email_lower", sa.func.lower(UserModel.email), unique=True)
+
+
+@event.listens_for(UserModel, "before_update")
+def bump_token_version(mapper, connection, target: UserModel) -> None:
+    # Troca de senha ou de papel invalida os tokens emitidos no modo de claims.
+    if (
+        get_history(target, "password").has_changes()
+        or get_history(target, "role").has_changes()
+    ):
+        target.token_version = (target.token_version or 0) + 1
+
+
+# Ids alterados em cada flush do ORM, guardados na sessão: o cache só é
+# invalidado depois do COMMIT, quando uma nova leitura já enxerga os dados
+# gravados. UPDATE/DELETE do Core não passam por aqui; os métodos do
+# repositório que os usam invalidam o cache explicitamente.
+DIRTY_USER_IDS = "dirty_user_ids"
+
+
+@event.listens_for(UserModel, "after_update")
+@event.listens_for(UserModel, "after_delete")
+def remember_dirty_user(mapper, connection, target: UserModel) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(DIRTY_USER_IDS, set()).add(target.id)
+
+
+@event.listens_for(AppSession, "after_commit")
+def invalidate_cached_principals(session: AppSession) -> None:
+    # O commit da AsyncSession roda num greenlet: await_only espera a
+    # invalidação no cache (inclusive no backend compartilhado) sem bloquear
+    # o event loop.
+    for user_id in session.info.pop(DIRTY_USER_IDS, ()):
+        await_only(invalidate_principal(user_id))
+
+
+@event.listens_for(AppSession, "after_rollback")
+def forget_dirty_users(session: AppSession) -> None:
+    session.info.pop(DIRTY_USER_IDS, None)
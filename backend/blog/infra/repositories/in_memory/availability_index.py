@@ -0,0 +1,58 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+type Stay = Tuple[datetime, datetime, str]
+
+
+class AvailabilityIndex:
+    """Agenda de ocupação por quarto para o repositório em memória.
+
+    Cada quarto guarda suas estadias ordenadas por check-in. Como a agenda
+    nunca aceita sobreposição, os intervalos são disjuntos e também ficam
+    ordenados por check-out: basta olhar o vizinho anterior ao novo
+    check-out (busca binária, O(log n)) para saber se o quarto está livre.
+    """
+
+    def __init__(self) -> None:
+        self._stays: Dict[str, List[Stay]] = {}
+        self._by_reservation: Dict[str, Tuple[str, Stay]] = {}
+
+    def is_free(
+        self,
+        bedroom_id: str,
+        check_in: datetime,
+        check_out: datetime,
+        ignore_id: Optional[str] = None,
+    ) -> bool:
+        stays = self._stays.get(bedroom_id, [])
+        i = bisect_left(stays, check_out, key=lambda stay: stay[0])
+        while i > 0:
+            start, end, reservation_id = stays[i - 1]
+            if ignore_id is None or reservation_id != ignore_id:
+                return end <= check_in
+            i -= 1
+        return True
+
+    def add(
+        self,
+        reservation_id: str,
+        bedroom_id: str,
+        check_in: datetime,
+        check_out: datetime,
+    ) -> bool:
+        """Ocupa o intervalo; retorna False (sem alterar nada) se houver conflito."""
+        if not self.is_free(bedroom_id, check_in, check_out, ignore_id=reservation_id):
+            return False
+        self.remove(reservation_id)
+        stay = (check_in, check_out, reservation_id)
+        insort(self._stays.setdefault(bedroom_id, []), stay)
+        self._by_reservation[reservation_id] = (bedroom_id, stay)
+        return True
+
+    def remove(self, reservation_id: str) -> None:
+        entry = self._by_reservation.pop(reservation_id, None)
+        if entry:
+            bedroom_id, stay = entry
+            stays = self._stays[bedroom_id]
+            del stays[bisect_left(stays, stay)]
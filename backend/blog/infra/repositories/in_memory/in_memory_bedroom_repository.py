@@ -1,18 +1,44 @@
 from blog.domain.repositories.bedroom_repository import BedroomRepository
-from blog.domain.entities.bedroom import Bedroom
-from typing import Optional, List
+from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.entities.bedroom import Bedroom, ImageVariants
+from blog.domain.entities.rate_override import RateOverride
+from datetime import date, datetime
+from typing import Dict, Optional, List
 import pytest
+import uuid
 
 
 class InMemoryBedroomRepository(BedroomRepository):
-    def __init__(self):
-        self._bedrooms = {}
+    def __init__(self, reservation_repo: Optional[ReservationRepository] = None):
+        self._bedrooms: Dict[str, Bedroom] = {}
+        self._reservation_repo = reservation_repo
+        self._rates: List[RateOverride] = []
 
     @pytest.mark.asyncio
     async def create_bedroom(self, bedroom: "Bedroom") -> "Bedroom":
         self._bedrooms[bedroom.id] = bedroom
         return bedroom
 
+    @pytest.mark.asyncio
+    async def bulk_import_bedrooms(self, bedrooms: List["Bedroom"]) -> int:
+        by_code = {b.code: b.id for b in self._bedrooms.values() if b.code}
+        for bedroom in bedrooms:
+            existing_id = by_code.get(bedroom.code) if bedroom.code else None
+            bedroom.id = existing_id or bedroom.id or str(uuid.uuid4())
+            self._bedrooms[bedroom.id] = bedroom
+        return len(bedrooms)
+
+    @pytest.mark.asyncio
+    async def update_bedroom_image(
+        self, bedroom_id: str, image: str, image_variants: ImageVariants
+    ) -> Optional["Bedroom"]:
+        bedroom = self._bedrooms.get(bedroom_id)
+        if bedroom is None:
+            return None
+        bedroom.image = image
+        bedroom.image_variants = image_variants
+        return bedroom
+
     @pytest.mark.asyncio
     async def get_bedroom_by_id(self, bedroom_id: str) -> Optional["Bedroom"]:
         return self._bedrooms.get(bedroom_id)
@@ -34,3 +60,44 @@ class InMemoryBedroomRepository(BedroomRepository):
             del self._bedrooms[bedroom_id]
             return True
         return False
+
+    @pytest.mark.asyncio
+    async def get_available_bedrooms(
+        self, check_in: datetime, check_out: datetime
+    ) -> List["Bedroom"]:
+        """Quartos sem reserva ativa em [check_in, check_out), ordenados por ID."""
+        bedrooms = sorted(self._bedrooms.values(), key=lambda b: b.id)
+        if self._reservation_repo is None:
+            return bedrooms
+        return [
+            bedroom
+            for bedroom in bedrooms
+            if await self._reservation_repo.is_bedroom_available(
+                bedroom.id, check_in, check_out
+            )
+        ]
+
+    @pytest.mark.asyncio
+    async def get_bedrooms_by_ids(self, bedroom_ids: List[str]) -> List["Bedroom"]:
+        return [self._bedrooms[i] for i in set(bedroom_ids) if i in self._bedrooms]
+
+    @pytest.mark.asyncio
+    async def add_rate_override(self, override: RateOverride) -> RateOverride:
+        if override.id is None:
+            override.id = str(uuid.uuid4())
+        self._rates.append(override)
+        return override
+
+    @pytest.mark.asyncio
+    async def get_rate_overrides(
+        self, bedroom_ids: List[str], start: date, end: date
+    ) -> List[RateOverride]:
+        """Regras dos quartos pedidos que valem em alguma noite de [start, end)."""
+        ids = set(bedroom_ids)
+        return [
+            rate
+            for rate in self._rates
+            if rate.bedroom_id in ids
+            and (rate.start_date is None or rate.start_date < end)
+            and (rate.end_date is None or rate.end_date > start)
+        ]
@@ -1,19 +1,53 @@
-from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.repositories.reservation_repository import (
+    ReservationRepository,
+    ReservationPermissionError,
+    ReservationConflictError,
+)
 from blog.domain.entities.reservation import Reservation
-from typing import Optional, List
+from blog.infra.repositories.in_memory.availability_index import AvailabilityIndex
+from copy import copy
+from datetime import datetime
+from typing import AsyncIterator, Optional, List, Tuple
 import pytest
+import uuid
 
 
 class InMemoryReservationRepository(ReservationRepository):
     def __init__(self):
         self._reservations = {}
+        self._availability = AvailabilityIndex()
+
+    def _occupy(self, reservation: Reservation) -> None:
+        if not reservation.blocks_bedroom:
+            self._availability.remove(reservation.id)
+        elif not self._availability.add(
+            reservation.id,
+            reservation.bedroom_id,
+            reservation.check_in,
+            reservation.check_out,
+        ):
+            raise ReservationConflictError()
 
     @pytest.mark.asyncio
     async def create_reservation(self, reservation: Reservation) -> Reservation:
         """Cria uma nova reserva no repositório em memória."""
+        if reservation.id is None:
+            reservation.id = str(uuid.uuid4())
+        self._occupy(reservation)
         self._reservations[reservation.id] = reservation
         return reservation
 
+    @pytest.mark.asyncio
+    async def is_bedroom_available(
+        self,
+        bedroom_id: str,
+        check_in: datetime,
+        check_out: datetime,
+        ignore_id: Optional[str] = None,
+    ) -> bool:
+        """Verifica se o quarto está livre no período [check_in, check_out)."""
+        return self._availability.is_free(bedroom_id, check_in, check_out, ignore_id)
+
     @pytest.mark.asyncio
     async def get_reservation_by_id(self, reservation_id: str) -> Optional[Reservation]:
         """Busca uma reserva pelo ID."""
@@ -30,23 +64,117 @@ class InMemoryReservationRepository(ReservationRepository):
 
     @pytest.mark.asyncio
     async def update_reservation(
-        self, reservation: Reservation
+        self,
+        reservation_id: str,
+        title: Optional[str] = None,
+        address: Optional[str] = None,
+        check_in: Optional[datetime] = None,
+        check_out: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> Optional[Tuple[Reservation, Reservation]]:
+        """Atualiza os campos informados. Retorna None se não encontrar a reserva."""
+        previous = self._reservations.get(reservation_id)
+        if previous is None:
+            return None
+        reservation = copy(previous)
+        reservation.update_reservation(
+            new_title=title,
+            new_address=address,
+            new_check_in_str=check_in,
+            new_check_out_str=check_out,
+            new_status=status,
+        )
+        if reservation.check_out <= reservation.check_in:
+            raise ValueError("Check-out must be after check-in.")
+        self._occupy(reservation)
+        self._reservations[reservation_id] = reservation
+        return previous, reservation
+
+    def _owned_reservation(
+        self, reservation_id: str, owner_id: Optional[str]
+    ) -> Optional[Reservation]:
+        reservation = self._reservations.get(reservation_id)
+        if reservation and owner_id is not None and reservation.user_id != owner_id:
+            raise ReservationPermissionError()
+        return reservation
+
+    @pytest.mark.asyncio
+    async def cancel_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
     ) -> Optional[Reservation]:
-        """Atualiza uma reserva existente. Retorna None se não encontrar a reserva."""
-        if reservation.id in self._reservations:
-            self._reservations[reservation.id] = reservation
-            return reservation
-        return None
+        """Cancela uma reserva, respeitando o dono quando owner_id é informado."""
+        reservation = self._owned_reservation(reservation_id, owner_id)
+        if reservation:
+            reservation.cancel_reservation()
+            self._availability.remove(reservation_id)
+        return reservation
 
     @pytest.mark.asyncio
-    async def delete_reservation(self, reservation_id: str) -> bool:
-        """Deleta uma reserva pelo ID. Retorna True se a reserva foi deletada, False caso contrário."""
-        if reservation_id in self._reservations:
+    async def delete_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
+    ) -> Optional[Reservation]:
+        """Deleta uma reserva pelo ID. Retorna a reserva deletada, ou None se não existia."""
+        reservation = self._owned_reservation(reservation_id, owner_id)
+        if reservation:
             del self._reservations[reservation_id]
-            return True
-        return False
+            self._availability.remove(reservation_id)
+        return reservation
 
     @pytest.mark.asyncio
     async def get_all_reservations(self) -> List[Reservation]:
         """Retorna todas as reservas no repositório."""
         return list(self._reservations.values())
+
+    @pytest.mark.asyncio
+    async def list_reservations_page(
+        self,
+        limit: int,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+    ) -> List[Reservation]:
+        """Retorna até `limit` reservas ordenadas por (check_in, id), após o cursor."""
+        page = []
+        for reservation in sorted(
+            self._reservations.values(), key=lambda r: (r.check_in, r.id)
+        ):
+            if user_id is not None and reservation.user_id != user_id:
+                continue
+            if status is not None and reservation.status != status:
+                continue
+            if check_in_from is not None and reservation.check_in < check_in_from:
+                continue
+            if check_in_to is not None and reservation.check_in >= check_in_to:
+                continue
+            if after is not None and (reservation.check_in, reservation.id) <= after:
+                continue
+            page.append(reservation)
+            if len(page) == limit:
+                break
+        return page
+
+    async def stream_reservations(
+        self,
+        chunk_size: int,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        check_out_after: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Reservation]]:
+        """Entrega as reservas em blocos de `chunk_size`, ordenadas por (check_in, id)."""
+        after = None
+        while True:
+            chunk = await self.list_reservations_page(
+                limit=chunk_size,
+                check_in_from=check_in_from,
+                check_in_to=check_in_to,
+                after=after,
+            )
+            if not chunk:
+                return
+            after = (chunk[-1].check_in, chunk[-1].id)
+            if check_out_after is not None:
+                chunk = [r for r in chunk if r.check_out > check_out_after]
+            if chunk:
+                yield chunk
@@ -2,10 +2,14 @@ from blog.domain.repositories.user_repository import UserRepository
 from blog.domain.entities.user import User
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password
-from typing import Optional
+from typing import List, Optional, Set
 import pytest
 
 
+def _same_email(a: Email, b: Email) -> bool:
+    return str(a).lower() == str(b).lower()
+
+
 class InMemoryUserRepository(UserRepository):
     def __init__(self):
         self._users = {}
@@ -17,10 +21,31 @@ class InMemoryUserRepository(UserRepository):
         self._current_user_id = user.id
         return user
 
+    @pytest.mark.asyncio
+    async def register_many(self, users: List[User]) -> List[str]:
+        existing = {str(user.email).lower() for user in self._users.values()}
+        registered = []
+        for user in users:
+            email = str(user.email).lower()
+            if email not in existing:
+                existing.add(email)
+                self._users[user.id] = user
+                registered.append(email)
+        return registered
+
+    @pytest.mark.asyncio
+    async def get_existing_emails(self, emails: List[Email]) -> Set[str]:
+        wanted = {str(email).lower() for email in emails}
+        return {
+            str(user.email).lower()
+            for user in self._users.values()
+            if str(user.email).lower() in wanted
+        }
+
     @pytest.mark.asyncio
     async def login(self, email: Email, password: Password) -> Optional[User]:
         for user in self._users.values():
-            if user.email == email and user.password == password:
+            if _same_email(user.email, email) and password.verify(str(user.password)):
                 self._current_user_id = user.id
                 return user
         return None
@@ -43,7 +68,7 @@ class InMemoryUserRepository(UserRepository):
     @pytest.mark.asyncio
     async def get_by_email(self, email: Email) -> None:
         for user in self._users.values():
-            if user.email == email:
+            if _same_email(user.email, email):
                 return user
         return None
 
@@ -53,3 +78,22 @@ class InMemoryUserRepository(UserRepository):
             if user.id == id:
                 return user
         return None
+
+    @pytest.mark.asyncio
+    async def get_token_version(self, id: str) -> Optional[int]:
+        user = self._users.get(id)
+        return user.token_version if user else None
+
+    @pytest.mark.asyncio
+    async def update_credentials(
+        self, id: str, password: Optional[Password] = None, role: Optional[str] = None
+    ) -> Optional[User]:
+        user = self._users.get(id)
+        if user is None:
+            return None
+        if password is not None:
+            user.password = password
+        if role is not None:
+            user.role = role
+        user.token_version += 1
+        return user
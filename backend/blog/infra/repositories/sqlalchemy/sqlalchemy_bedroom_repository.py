@@ -1,17 +1,107 @@
 # blog/infra/repositories/sqlalchemy/sqlalchemy_bedroom_repository.py
 
-from typing import Optional, List, TYPE_CHECKING
+import json
+from datetime import date, datetime
+from typing import Iterable, Optional, List, TYPE_CHECKING
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import (
     delete,
+    exists,
+    insert,
+    or_,
+    text,
+    update,
 )  # delete pode ser removido se não houver outras operações de delete
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection
 
-from blog.domain.repositories.bedroom_repository import BedroomRepository
+from blog.domain.repositories.bedroom_repository import (
+    BedroomRepository,
+    BedroomImportError,
+)
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
 from blog.infra.models.bedroom_model import BedroomModel
+from blog.infra.models.reservation_model import ReservationModel
+from blog.infra.models.bedroom_rate_model import BedroomRateModel
+from blog.domain.entities.bedroom import Bedroom, ImageVariants
 
 if TYPE_CHECKING:
-    from blog.domain.entities.bedroom import Bedroom
+    from blog.domain.entities.rate_override import RateOverride
+
+# Colunas na ordem de Bedroom.hydrate (listagens sem instanciar BedroomModel).
+BEDROOM_COLUMNS = (
+    BedroomModel.id,
+    BedroomModel.title,
+    BedroomModel.description,
+    BedroomModel.price_cents,
+    BedroomModel.currency,
+    BedroomModel.image,
+    BedroomModel.code,
+    BedroomModel.image_variants,
+)
+
+
+def _hydrate(rows: Iterable) -> List[Bedroom]:
+    return [Bedroom.hydrate(*row) for row in rows]
+
+
+IMPORT_COLUMNS = (
+    "id",
+    "code",
+    "title",
+    "description",
+    "price_cents",
+    "currency",
+    "image",
+    "image_variants",
+)
+# Colunas atualizadas quando o código já existe no catálogo.
+MERGED_COLUMNS = IMPORT_COLUMNS[2:]
+
+# A tabela de staging vive só na transação do lote; sem constraints nem
+# índices, o COPY não faz nenhuma checagem por linha.
+CREATE_IMPORT_STAGING = """
+CREATE TEMP TABLE bedrooms_import (LIKE bedrooms INCLUDING DEFAULTS) ON COMMIT DROP
+"""
+
+MERGE_IMPORT_STAGING = f"""
+INSERT INTO bedrooms ({", ".join(IMPORT_COLUMNS)})
+SELECT {", ".join(IMPORT_COLUMNS)} FROM bedrooms_import
+ON CONFLICT (code) DO UPDATE SET
+{", ".join(f"{column} = EXCLUDED.{column}" for column in MERGED_COLUMNS)}
+"""
+
+
+def _copy_value(column: str, value):
+    # O COPY do asyncpg recebe colunas json como texto.
+    if column == "image_variants" and value is not None:
+        return json.dumps(value)
+    return value
+
+
+async def _copy_and_merge(connection: AsyncConnection, rows: List[dict]) -> None:
+    raw = await connection.get_raw_connection()
+    driver = raw.driver_connection
+    assert driver is not None
+    await connection.execute(text(CREATE_IMPORT_STAGING))
+    await driver.copy_records_to_table(
+        "bedrooms_import",
+        records=[
+            tuple(_copy_value(column, row[column]) for column in IMPORT_COLUMNS)
+            for row in rows
+        ],
+        columns=IMPORT_COLUMNS,
+    )
+    await connection.execute(text(MERGE_IMPORT_STAGING))
+
+
+def _upsert_by_code():
+    stmt = sqlite.insert(BedroomModel.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=["code"],
+        set_={column: stmt.excluded[column] for column in MERGED_COLUMNS},
+    )
 
 
 class SQLAlchemyBedroomRepository(BedroomRepository):
@@ -19,13 +109,51 @@ class SQLAlchemyBedroomRepository(BedroomRepository):
         self._session = session
 
     async def create_bedroom(self, bedroom: "Bedroom") -> "Bedroom":
-        model = BedroomModel.from_entity(bedroom)
-        self._session.add(model)
+        stmt = (
+            insert(BedroomModel)
+            .values(**BedroomModel.columns_from_entity(bedroom))
+            .returning(BedroomModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one()
         await self._session.commit()
-        await self._session.refresh(model)
+        await bedroom_catalog_cache.clear()
         bedroom.id = model.id
         return model.to_entity()
 
+    async def bulk_import_bedrooms(self, bedrooms: List["Bedroom"]) -> int:
+        rows = [BedroomModel.columns_from_entity(bedroom) for bedroom in bedrooms]
+        try:
+            connection = await self._session.connection()
+            if connection.dialect.name == "postgresql":
+                # COPY binário do asyncpg para a staging + um único merge.
+                await _copy_and_merge(connection, rows)
+            else:
+                await self._session.execute(_upsert_by_code(), rows)
+            await self._session.commit()
+        except Exception as e:
+            # Erros do driver no COPY não passam pelo SQLAlchemy: qualquer
+            # falha desfaz o lote inteiro e sobe como erro de importação.
+            await self._session.rollback()
+            raise BedroomImportError(str(e)) from e
+        await bedroom_catalog_cache.clear()
+        return len(rows)
+
+    async def update_bedroom_image(
+        self, bedroom_id: str, image: str, image_variants: ImageVariants
+    ) -> Optional["Bedroom"]:
+        stmt = (
+            update(BedroomModel)
+            .where(BedroomModel.id == bedroom_id)
+            .values(image=image, image_variants=image_variants)
+            .returning(BedroomModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        await self._session.commit()
+        await bedroom_catalog_cache.clear()
+        return model.to_entity() if model else None
+
     async def get_bedroom_by_id(self, bedroom_id: str) -> Optional["Bedroom"]:
         stmt = select(BedroomModel).where(BedroomModel.id == bedroom_id)
         result = await self._session.execute(stmt)
@@ -33,7 +161,57 @@ class SQLAlchemyBedroomRepository(BedroomRepository):
         return bedroom_model.to_entity() if bedroom_model else None
 
     async def get_all_bedrooms(self) -> List["Bedroom"]:
-        stmt = select(BedroomModel)
+        result = await self._session.execute(select(*BEDROOM_COLUMNS))
+        return _hydrate(result)
+
+    async def get_available_bedrooms(
+        self, check_in: datetime, check_out: datetime
+    ) -> List["Bedroom"]:
+        # Anti-join: o NOT EXISTS é resolvido pelo índice de reservas por
+        # quarto (bedroom_id, check_in) / GiST, sem varrer todas as reservas.
+        occupied = exists().where(
+            ReservationModel.bedroom_id == BedroomModel.id,
+            ReservationModel.status != "cancelled",
+            ReservationModel.check_in < check_out,
+            ReservationModel.check_out > check_in,
+        )
+        stmt = select(*BEDROOM_COLUMNS).where(~occupied).order_by(BedroomModel.id)
+        result = await self._session.execute(stmt)
+        return _hydrate(result)
+
+    async def get_bedrooms_by_ids(self, bedroom_ids: List[str]) -> List["Bedroom"]:
+        stmt = select(*BEDROOM_COLUMNS).where(BedroomModel.id.in_(bedroom_ids))
+        result = await self._session.execute(stmt)
+        return _hydrate(result)
+
+    async def add_rate_override(self, override: "RateOverride") -> "RateOverride":
+        stmt = (
+            insert(BedroomRateModel)
+            .values(**BedroomRateModel.columns_from_entity(override))
+            .returning(BedroomRateModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one()
+        await self._session.commit()
+        return model.to_entity()
+
+    async def get_rate_overrides(
+        self, bedroom_ids: List[str], start: date, end: date
+    ) -> List["RateOverride"]:
+        stmt = (
+            select(BedroomRateModel)
+            .where(
+                BedroomRateModel.bedroom_id.in_(bedroom_ids),
+                or_(
+                    BedroomRateModel.start_date.is_(None),
+                    BedroomRateModel.start_date < end,
+                ),
+                or_(
+                    BedroomRateModel.end_date.is_(None),
+                    BedroomRateModel.end_date > start,
+                ),
+            )
+            .order_by(BedroomRateModel.priority, BedroomRateModel.id)
+        )
         result = await self._session.execute(stmt)
-        bedroom_models = result.scalars().all()
-        return [model.to_entity() for model in bedroom_models]
+        return [model.to_entity() for model in result.scalars().all()]
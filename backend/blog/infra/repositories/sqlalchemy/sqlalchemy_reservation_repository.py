@@ -1,27 +1,119 @@
-from typing import Optional, List, TYPE_CHECKING
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Optional, List, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete
+from sqlalchemy import delete, exists, insert, literal, or_, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import ColumnElement
 
-from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.repositories.reservation_repository import (
+    ReservationRepository,
+    ReservationPermissionError,
+    ReservationConflictError,
+)
+from blog.domain.entities.reservation import Reservation
+from blog.infra.cache.reservation_cache import invalidate_user_reservations
 from blog.infra.models.reservation_model import ReservationModel
 
-if TYPE_CHECKING:
-    from blog.domain.entities.reservation import Reservation
+# Colunas na ordem de Reservation.hydrate: as listagens leem Rows do Core e
+# montam as entidades direto das tuplas, sem ReservationModel nem identity map.
+RESERVATION_COLUMNS = (
+    ReservationModel.id,
+    ReservationModel.user_id,
+    ReservationModel.title,
+    ReservationModel.address,
+    ReservationModel.check_in,
+    ReservationModel.check_out,
+    ReservationModel.status,
+    ReservationModel.bedroom_id,
+)
+
+
+def _hydrate(rows: Iterable) -> List[Reservation]:
+    return [Reservation.hydrate(*row) for row in rows]
+
+
+# SQLSTATE de exclusion_violation (reservations_bedroom_no_overlap).
+EXCLUSION_VIOLATION = "23P01"
+
+
+def _overlapping(
+    bedroom_id: Union[str, None, ColumnElement[str]],
+    check_in: Union[datetime, ColumnElement[datetime]],
+    check_out: Union[datetime, ColumnElement[datetime]],
+    ignore_id: Union[str, None, ColumnElement[str]] = None,
+):
+    # Alias próprio: dentro de UPDATE reservations a subquery não pode ser
+    # correlacionada com a linha que está sendo alterada.
+    other = aliased(ReservationModel)
+    stmt = exists().where(
+        other.bedroom_id == bedroom_id,
+        other.status != "cancelled",
+        other.check_in < check_out,
+        other.check_out > check_in,
+    )
+    if ignore_id is not None:
+        stmt = stmt.where(other.id != ignore_id)
+    return stmt
+
+
+def _is_overlap_violation(error: IntegrityError) -> bool:
+    sqlstate = getattr(error.orig, "sqlstate", None) or getattr(
+        error.orig, "pgcode", None
+    )
+    return sqlstate == EXCLUSION_VIOLATION
 
 
 class SQLAlchemyReservationRepository(ReservationRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
 
+    async def _execute_guarded(self, stmt):
+        # A checagem NOT EXISTS cobre o caso comum num único statement; no
+        # Postgres a exclusion constraint resolve as corridas entre transações.
+        try:
+            return await self._session.execute(stmt)
+        except IntegrityError as e:
+            await self._session.rollback()
+            if _is_overlap_violation(e):
+                raise ReservationConflictError() from e
+            raise
+
     async def create_reservation(self, reservation: "Reservation") -> "Reservation":
-        model = ReservationModel.from_entity(reservation)
-        self._session.add(model)
+        values = ReservationModel.columns_from_entity(reservation)
+        stmt = insert(ReservationModel)
+        if reservation.blocks_bedroom:
+            columns = ReservationModel.__table__.c
+            guard = select(
+                *(literal(value, columns[name].type) for name, value in values.items())
+            ).where(
+                ~_overlapping(
+                    reservation.bedroom_id, reservation.check_in, reservation.check_out
+                )
+            )
+            stmt = stmt.from_select(list(values), guard)
+        else:
+            stmt = stmt.values(**values)
+        result = await self._execute_guarded(stmt.returning(ReservationModel))
+        model = result.scalar_one_or_none()
         await self._session.commit()
-        await self._session.refresh(model)
+        if model is None:
+            raise ReservationConflictError()
+        await invalidate_user_reservations(model.user_id)
         reservation.id = model.id
         return model.to_entity()
 
+    async def is_bedroom_available(
+        self,
+        bedroom_id: str,
+        check_in: datetime,
+        check_out: datetime,
+        ignore_id: Optional[str] = None,
+    ) -> bool:
+        stmt = select(_overlapping(bedroom_id, check_in, check_out, ignore_id))
+        return not await self._session.scalar(stmt)
+
     async def get_reservation_by_id(
         self, reservation_id: str
     ) -> Optional["Reservation"]:
@@ -31,38 +123,198 @@ class SQLAlchemyReservationRepository(ReservationRepository):
         return reservation_model.to_entity() if reservation_model else None
 
     async def get_reservations_by_user_id(self, user_id: str) -> List["Reservation"]:
-        stmt = select(ReservationModel).where(ReservationModel.user_id == user_id)
+        stmt = select(*RESERVATION_COLUMNS).where(ReservationModel.user_id == user_id)
         result = await self._session.execute(stmt)
-        reservation_models = result.scalars().all()
-        return [model.to_entity() for model in reservation_models]
+        return _hydrate(result)
 
     async def update_reservation(
-        self, reservation: "Reservation"
+        self,
+        reservation_id: str,
+        title: Optional[str] = None,
+        address: Optional[str] = None,
+        check_in: Optional[datetime] = None,
+        check_out: Optional[datetime] = None,
+        status: Optional[str] = None,
+    ) -> Optional[Tuple["Reservation", "Reservation"]]:
+        changes: Dict[str, Any] = {
+            name: value
+            for name, value in (
+                ("title", title),
+                ("address", address),
+                ("check_in", check_in),
+                ("check_out", check_out),
+                ("status", status),
+            )
+            if value is not None
+        }
+        columns = ReservationModel.__table__.c
+        new: Dict[str, ColumnElement[Any]] = {
+            name: (
+                literal(changes[name], columns[name].type)
+                if name in changes
+                else columns[name]
+            )
+            for name in ("check_in", "check_out", "status")
+        }
+        # Um único UPDATE ... RETURNING: a CTE trava a linha e guarda a versão
+        # anterior (para o calendário), e o WHERE valida as datas mescladas e
+        # a agenda do quarto. Só os campos informados são gravados.
+        previous = (
+            select(*RESERVATION_COLUMNS)
+            .where(ReservationModel.id == reservation_id)
+            .with_for_update()
+            .cte("previous")
+            .prefix_with("MATERIALIZED")
+        )
+        stmt = (
+            update(ReservationModel)
+            .where(
+                ReservationModel.id.in_(select(previous.c.id)),
+                new["check_out"] > new["check_in"],
+                or_(
+                    columns.bedroom_id.is_(None),
+                    new["status"] == "cancelled",
+                    ~_overlapping(
+                        columns.bedroom_id,
+                        new["check_in"],
+                        new["check_out"],
+                        ignore_id=columns.id,
+                    ),
+                ),
+            )
+            .values(**(changes or {"title": ReservationModel.title}))
+            .returning(
+                *RESERVATION_COLUMNS,
+                *(select(column).scalar_subquery() for column in previous.c),
+            )
+        )
+        result = await self._execute_guarded(stmt)
+        row = result.one_or_none()
+        await self._session.commit()
+        if row is not None:
+            updated = Reservation.hydrate(*row[: len(RESERVATION_COLUMNS)])
+            await invalidate_user_reservations(updated.user_id)
+            return Reservation.hydrate(*row[len(RESERVATION_COLUMNS) :]), updated
+        await self._raise_update_rejection(reservation_id, changes)
+        return None
+
+    async def _raise_update_rejection(self, reservation_id: str, changes: dict) -> None:
+        # Só roda quando o UPDATE não afetou nenhuma linha: distingue reserva
+        # inexistente (None), datas invertidas (400) e quarto ocupado (409).
+        reservation = await self.get_reservation_by_id(reservation_id)
+        if reservation is None:
+            return
+        reservation.update_reservation(
+            new_title=changes.get("title"),
+            new_address=changes.get("address"),
+            new_check_in_str=changes.get("check_in"),
+            new_check_out_str=changes.get("check_out"),
+            new_status=changes.get("status"),
+        )
+        if reservation.check_out <= reservation.check_in:
+            raise ValueError("Check-out must be after check-in.")
+        raise ReservationConflictError()
+
+    def _scoped(self, stmt, reservation_id: str, owner_id: Optional[str]):
+        stmt = stmt.where(ReservationModel.id == reservation_id)
+        if owner_id is not None:
+            stmt = stmt.where(ReservationModel.user_id == owner_id)
+        return stmt
+
+    async def _raise_if_exists(self, reservation_id: str) -> None:
+        # Só roda quando a escrita condicional não afetou nenhuma linha:
+        # distingue "não existe" (404) de "pertence a outro usuário" (403).
+        stmt = select(ReservationModel.id).where(ReservationModel.id == reservation_id)
+        result = await self._session.execute(stmt)
+        if result.scalar_one_or_none() is not None:
+            raise ReservationPermissionError()
+
+    async def cancel_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
     ) -> Optional["Reservation"]:
-        stmt = select(ReservationModel).where(ReservationModel.id == reservation.id)
+        stmt = self._scoped(update(ReservationModel), reservation_id, owner_id).values(
+            status="cancelled"
+        )
+        stmt = stmt.returning(ReservationModel).execution_options(
+            populate_existing=True
+        )
         result = await self._session.execute(stmt)
-        existing_model = result.scalar_one_or_none()
-
-        if existing_model:
-            existing_model.title = reservation.title
-            existing_model.address = reservation.address
-            existing_model.check_in = reservation.check_in
-            existing_model.check_out = reservation.check_out
-            existing_model.status = reservation.status
-
-            await self._session.commit()
-            await self._session.refresh(existing_model)
-            return existing_model.to_entity()
+        canceled_model = result.scalar_one_or_none()
+        await self._session.commit()
+        if canceled_model:
+            await invalidate_user_reservations(canceled_model.user_id)
+            return canceled_model.to_entity()
+        if owner_id is not None:
+            await self._raise_if_exists(reservation_id)
         return None
 
-    async def delete_reservation(self, reservation_id: str) -> bool:
-        stmt = delete(ReservationModel).where(ReservationModel.id == reservation_id)
-        result = await self._session.execute(stmt)
+    async def delete_reservation(
+        self, reservation_id: str, owner_id: Optional[str] = None
+    ) -> Optional["Reservation"]:
+        # DELETE ... RETURNING: a linha removida volta no mesmo comando.
+        stmt = self._scoped(delete(ReservationModel), reservation_id, owner_id)
+        result = await self._session.execute(stmt.returning(*RESERVATION_COLUMNS))
+        deleted = _hydrate(result)
         await self._session.commit()
-        return result.rowcount > 0
+        if deleted:
+            await invalidate_user_reservations(deleted[0].user_id)
+            return deleted[0]
+        if owner_id is not None:
+            await self._raise_if_exists(reservation_id)
+        return None
 
     async def get_all_reservations(self) -> List["Reservation"]:
-        stmt = select(ReservationModel)
+        result = await self._session.execute(select(*RESERVATION_COLUMNS))
+        return _hydrate(result)
+
+    async def list_reservations_page(
+        self,
+        limit: int,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+    ) -> List["Reservation"]:
+        stmt = select(*RESERVATION_COLUMNS)
+        if user_id is not None:
+            stmt = stmt.where(ReservationModel.user_id == user_id)
+        if status is not None:
+            stmt = stmt.where(ReservationModel.status == status)
+        if check_in_from is not None:
+            stmt = stmt.where(ReservationModel.check_in >= check_in_from)
+        if check_in_to is not None:
+            stmt = stmt.where(ReservationModel.check_in < check_in_to)
+        if after is not None:
+            # Tipos explícitos: o id do cursor precisa ser comparado como uuid.
+            key = (ReservationModel.check_in, ReservationModel.id)
+            stmt = stmt.where(
+                tuple_(*key) > tuple_(*after, types=[column.type for column in key])
+            )
+        stmt = stmt.order_by(ReservationModel.check_in, ReservationModel.id).limit(
+            limit
+        )
         result = await self._session.execute(stmt)
-        reservation_models = result.scalars().all()
-        return [model.to_entity() for model in reservation_models]
+        return _hydrate(result)
+
+    async def stream_reservations(
+        self,
+        chunk_size: int,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        check_out_after: Optional[datetime] = None,
+    ) -> AsyncIterator[List["Reservation"]]:
+        # Cursor no servidor (yield_per): só um bloco de linhas fica em memória.
+        stmt = select(*RESERVATION_COLUMNS)
+        if check_in_from is not None:
+            stmt = stmt.where(ReservationModel.check_in >= check_in_from)
+        if check_in_to is not None:
+            stmt = stmt.where(ReservationModel.check_in < check_in_to)
+        if check_out_after is not None:
+            stmt = stmt.where(ReservationModel.check_out > check_out_after)
+        stmt = stmt.order_by(
+            ReservationModel.check_in, ReservationModel.id
+        ).execution_options(yield_per=chunk_size)
+        result = await self._session.stream(stmt)
+        async for partition in result.partitions():
+            yield _hydrate(partition)
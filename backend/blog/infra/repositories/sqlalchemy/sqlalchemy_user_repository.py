@@ -1,35 +1,89 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import func, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
 
 from blog.domain.entities.user import User
 from blog.domain.repositories.user_repository import UserRepository
+from blog.domain.services.password_hasher import PasswordHasher
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password
 from blog.infra.models.user_model import UserModel
 
+from blog.infra.cache.principal_cache import invalidate_principal
 from blog.infra.database import async_session
+from blog.infra.services.process_pool_password_hasher import password_hasher
+
+# Hash bcrypt descartável: e-mails inexistentes também pagam exatamente um
+# verify, para que o tempo de resposta não revele quais contas existem.
+DUMMY_PASSWORD_HASH = "$2b$12$M2umlxuSaxTB0oilG4.d/OWSOKh2n2e3Zr3dAOOLRhUzHODHB19ua"
+
+
+def _email_matches(email: Email):
+    # Mesma expressão do índice ix_users_email_lower, para o planner usá-lo.
+    return func.lower(UserModel.email) == str(email).lower()
 
 
 class SQLAlchemyUserRepository(UserRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, hasher: PasswordHasher = password_hasher):
         self._session = session
+        self._hasher = hasher
         self._current_user: Optional[User] = None
 
     async def register(self, user: User) -> User:
-        model = UserModel.from_entity(user)
-        self._session.add(model)
+        stmt = (
+            insert(UserModel)
+            .values(**UserModel.columns_from_entity(user))
+            .returning(UserModel)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one()
         await self._session.commit()
-        await self._session.refresh(model)
         user.id = model.id
         return model.to_entity()
 
+    async def register_many(self, users: List[User]) -> List[str]:
+        if not users:
+            return []
+        connection = await self._session.connection()
+        dialect_insert = (
+            postgresql.insert
+            if connection.dialect.name == "postgresql"
+            else sqlite.insert
+        )
+        users_table = UserModel.__table__
+        # Lote multi-row (insertmanyvalues); e-mails criados por outra
+        # requisição entre a checagem e o insert são ignorados, não abortam.
+        stmt = (
+            dialect_insert(users_table)
+            .on_conflict_do_nothing()
+            .returning(users_table.c.email)
+        )
+        result = await self._session.execute(
+            stmt, [UserModel.columns_from_entity(user) for user in users]
+        )
+        registered = [email.lower() for email in result.scalars()]
+        await self._session.commit()
+        return registered
+
+    async def get_existing_emails(self, emails: List[Email]) -> Set[str]:
+        if not emails:
+            return set()
+        lowered = func.lower(UserModel.email)
+        stmt = select(lowered).where(
+            lowered.in_({str(email).lower() for email in emails})
+        )
+        result = await self._session.execute(stmt)
+        return set(result.scalars())
+
     async def login(self, email: Email, password: Password) -> Optional[User]:
-        stmt = select(UserModel).where(UserModel.email == str(email))
+        stmt = select(UserModel).where(_email_matches(email))
         result = await self._session.execute(stmt)
         user = result.scalar_one_or_none()
 
-        if user and password.verify(user.password):
+        stored_hash = user.password if user else DUMMY_PASSWORD_HASH
+        if await password.verify_with(self._hasher, stored_hash) and user:
             self._current_user = user.to_entity()
             return self._current_user
         return None
@@ -53,7 +107,7 @@ class SQLAlchemyUserRepository(UserRepository):
         self._current_user = None
 
     async def get_by_email(self, email: Email) -> Optional[User]:
-        stmt = select(UserModel).where(UserModel.email == str(email))
+        stmt = select(UserModel).where(_email_matches(email))
         result = await self._session.execute(stmt)
         user_model = result.scalar_one_or_none()
         return user_model.to_entity() if user_model else None
@@ -63,3 +117,33 @@ class SQLAlchemyUserRepository(UserRepository):
         result = await self._session.execute(stmt)
         user_model = result.scalar_one_or_none()
         return user_model.to_entity() if user_model else None
+
+    async def get_token_version(self, id: str) -> Optional[int]:
+        stmt = select(UserModel.token_version).where(UserModel.id == str(id))
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update_credentials(
+        self, id: str, password: Optional[Password] = None, role: Optional[str] = None
+    ) -> Optional[User]:
+        values: Dict[str, Any] = {"token_version": UserModel.token_version + 1}
+        if password is not None:
+            values["password"] = str(await password.hash_with(self._hasher))
+        if role is not None:
+            values["role"] = role
+        # UPDATE do Core: os eventos de mapper (before_update/after_update) não
+        # rodam, então a versão e a invalidação do cache ficam explícitas aqui.
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == str(id))
+            .values(**values)
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        model = result.scalar_one_or_none()
+        await self._session.commit()
+        if model is None:
+            return None
+        await invalidate_principal(model.id)
+        return model.to_entity()
@@ -0,0 +1,125 @@
+import argparse
+import asyncio
+import csv
+import json
+import re
+import unicodedata
+import uuid
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from blog.domain.value_objects.money import Money
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+from blog.infra.models.bedroom_model import BedroomModel
+
+# Chave do pg_advisory_xact_lock: com vários workers subindo juntos, só um
+# semeia por vez e os demais encontram tudo já inserido (ON CONFLICT).
+SEED_LOCK_KEY = 7_205_183_114
+
+# Namespace dos ids derivados do código: o mesmo quarto tem o mesmo id em
+# qualquer ambiente.
+CATALOG_NAMESPACE = uuid.UUID("6f1c9a52-3d7e-4b0a-9c51-2e8d4f7a1b63")
+
+CATALOG_FORMATS = (".json", ".csv")
+
+
+def slugify(text: str) -> str:
+    ascii_text = (
+        unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    )
+    return re.sub(r"[^a-z0-9]+", "-", ascii_text.lower()).strip("-")
+
+
+def catalog_id(code: str) -> str:
+    return str(uuid.uuid5(CATALOG_NAMESPACE, code))
+
+
+def catalog_row(record: Dict[str, Any]) -> Dict[str, Any]:
+    # "code" é a chave natural do catálogo; sem ele, vale o título normalizado.
+    code = record.get("code") or slugify(record["title"])
+    price_cents = record.get("price_cents")
+    if price_cents in (None, ""):
+        price_cents = Money.parse(record["price"]).cents
+    return {
+        "id": catalog_id(code),
+        "code": code,
+        "title": record["title"],
+        "description": record["description"],
+        "price_cents": int(price_cents),
+        "currency": record.get("currency") or "BRL",
+        "image": record["image"],
+    }
+
+
+def read_catalog(path: str) -> Iterator[Dict[str, Any]]:
+    suffix = Path(path).suffix.lower()
+    if suffix not in CATALOG_FORMATS:
+        raise ValueError(f"Unsupported catalog format: {suffix or path}")
+    with open(path, encoding="utf-8", newline="") as file:
+        if suffix == ".csv":
+            yield from csv.DictReader(file)
+        else:
+            yield from json.load(file)
+
+
+def batched(
+    rows: Iterable[Dict[str, Any]], size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _insert_ignoring_conflicts(dialect: str):
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    return (
+        insert(BedroomModel.__table__)
+        .on_conflict_do_nothing()
+        .returning(BedroomModel.__table__.c.id)
+    )
+
+
+async def seed_bedrooms(
+    session: AsyncSession, records: Iterable[Dict[str, Any]], batch_size: int
+) -> int:
+    """Insere o catálogo em lotes multi-row; retorna quantos quartos eram novos."""
+    connection = await session.connection()
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        await session.execute(select(func.pg_advisory_xact_lock(SEED_LOCK_KEY)))
+
+    # executemany com RETURNING: o SQLAlchemy agrupa cada lote num único
+    # INSERT ... VALUES (...), (...) ON CONFLICT DO NOTHING (insertmanyvalues).
+    stmt = _insert_ignoring_conflicts(dialect).execution_options(
+        insertmanyvalues_page_size=batch_size
+    )
+    inserted = 0
+    for batch in batched(map(catalog_row, records), batch_size):
+        result = await session.execute(stmt, batch)
+        inserted += len(result.all())
+    await session.commit()
+    if inserted:
+        await bedroom_catalog_cache.clear()
+    return inserted
+
+
+async def _main(path: str, batch_size: int) -> None:
+    from blog.infra.database import async_session, engine
+
+    async with async_session() as session:
+        inserted = await seed_bedrooms(session, read_catalog(path), batch_size)
+    await engine.dispose()
+    print(f"{inserted} quartos novos importados de {path}.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa um catálogo de quartos.")
+    parser.add_argument("path", help="Arquivo .json (lista) ou .csv do catálogo")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(_main(args.path, args.batch_size))
@@ -0,0 +1,116 @@
+import asyncio
+from array import array
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from blog.domain.entities.reservation import Reservation
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
+
+type Bitmaps = Dict[Tuple[str, int], array]
+
+DAYS_PER_BITMAP = 366
+
+
+def _day_of_year(day: date) -> int:
+    return day.timetuple().tm_yday - 1
+
+
+def _nights(check_in: datetime, check_out: datetime) -> Iterator[Tuple[int, int, int]]:
+    """Divide as noites [check_in, check_out) em trechos (ano, início, fim) por ano."""
+    first = check_in.date()
+    last = max(check_out.date(), first + timedelta(days=1)) - timedelta(days=1)
+    for year in range(first.year, last.year + 1):
+        start = first if year == first.year else date(year, 1, 1)
+        end = last if year == last.year else date(year, 12, 31)
+        yield year, _day_of_year(start), _day_of_year(end) + 1
+
+
+class BitmapOccupancyCalendar(OccupancyCalendar):
+    """Ocupação diária por quarto, mantida em memória pelo processo da API.
+
+    Cada (quarto, ano) tem um ``array('B')`` de 366 posições (1 = noite ocupada).
+    Como a agenda não aceita estadias sobrepostas, marcar e desmarcar noites é
+    idempotente e a visão de um mês é só uma fatia do array.
+
+    O estado não é compartilhado entre workers: um worker não enxerga as
+    reservas gravadas pelos outros até a próxima recarga (na subida, pelo
+    endpoint interno ou, se ligada, a cada ``OCCUPANCY_CALENDAR_REFRESH_SECONDS``).
+    Onde isso não é aceitável, rode um único worker.
+    """
+
+    def __init__(self) -> None:
+        self._bitmaps: Bitmaps = {}
+        self._rebuilding = asyncio.Lock()
+        # Marcações feitas durante uma recarga, reaplicadas sobre o estado novo.
+        self._pending: Optional[List[Tuple[Reservation, int]]] = None
+
+    @staticmethod
+    def _mark(bitmaps: Bitmaps, reservation: Reservation, value: int) -> None:
+        if reservation.bedroom_id is None:
+            return
+        for year, start, end in _nights(reservation.check_in, reservation.check_out):
+            key = (reservation.bedroom_id, year)
+            bitmap = bitmaps.get(key)
+            if bitmap is None:
+                if not value:
+                    continue
+                bitmap = bitmaps[key] = array("B", bytes(DAYS_PER_BITMAP))
+            bitmap[start:end] = array("B", bytes([value]) * (end - start))
+
+    def _apply(self, reservation: Reservation, value: int) -> None:
+        self._mark(self._bitmaps, reservation, value)
+        if self._pending is not None:
+            self._pending.append((reservation, value))
+
+    def occupy(self, reservation: Reservation) -> None:
+        if reservation.blocks_bedroom:
+            self._apply(reservation, 1)
+
+    def release(self, reservation: Reservation) -> None:
+        if reservation.bedroom_id is not None:
+            self._apply(reservation, 0)
+
+    def month(self, bedroom_id: str, year: int, month: int) -> List[bool]:
+        days = monthrange(year, month)[1]
+        bitmap = self._bitmaps.get((bedroom_id, year))
+        if bitmap is None:
+            return [False] * days
+        start = _day_of_year(date(year, month, 1))
+        return [bool(night) for night in bitmap[start : start + days]]
+
+    async def rebuild(self, chunks: AsyncIterator[List[Reservation]]) -> int:
+        """Recria os bitmaps a partir das reservas e troca o estado de uma vez.
+
+        Reservas gravadas enquanto a carga lê o banco podem ter ficado fora da
+        leitura: as marcações feitas nesse meio-tempo são reaplicadas, na
+        ordem, antes da troca.
+        """
+        async with self._rebuilding:
+            bitmaps: Bitmaps = {}
+            occupied = 0
+            self._pending = []
+            try:
+                async for chunk in chunks:
+                    for reservation in chunk:
+                        if reservation.blocks_bedroom:
+                            self._mark(bitmaps, reservation, 1)
+                            occupied += 1
+                for reservation, value in self._pending:
+                    self._mark(bitmaps, reservation, value)
+                self._bitmaps = bitmaps
+            finally:
+                self._pending = None
+            return occupied
+
+    def clear(self) -> None:
+        self._bitmaps.clear()
+
+    def stats(self) -> dict:
+        return {
+            "bitmaps": len(self._bitmaps),
+            "bytes": len(self._bitmaps) * DAYS_PER_BITMAP,
+        }
+
+
+occupancy_calendar = BitmapOccupancyCalendar()
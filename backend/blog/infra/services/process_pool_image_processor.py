@@ -0,0 +1,91 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from blog.api.settings import settings
+from blog.domain.entities.bedroom import ImageVariants
+from blog.domain.services.image_processor import ImageProcessor
+from blog.infra.services.image_derivatives import derive_file, store_image
+
+STATIC_URL = "/static"
+DERIVED_DIR = "derived"
+
+
+class ProcessPoolImageProcessor(ImageProcessor):
+    """Decodifica e recodifica as fotos em um pool de processos dedicado.
+
+    Originais e variantes ficam em `<static_dir>/derived`, com o sha256 do
+    conteúdo no nome (cache imutável no StaticFiles). Com ``max_workers=0`` o
+    trabalho vai para o executor padrão de threads do loop.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        static_dir: str,
+        widths: List[int],
+        formats: List[str],
+        quality: int,
+    ):
+        self._max_workers = max_workers
+        self._executor: Optional[Executor] = None
+        self._static_dir = Path(static_dir).resolve()
+        self._options = (
+            str(self._static_dir / DERIVED_DIR),
+            f"{STATIC_URL}/{DERIVED_DIR}",
+            tuple(widths),
+            tuple(formats),
+            quality,
+        )
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self._max_workers <= 0:
+            return None
+        if self._executor is None:
+            # spawn: fork em um processo com threads (uvicorn, asyncpg) pode travar.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def local_path(self, image: str) -> Optional[Path]:
+        """/static/images/q.png -> arquivo dentro de static_dir (ou None)."""
+        if not image.startswith(f"{STATIC_URL}/"):
+            return None
+        path = (self._static_dir / image[len(STATIC_URL) + 1 :]).resolve()
+        if not path.is_relative_to(self._static_dir) or not path.is_file():
+            return None
+        return path
+
+    async def store(self, data: bytes) -> Tuple[str, ImageVariants]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(store_image, data, *self._options)
+        )
+
+    async def derive(self, image: str) -> Optional[ImageVariants]:
+        path = self.local_path(image)
+        if path is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(derive_file, str(path), *self._options)
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+image_processor = ProcessPoolImageProcessor(
+    settings.IMAGE_WORKERS,
+    static_dir=settings.STATIC_DIR,
+    widths=settings.IMAGE_VARIANT_WIDTHS,
+    formats=settings.IMAGE_VARIANT_FORMATS,
+    quality=settings.IMAGE_VARIANT_QUALITY,
+)
@@ -0,0 +1,87 @@
+import asyncio
+import math
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Optional
+
+from blog.api.security import get_password_hash, get_password_hashes, verify_password
+from blog.api.settings import settings
+from blog.domain.services.password_hasher import PasswordHasher
+
+
+class ProcessPoolPasswordHasher(PasswordHasher):
+    """Executa o bcrypt fora do event loop, em um pool de processos dedicado.
+
+    ``hash_many`` (importações em massa) usa um segundo pool, de
+    ``bulk_workers`` processos, para não disputar os workers do login.
+    Com ``max_workers=0`` o trabalho vai para o executor padrão de threads do loop,
+    útil em testes e em ambientes que não permitem criar processos.
+    """
+
+    def __init__(self, max_workers: int, bulk_workers: int = 1):
+        self._max_workers = max_workers
+        self._bulk_workers = bulk_workers
+        self._executor: Optional[Executor] = None
+        self._bulk_executor: Optional[Executor] = None
+
+    def _new_executor(self, max_workers: int) -> Executor:
+        # spawn: fork em um processo com threads (uvicorn, asyncpg) pode travar.
+        return ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self._max_workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = self._new_executor(self._max_workers)
+        return self._executor
+
+    def _get_bulk_executor(self) -> Optional[Executor]:
+        if self._max_workers <= 0 or self._bulk_workers <= 0:
+            return None
+        if self._bulk_executor is None:
+            self._bulk_executor = self._new_executor(self._bulk_workers)
+        return self._bulk_executor
+
+    async def hash(self, plain_password: str) -> str:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), get_password_hash, plain_password
+        )
+
+    async def hash_many(self, plain_passwords: List[str]) -> List[str]:
+        # Algumas tarefas por worker do pool de massa, cada uma com uma fatia
+        # das senhas: sem uma ida e volta entre processos por hash.
+        loop = asyncio.get_running_loop()
+        executor = self._get_bulk_executor()
+        tasks = max(self._bulk_workers, 1) * 4
+        size = max(1, math.ceil(len(plain_passwords) / tasks))
+        chunks = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, get_password_hashes, plain_passwords[i : i + size]
+                )
+                for i in range(0, len(plain_passwords), size)
+            )
+        )
+        return [hashed for chunk in chunks for hashed in chunk]
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), verify_password, plain_password, hashed_password
+        )
+
+    def shutdown(self) -> None:
+        for executor in (self._executor, self._bulk_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._executor = None
+        self._bulk_executor = None
+
+
+password_hasher = ProcessPoolPasswordHasher(
+    settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_BULK_HASH_WORKERS
+)
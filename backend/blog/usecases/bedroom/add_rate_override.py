@@ -0,0 +1,12 @@
+from blog.domain.entities.rate_override import RateOverride
+from blog.domain.repositories.bedroom_repository import BedroomRepository
+
+
+class AddRateOverride:
+    def __init__(self, bedroom_repo: BedroomRepository):
+        self._bedroom_repo = bedroom_repo
+
+    async def execute(self, override: RateOverride) -> RateOverride:
+        if not await self._bedroom_repo.get_bedroom_by_id(override.bedroom_id):
+            raise ValueError("Bedroom not found.")
+        return await self._bedroom_repo.add_rate_override(override)
@@ -0,0 +1,97 @@
+import asyncio
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from blog.domain.entities.bedroom import Bedroom
+from blog.domain.repositories.bedroom_repository import (
+    BedroomRepository,
+    BedroomImportError,
+)
+from blog.domain.services.image_processor import ImageProcessor
+
+# Linha do arquivo -> quarto validado ou mensagem de erro da validação.
+type ImportRow = Tuple[int, Union[Bedroom, str]]
+
+
+def _take(rows: Iterator[ImportRow], size: int) -> List[ImportRow]:
+    return list(islice(rows, size))
+
+
+class BedroomImportReport:
+    def __init__(self, max_errors: int):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.elapsed_seconds = 0.0
+        self.errors: List[Tuple[int, str]] = []
+        self._max_errors = max_errors
+
+    def fail(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < self._max_errors:
+            self.errors.append((line, message))
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BulkImportBedrooms:
+    def __init__(
+        self,
+        bedroom_repo: BedroomRepository,
+        image_processor: Optional[ImageProcessor] = None,
+    ):
+        self._bedroom_repo = bedroom_repo
+        self._image_processor = image_processor
+
+    async def execute(
+        self, rows: Iterable[ImportRow], chunk_size: int, max_errors: int = 1000
+    ) -> BedroomImportReport:
+        report = BedroomImportReport(max_errors)
+        started = time.perf_counter()
+        iterator = iter(rows)
+        # Ler e validar um lote é CPU puro: roda numa thread, fora do event loop.
+        while chunk := await asyncio.to_thread(_take, iterator, chunk_size):
+            report.rows += len(chunk)
+            valid: Dict[str, Tuple[int, Bedroom]] = {}
+            for line, row in chunk:
+                if isinstance(row, str):
+                    report.fail(line, row)
+                    continue
+                # Código repetido no mesmo lote: vale a última ocorrência.
+                code = row.code or ""
+                if code in valid:
+                    report.fail(valid[code][0], f"Duplicate code '{code}'.")
+                valid[code] = (line, row)
+            await self._load(list(valid.values()), report)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def _load(
+        self, chunk: List[Tuple[int, Bedroom]], report: BedroomImportReport
+    ) -> None:
+        if not chunk:
+            return
+        if self._image_processor is not None:
+            # Uma geração por imagem distinta do lote, em paralelo no pool.
+            variants = await self._image_processor.derive_many(
+                [bedroom.image for _, bedroom in chunk]
+            )
+            for _, bedroom in chunk:
+                bedroom.image_variants = variants[bedroom.image]
+        try:
+            report.imported += await self._bedroom_repo.bulk_import_bedrooms(
+                [bedroom for _, bedroom in chunk]
+            )
+        except BedroomImportError:
+            # O banco recusou o lote: reenvia linha a linha só para isolar as
+            # linhas culpadas, sem abortar o restante da importação.
+            for line, bedroom in chunk:
+                try:
+                    report.imported += await self._bedroom_repo.bulk_import_bedrooms(
+                        [bedroom]
+                    )
+                except BedroomImportError as e:
+                    report.fail(line, str(e))
@@ -0,0 +1,15 @@
+from typing import List
+from datetime import datetime
+
+from blog.domain.entities.bedroom import Bedroom
+from blog.domain.repositories.bedroom_repository import BedroomRepository
+
+
+class ListAvailableBedroom:
+    def __init__(self, bedroom_repo: BedroomRepository):
+        self._bedroom_repo = bedroom_repo
+
+    async def execute(self, check_in: datetime, check_out: datetime) -> List[Bedroom]:
+        if check_out <= check_in:
+            raise ValueError("Check-out must be after check-in.")
+        return await self._bedroom_repo.get_available_bedrooms(check_in, check_out)
@@ -0,0 +1,30 @@
+from typing import List, Optional
+
+from blog.domain.repositories.bedroom_repository import BedroomRepository
+from blog.domain.services.stay_pricing import Stay, StayPricer, StayQuote
+
+
+class QuoteStays:
+    def __init__(
+        self, bedroom_repo: BedroomRepository, max_window_days: Optional[int] = None
+    ):
+        self._bedroom_repo = bedroom_repo
+        self._max_window_days = max_window_days
+
+    async def execute(self, stays: List[Stay]) -> List[StayQuote]:
+        if not stays:
+            return []
+        bedroom_ids = list({bedroom_id for bedroom_id, _, _ in stays})
+        start = min(check_in for _, check_in, _ in stays)
+        end = max(check_out for _, _, check_out in stays)
+        # O preço é montado noite a noite sobre a janela do lote: limita a memória.
+        if self._max_window_days is not None and (
+            (end - start).days > self._max_window_days
+        ):
+            raise ValueError(
+                f"Stays must fit in a window of {self._max_window_days} days."
+            )
+        # Duas consultas para o lote inteiro, independente do número de estadias.
+        bedrooms = await self._bedroom_repo.get_bedrooms_by_ids(bedroom_ids)
+        overrides = await self._bedroom_repo.get_rate_overrides(bedroom_ids, start, end)
+        return StayPricer(bedrooms, overrides).quote(stays)
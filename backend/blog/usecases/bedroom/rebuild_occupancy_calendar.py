@@ -0,0 +1,23 @@
+from typing import Optional
+from datetime import datetime
+
+from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
+
+
+class RebuildOccupancyCalendar:
+    def __init__(
+        self, reservation_repo: ReservationRepository, calendar: OccupancyCalendar
+    ):
+        self._reservation_repo = reservation_repo
+        self._calendar = calendar
+
+    async def execute(
+        self, since: Optional[datetime] = None, chunk_size: int = 1000
+    ) -> int:
+        # Estadias que ainda ocupam alguma noite a partir de `since`, inclusive
+        # as que começaram antes dele.
+        chunks = self._reservation_repo.stream_reservations(
+            chunk_size, check_out_after=since
+        )
+        return await self._calendar.rebuild(chunks)
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from blog.domain.entities.bedroom import Bedroom
+from blog.domain.repositories.bedroom_repository import BedroomRepository
+from blog.domain.services.image_processor import ImageProcessor
+
+
+class UpdateBedroomImage:
+    def __init__(
+        self, bedroom_repo: BedroomRepository, image_processor: ImageProcessor
+    ):
+        self._bedroom_repo = bedroom_repo
+        self._image_processor = image_processor
+
+    async def execute(self, bedroom_id: str, data: bytes) -> Optional[Bedroom]:
+        if not await self._bedroom_repo.get_bedroom_by_id(bedroom_id):
+            return None
+        image, variants = await self._image_processor.store(data)
+        return await self._bedroom_repo.update_bedroom_image(
+            bedroom_id, image, variants
+        )
@@ -2,15 +2,24 @@ from typing import Optional
 
 from blog.domain.entities.reservation import Reservation
 from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
 
 
 class CancelReservation:
-    def __init__(self, reservation_repo: ReservationRepository):
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        calendar: Optional[OccupancyCalendar] = None,
+    ):
         self._reservation_repo = reservation_repo
+        self._calendar = calendar
 
-    async def execute(self, reservation_id: str) -> Optional[Reservation]:
-        reservation = await self._reservation_repo.get_reservation_by_id(reservation_id)
-        if reservation:
-            reservation.cancel_reservation()
-            return await self._reservation_repo.update_reservation(reservation)
-        return None
+    async def execute(
+        self, reservation_id: str, owner_id: Optional[str] = None
+    ) -> Optional[Reservation]:
+        reservation = await self._reservation_repo.cancel_reservation(
+            reservation_id, owner_id
+        )
+        if reservation and self._calendar is not None:
+            self._calendar.release(reservation)
+        return reservation
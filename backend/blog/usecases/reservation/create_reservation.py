@@ -4,14 +4,22 @@ from datetime import datetime
 from blog.domain.entities.reservation import Reservation
 from blog.domain.repositories.reservation_repository import ReservationRepository
 from blog.domain.repositories.user_repository import UserRepository
+from blog.domain.repositories.bedroom_repository import BedroomRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
 
 
 class CreateReservation:
     def __init__(
-        self, reservation_repo: ReservationRepository, user_repo: UserRepository
+        self,
+        reservation_repo: ReservationRepository,
+        user_repo: UserRepository,
+        bedroom_repo: Optional[BedroomRepository] = None,
+        calendar: Optional[OccupancyCalendar] = None,
     ):
         self._reservation_repo = reservation_repo
         self._user_repo = user_repo
+        self._bedroom_repo = bedroom_repo
+        self._calendar = calendar
 
     async def execute(
         self,
@@ -20,11 +28,16 @@ class CreateReservation:
         address: str,
         check_in_str: str,
         check_out_str: str,
+        bedroom_id: Optional[str] = None,
     ) -> Reservation:
         user = await self._user_repo.get_by_id(user_id)
         if not user:
             raise ValueError("User not found.")
 
+        if bedroom_id is not None and self._bedroom_repo is not None:
+            if not await self._bedroom_repo.get_bedroom_by_id(bedroom_id):
+                raise ValueError("Bedroom not found.")
+
         new_reservation = Reservation(
             id=None,
             user_id=user_id,
@@ -33,5 +46,11 @@ class CreateReservation:
             check_in=check_in_str,
             check_out=check_out_str,
             status="Pendente",
+            bedroom_id=bedroom_id,
         )
-        return await self._reservation_repo.create_reservation(new_reservation)
+        if new_reservation.check_out <= new_reservation.check_in:
+            raise ValueError("Check-out must be after check-in.")
+        reservation = await self._reservation_repo.create_reservation(new_reservation)
+        if self._calendar is not None:
+            self._calendar.occupy(reservation)
+        return reservation
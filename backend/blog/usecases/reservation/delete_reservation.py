@@ -1,9 +1,24 @@
+from typing import Optional
+
 from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
 
 
 class DeleteReservation:
-    def __init__(self, reservation_repo: ReservationRepository):
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        calendar: Optional[OccupancyCalendar] = None,
+    ):
         self._reservation_repo = reservation_repo
+        self._calendar = calendar
 
-    async def execute(self, reservation_id: str) -> bool:
-        return await self._reservation_repo.delete_reservation(reservation_id)
+    async def execute(
+        self, reservation_id: str, owner_id: Optional[str] = None
+    ) -> bool:
+        deleted = await self._reservation_repo.delete_reservation(
+            reservation_id, owner_id
+        )
+        if deleted is not None and self._calendar is not None:
+            self._calendar.release(deleted)
+        return deleted is not None
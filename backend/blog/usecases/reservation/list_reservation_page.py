@@ -0,0 +1,34 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from blog.domain.entities.reservation import Reservation
+from blog.domain.repositories.reservation_repository import ReservationRepository
+
+
+class ListReservationPage:
+    def __init__(self, reservation_repo: ReservationRepository):
+        self._reservation_repo = reservation_repo
+
+    async def execute(
+        self,
+        limit: int,
+        user_id: Optional[str] = None,
+        status: Optional[str] = None,
+        check_in_from: Optional[datetime] = None,
+        check_in_to: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, str]] = None,
+    ) -> Tuple[List[Reservation], Optional[Tuple[datetime, str]]]:
+        # Busca um item a mais só para saber se existe próxima página.
+        reservations = await self._reservation_repo.list_reservations_page(
+            limit=limit + 1,
+            user_id=user_id,
+            status=status,
+            check_in_from=check_in_from,
+            check_in_to=check_in_to,
+            after=after,
+        )
+        if len(reservations) <= limit:
+            return reservations, None
+        page = reservations[:limit]
+        last = page[-1]
+        return page, (last.check_in, last.id)
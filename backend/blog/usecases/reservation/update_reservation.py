@@ -1,13 +1,18 @@
 from typing import Optional
-from datetime import datetime
 
-from blog.domain.entities.reservation import Reservation
+from blog.domain.entities.reservation import Reservation, parse_datetime
 from blog.domain.repositories.reservation_repository import ReservationRepository
+from blog.domain.services.occupancy_calendar import OccupancyCalendar
 
 
 class UpdateReservation:
-    def __init__(self, reservation_repo: ReservationRepository):
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        calendar: Optional[OccupancyCalendar] = None,
+    ):
         self._reservation_repo = reservation_repo
+        self._calendar = calendar
 
     async def execute(
         self,
@@ -18,14 +23,20 @@ class UpdateReservation:
         new_check_out_str: Optional[str] = None,
         new_status: Optional[str] = None,
     ) -> Optional[Reservation]:
-        reservation = await self._reservation_repo.get_reservation_by_id(reservation_id)
-        if reservation:
-            reservation.update_reservation(
-                new_title=new_title,
-                new_address=new_address,
-                new_check_in_str=new_check_in_str,
-                new_check_out_str=new_check_out_str,
-                new_status=new_status,
-            )
-            return await self._reservation_repo.update_reservation(reservation)
-        return None
+        # Mescla e validação acontecem no próprio UPDATE do repositório: sem
+        # leitura prévia, escritas concorrentes em outros campos não se perdem.
+        result = await self._reservation_repo.update_reservation(
+            reservation_id,
+            title=new_title,
+            address=new_address,
+            check_in=parse_datetime(new_check_in_str) if new_check_in_str else None,
+            check_out=parse_datetime(new_check_out_str) if new_check_out_str else None,
+            status=new_status,
+        )
+        if result is None:
+            return None
+        previous, updated = result
+        if self._calendar is not None:
+            self._calendar.release(previous)
+            self._calendar.occupy(updated)
+        return updated
@@ -0,0 +1,64 @@
+import time
+from typing import Dict, List
+
+from blog.domain.entities.user import User
+from blog.domain.repositories.user_repository import UserRepository
+from blog.domain.services.password_hasher import PasswordHasher
+from blog.domain.value_objects.password import Password
+
+
+class BulkRegisterReport:
+    def __init__(self) -> None:
+        self.received = 0
+        self.registered = 0
+        self.duplicates: List[str] = []
+        self.elapsed_seconds = 0.0
+
+    @property
+    def users_per_second(self) -> float:
+        return self.registered / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+class BulkRegisterUsers:
+    """Cadastro em massa: por lote, uma consulta de e-mails existentes, um
+    hash_many para as senhas em texto e um insert multi-row."""
+
+    def __init__(self, repository: UserRepository, hasher: PasswordHasher):
+        self.repository = repository
+        self.hasher = hasher
+
+    async def execute(self, users: List[User], batch_size: int) -> BulkRegisterReport:
+        report = BulkRegisterReport()
+        started = time.perf_counter()
+        for offset in range(0, len(users), batch_size):
+            await self._register_batch(users[offset : offset + batch_size], report)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def _register_batch(
+        self, batch: List[User], report: BulkRegisterReport
+    ) -> None:
+        report.received += len(batch)
+        unique: Dict[str, User] = {}
+        for user in batch:
+            email = str(user.email).lower()
+            if email in unique:
+                report.duplicates.append(str(user.email))
+            else:
+                unique[email] = user
+
+        existing = await self.repository.get_existing_emails(
+            [user.email for user in unique.values()]
+        )
+        fresh = [user for email, user in unique.items() if email not in existing]
+        report.duplicates += [str(unique[email].email) for email in existing]
+
+        # Só paga bcrypt quem de fato vai ser inserido.
+        await Password.hash_many([user.password for user in fresh], self.hasher)
+        registered = set(await self.repository.register_many(fresh))
+        report.registered += len(registered)
+        report.duplicates += [
+            str(user.email)
+            for user in fresh
+            if str(user.email).lower() not in registered
+        ]
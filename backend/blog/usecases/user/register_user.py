@@ -1,14 +1,17 @@
 from blog.domain.entities.user import User
 from blog.domain.repositories.user_repository import UserRepository
+from blog.domain.services.password_hasher import PasswordHasher
 from typing import Optional
 
 
 class RegisterUserUseCase:
-    def __init__(self, repository: UserRepository):
+    def __init__(self, repository: UserRepository, hasher: PasswordHasher):
         self.repository = repository
+        self.hasher = hasher
 
     async def execute(self, user: User) -> Optional[User]:
         existing_user = await self.repository.get_by_email(user.email)
         if existing_user:
             raise ValueError("User with this email already exists")
+        await user.password.hash_with(self.hasher)
         return await self.repository.register(user)
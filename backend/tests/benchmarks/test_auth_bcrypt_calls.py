@@ -0,0 +1,52 @@
+import uuid
+import pytest
+
+from blog.api import deps
+from blog.api.security import create_access_token, get_password_hash, pwd_context
+from blog.infra.models.user_model import UserModel
+from blog.infra.repositories.in_memory.in_memory_user_repository import (
+    InMemoryUserRepository,
+)
+
+
+class ModelBackedUserRepository(InMemoryUserRepository):
+    """Reidrata o usuário a partir do UserModel a cada leitura, como o SQLAlchemy."""
+
+    def __init__(self, model: UserModel):
+        super().__init__()
+        self._model = model
+
+    async def get_by_id(self, id: str):
+        return self._model.to_entity() if self._model.id == id else None
+
+    async def get_current_user(self):
+        if self._current_user_id is None:
+            return None
+        return await self.get_by_id(self._current_user_id)
+
+
+@pytest.mark.asyncio
+async def test_authenticated_request_runs_zero_bcrypt(mocker):
+    model = UserModel(
+        id=str(uuid.uuid4()),
+        name="Bench User",
+        email="bench_auth@example.com",
+        password=get_password_hash("Bench@123!"),
+        role="user",
+    )
+    repo = ModelBackedUserRepository(model)
+    token = create_access_token(data={"sub": model.id})
+
+    hash_spy = mocker.spy(pwd_context, "hash")
+    verify_spy = mocker.spy(pwd_context, "verify")
+
+    requests = 20
+    for _ in range(requests):
+        user = await deps.get_current_user(token=token, user_repo=repo)
+        assert user.id == model.id
+        # Persistir de volta (ex.: UserModel.from_entity) também não pode rehashear.
+        assert UserModel.from_entity(user).password == model.password
+
+    bcrypt_calls = hash_spy.call_count + verify_spy.call_count
+    print(f"bcrypt por requisição autenticada: {bcrypt_calls / requests}")
+    assert bcrypt_calls == 0
@@ -0,0 +1,108 @@
+import os
+import time
+import uuid
+import datetime
+import pytest
+from sqlalchemy import insert
+
+from blog.infra.models.bedroom_model import BedroomModel
+from blog.infra.models.reservation_model import ReservationModel
+from blog.infra.models.user_model import UserModel
+from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
+    SQLAlchemyBedroomRepository,
+)
+
+# Cenário completo: AVAILABILITY_BENCH_ROOMS=10000 AVAILABILITY_BENCH_RESERVATIONS=5000000
+BENCH_ROOMS = int(os.getenv("AVAILABILITY_BENCH_ROOMS", "500"))
+BENCH_RESERVATIONS = int(os.getenv("AVAILABILITY_BENCH_RESERVATIONS", "20000"))
+QUERIES = 50
+BATCH = 10_000
+START = datetime.datetime(2032, 1, 1, 14, 0)
+
+
+def stay(i: int) -> tuple[datetime.datetime, datetime.datetime]:
+    # Estadias de 2 noites em sequência por quarto, com 1 noite livre entre elas.
+    n = i // BENCH_ROOMS
+    check_in = START + datetime.timedelta(days=3 * n)
+    return check_in, check_in + datetime.timedelta(days=2, hours=-3)
+
+
+async def seed(db_session) -> list[str]:
+    user_id = str(uuid.uuid4())
+    await db_session.execute(
+        insert(UserModel).values(
+            id=user_id,
+            name="Availability User",
+            email=f"{uuid.uuid4().hex}@example.com",
+            password="$2b$12$M2umlxuSaxTB0oilG4.d/OWSOKh2n2e3Zr3dAOOLRhUzHODHB19ua",
+            role="user",
+        )
+    )
+    room_ids = [str(uuid.uuid4()) for _ in range(BENCH_ROOMS)]
+    for offset in range(0, BENCH_ROOMS, BATCH):
+        await db_session.execute(
+            insert(BedroomModel),
+            [
+                {
+                    "id": room_id,
+                    "title": "Quarto Benchmark",
+                    "description": "Quarto criado para o benchmark.",
+                    "price_cents": 10000,
+                    "image": "/static/images/quarto1.png",
+                }
+                for room_id in room_ids[offset : offset + BATCH]
+            ],
+        )
+    for offset in range(0, BENCH_RESERVATIONS, BATCH):
+        rows = []
+        for i in range(offset, min(offset + BATCH, BENCH_RESERVATIONS)):
+            check_in, check_out = stay(i)
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "bedroom_id": room_ids[i % BENCH_ROOMS],
+                    "title": "Reserva Benchmark",
+                    "address": "Rua do Benchmark, 1",
+                    "check_in": check_in,
+                    "check_out": check_out,
+                    "status": "confirmed",
+                }
+            )
+        await db_session.execute(insert(ReservationModel), rows)
+    await db_session.commit()
+    return room_ids
+
+
+@pytest.mark.asyncio
+async def test_available_bedrooms_latency(db_session):
+    room_ids = await seed(db_session)
+    repo = SQLAlchemyBedroomRepository(db_session)
+    stays_per_room = BENCH_RESERVATIONS // BENCH_ROOMS
+
+    latencies = []
+    for q in range(QUERIES):
+        n = (q * 7) % max(stays_per_room, 1)
+        check_in, check_out = stay(n * BENCH_ROOMS)
+        started = time.perf_counter()
+        # Período dentro de uma estadia: todos os quartos que já têm a
+        # n-ésima estadia estão ocupados.
+        busy = await repo.get_available_bedrooms(
+            check_in, check_in + datetime.timedelta(hours=20)
+        )
+        # Noite livre entre duas estadias: todos os quartos aparecem.
+        free = await repo.get_available_bedrooms(
+            check_out + datetime.timedelta(hours=1),
+            check_out + datetime.timedelta(hours=20),
+        )
+        latencies.append((time.perf_counter() - started) / 2)
+        booked = min(BENCH_ROOMS, max(BENCH_RESERVATIONS - n * BENCH_ROOMS, 0))
+        assert len(busy) == BENCH_ROOMS - booked
+        assert len(free) == len(room_ids)
+
+    latencies.sort()
+    print(
+        f"{BENCH_ROOMS} quartos, {BENCH_RESERVATIONS} reservas: "
+        f"p50={latencies[len(latencies) // 2] * 1000:.2f}ms "
+        f"p95={latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms"
+    )
@@ -0,0 +1,53 @@
+import os
+import time
+import pytest
+
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+from blog.infra.seeding.bedroom_catalog import seed_bedrooms
+
+CATALOG_BENCH_ROOMS = int(os.getenv("CATALOG_BENCH_ROOMS", "200"))
+REQUESTS = int(os.getenv("CATALOG_BENCH_REQUESTS", "200"))
+
+
+async def requests_per_second(client, headers=None) -> float:
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        response = await client.get("/bedrooms", headers=headers)
+        assert response.status_code in (200, 304)
+    return REQUESTS / (time.perf_counter() - started)
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_catalog_requests_per_second(setup_engine, db_session, client):
+    setup_engine[0].echo = False
+    await seed_bedrooms(
+        db_session,
+        (
+            {
+                "code": f"bench-{i}",
+                "title": f"Quarto {i}",
+                "description": "Quarto do benchmark do catálogo.",
+                "price": "R$ 200,00",
+                "image": "q.png",
+            }
+            for i in range(CATALOG_BENCH_ROOMS)
+        ),
+        1000,
+    )
+
+    bedroom_catalog_cache.enabled = False
+    try:
+        uncached = await requests_per_second(client)
+    finally:
+        bedroom_catalog_cache.enabled = True
+    cached = await requests_per_second(client)
+    etag = (await client.get("/bedrooms")).headers["etag"]
+    revalidated = await requests_per_second(client, {"If-None-Match": etag})
+
+    print(
+        f"\nGET /bedrooms ({CATALOG_BENCH_ROOMS} quartos): sem cache "
+        f"{uncached:.0f} req/s | com cache {cached:.0f} req/s | "
+        f"304 {revalidated:.0f} req/s"
+    )
+    assert cached > uncached
@@ -0,0 +1,51 @@
+import io
+import os
+import time
+import pytest
+
+from blog.api.bedroom_import import validate_rows
+from blog.domain.entities.bedroom import Bedroom
+from blog.infra.repositories.sqlalchemy.sqlalchemy_bedroom_repository import (
+    SQLAlchemyBedroomRepository,
+)
+from blog.usecases.bedroom.bulk_import_bedrooms import BulkImportBedrooms
+
+# Onboarding grande: IMPORT_BENCH_ROWS=200000 pytest tests/benchmarks
+IMPORT_BENCH_ROWS = int(os.getenv("IMPORT_BENCH_ROWS", "20000"))
+PER_ROW_SAMPLE = 500
+CHUNK_SIZE = 5000
+
+
+def partner_csv(rows: int) -> io.StringIO:
+    lines = ["code,title,description,price_cents,image"]
+    lines += [
+        f"bench-{i},Quarto Parceiro {i},Quarto importado no benchmark.,{10000 + i},q.png"
+        for i in range(rows)
+    ]
+    return io.StringIO("\n".join(lines) + "\n")
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bulk_import_rows_per_second(setup_engine, db_session):
+    setup_engine[0].echo = False
+    repo = SQLAlchemyBedroomRepository(db_session)
+
+    started = time.perf_counter()
+    for i in range(PER_ROW_SAMPLE):
+        await repo.create_bedroom(
+            Bedroom(None, f"Quarto {i}", "Quarto criado um a um.", "R$ 100,00", "q.png")
+        )
+    per_row_rate = PER_ROW_SAMPLE / (time.perf_counter() - started)
+
+    report = await BulkImportBedrooms(repo).execute(
+        validate_rows(partner_csv(IMPORT_BENCH_ROWS), "csv"), CHUNK_SIZE
+    )
+
+    print(
+        f"\ncreate_bedroom: {per_row_rate:.0f} linhas/s | import em lotes de "
+        f"{CHUNK_SIZE}: {report.rows_per_second:.0f} linhas/s "
+        f"({IMPORT_BENCH_ROWS} linhas em {report.elapsed_seconds * 1000:.0f} ms)"
+    )
+    assert (report.imported, report.failed) == (IMPORT_BENCH_ROWS, 0)
+    assert report.rows_per_second > per_row_rate
@@ -0,0 +1,58 @@
+import os
+import time
+import tracemalloc
+import pytest
+
+from sqlalchemy import select
+
+from blog.infra.models.reservation_model import ReservationModel
+from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+    SQLAlchemyReservationRepository,
+)
+
+HYDRATION_BENCH_ROWS = int(os.getenv("HYDRATION_BENCH_ROWS", "50000"))
+
+
+async def measure(load) -> tuple[list, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    entities = await load()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return entities, elapsed, peak
+
+
+@pytest.mark.asyncio
+async def test_core_row_hydration_vs_orm_models(setup_engine, reservation_seeder):
+    _, async_session = setup_engine
+    async with async_session() as session:
+        await reservation_seeder(session, HYDRATION_BENCH_ROWS)
+
+    async with async_session() as session:
+
+        async def load_orm():
+            result = await session.execute(select(ReservationModel))
+            return [model.to_entity() for model in result.scalars().all()]
+
+        orm_entities, orm_elapsed, orm_peak = await measure(load_orm)
+
+    async with async_session() as session:
+        repo = SQLAlchemyReservationRepository(session)
+        core_entities, core_elapsed, core_peak = await measure(
+            repo.get_all_reservations
+        )
+
+    rows = HYDRATION_BENCH_ROWS
+    for label, elapsed, peak in (
+        ("ORM (ReservationModel)", orm_elapsed, orm_peak),
+        ("Core Rows", core_elapsed, core_peak),
+    ):
+        print(
+            f"{label}: {rows / elapsed:,.0f} linhas/s, "
+            f"{peak / rows:.0f} bytes/linha (pico)"
+        )
+
+    assert len(core_entities) == len(orm_entities) == rows
+    assert not hasattr(core_entities[0], "__dict__")
+    assert core_peak < orm_peak
@@ -0,0 +1,84 @@
+import os
+import time
+import uuid
+import pytest
+
+from blog.domain.entities.user import User
+from blog.domain.value_objects.email_vo import Email
+from blog.domain.value_objects.password import Password
+from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+    DUMMY_PASSWORD_HASH,
+    SQLAlchemyUserRepository,
+)
+from blog.infra.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
+from blog.usecases.user.bulk_register_users import BulkRegisterUsers
+from blog.usecases.user.register_user import RegisterUserUseCase
+
+# Migração completa: USER_IMPORT_BENCH_ROWS=1000000 pytest tests/benchmarks
+USER_IMPORT_BENCH_ROWS = int(os.getenv("USER_IMPORT_BENCH_ROWS", "20000"))
+USER_IMPORT_BENCH_PLAIN = int(os.getenv("USER_IMPORT_BENCH_PLAIN", "32"))
+PER_USER_SAMPLE = 500
+BATCH_SIZE = 1000
+ONE_MILLION = 1_000_000
+
+
+def legacy_user(i: int, password: Password) -> User:
+    return User(
+        str(uuid.uuid4()),
+        f"Migrado {i}",
+        Email(f"migrado{i}@example.com"),
+        password,
+        "user",
+        None,
+        None,
+        None,
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bulk_user_import_throughput(setup_engine, db_session):
+    setup_engine[0].echo = False
+    hasher = ProcessPoolPasswordHasher(max_workers=os.cpu_count() or 1)
+    repo = SQLAlchemyUserRepository(db_session, hasher)
+    try:
+        # Caminho antigo: get_by_email + insert por usuário (hash já pronto).
+        started = time.perf_counter()
+        for i in range(PER_USER_SAMPLE):
+            await RegisterUserUseCase(repo, hasher).execute(
+                legacy_user(-i - 1, Password.from_hash(DUMMY_PASSWORD_HASH))
+            )
+        per_user_rate = PER_USER_SAMPLE / (time.perf_counter() - started)
+
+        # Hashes bcrypt legados: só consulta de e-mails e inserts em lote.
+        prehashed = await BulkRegisterUsers(repo, hasher).execute(
+            [
+                legacy_user(i, Password.from_hash(DUMMY_PASSWORD_HASH))
+                for i in range(USER_IMPORT_BENCH_ROWS)
+            ],
+            BATCH_SIZE,
+        )
+
+        # Senhas em texto: o bcrypt domina; o pool usa todos os núcleos.
+        plain = await BulkRegisterUsers(repo, hasher).execute(
+            [
+                legacy_user(USER_IMPORT_BENCH_ROWS + i, Password("Migrado@123"))
+                for i in range(USER_IMPORT_BENCH_PLAIN)
+            ],
+            BATCH_SIZE,
+        )
+    finally:
+        hasher.shutdown()
+
+    print(
+        f"\nregister por usuário: {per_user_rate:.0f}/s | lote com hash legado: "
+        f"{prehashed.users_per_second:.0f}/s (1M em "
+        f"~{ONE_MILLION / prehashed.users_per_second:.0f} s) | lote com bcrypt em "
+        f"{os.cpu_count()} processos: {plain.users_per_second:.1f}/s (1M em "
+        f"~{ONE_MILLION / plain.users_per_second / 3600:.1f} h)"
+    )
+    assert prehashed.registered == USER_IMPORT_BENCH_ROWS
+    assert plain.registered == USER_IMPORT_BENCH_PLAIN
+    assert prehashed.users_per_second > per_user_rate
@@ -0,0 +1,68 @@
+import os
+import time
+import uuid
+import pytest
+from sqlalchemy import delete, func, insert, select
+
+from blog.api.bedrooms_mock import BedroomMock
+from blog.domain.value_objects.money import Money
+from blog.infra.models.bedroom_model import BedroomModel
+from blog.infra.seeding.bedroom_catalog import seed_bedrooms
+
+# Catálogo grande: SEED_BENCH_ROWS=100000 pytest tests/benchmarks
+SEED_BENCH_ROWS = int(os.getenv("SEED_BENCH_ROWS", "5000"))
+BATCH_SIZE = 1000
+
+
+def catalog(rows: int) -> list[dict]:
+    return [
+        {**BedroomMock[i % len(BedroomMock)], "code": f"bench-{i}"} for i in range(rows)
+    ]
+
+
+async def legacy_seed(db_session, records: list[dict]) -> None:
+    # Fluxo antigo do lifespan: conta os quartos e insere um por um.
+    total = await db_session.scalar(select(func.count()).select_from(BedroomModel))
+    if total == 0:
+        for record in records:
+            await db_session.execute(
+                insert(BedroomModel).values(
+                    id=str(uuid.uuid4()),
+                    title=record["title"],
+                    description=record["description"],
+                    price_cents=Money.parse(record["price"]).cents,
+                    currency="BRL",
+                    image=record["image"],
+                )
+            )
+        await db_session.commit()
+
+
+async def timed(coro) -> float:
+    started = time.perf_counter()
+    await coro
+    return (time.perf_counter() - started) * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bulk_seed_vs_per_row_inserts(setup_engine, db_session):
+    setup_engine[0].echo = False
+    records = catalog(SEED_BENCH_ROWS)
+
+    legacy_cold = await timed(legacy_seed(db_session, records))
+    legacy_warm = await timed(legacy_seed(db_session, records))
+    await db_session.execute(delete(BedroomModel))
+    await db_session.commit()
+
+    bulk_cold = await timed(seed_bedrooms(db_session, records, BATCH_SIZE))
+    bulk_warm = await timed(seed_bedrooms(db_session, records, BATCH_SIZE))
+
+    total = await db_session.scalar(select(func.count()).select_from(BedroomModel))
+    print(
+        f"\n{SEED_BENCH_ROWS} quartos | por linha: {legacy_cold:.0f} ms "
+        f"(subida seguinte {legacy_warm:.0f} ms) | lotes de {BATCH_SIZE}: "
+        f"{bulk_cold:.0f} ms (subida seguinte {bulk_warm:.0f} ms)"
+    )
+    assert total == SEED_BENCH_ROWS
+    assert bulk_cold < legacy_cold
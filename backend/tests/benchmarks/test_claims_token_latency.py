@@ -0,0 +1,86 @@
+import asyncio
+import time
+import pytest
+
+from blog.api.settings import settings
+from blog.infra.cache.principal_cache import principal_cache, token_version_cache
+
+CONCURRENT_REQUESTS = 50
+ROUNDS = 5
+
+
+async def login(client, email: str) -> str:
+    credentials = {"email": email, "password": "Latency@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Latency", "role": "admin", **credentials}
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=credentials)
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+async def measure(client, token: str) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def call(url: str) -> float:
+        # Caches frios: mede o custo de autorizar sem a ajuda do cache de usuários.
+        await principal_cache.clear()
+        await token_version_cache.clear()
+        start = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        assert response.status_code == 200
+        return time.perf_counter() - start
+
+    latencies: list[float] = []
+    for _ in range(ROUNDS):
+        latencies += await asyncio.gather(
+            *(
+                call("/reservations/" if i % 2 else "/reservations/me")
+                for i in range(CONCURRENT_REQUESTS)
+            )
+        )
+    latencies.sort()
+    return latencies[len(latencies) // 2]
+
+
+async def user_selects(client, token: str, query_counter) -> tuple[int, int]:
+    """(SELECTs do usuário inteiro, SELECTs só de token_version) em cada rota."""
+    query_counter.reset()
+    for url in ("/reservations/", "/reservations/me"):
+        await principal_cache.clear()
+        await token_version_cache.clear()
+        response = await client.get(url, headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+    users = [s for s in query_counter.statements if "FROM users" in s]
+    full = [s for s in users if "users.password" in s]
+    return len(full), len(users) - len(full)
+
+
+@pytest.mark.asyncio
+async def test_reservation_latency_claims_vs_user_lookup(
+    concurrent_client, query_counter, monkeypatch
+):
+    legacy_token = await login(concurrent_client, "latency_legacy@example.com")
+    monkeypatch.setattr(settings, "JWT_CLAIMS_MODE", True)
+    claims_token = await login(concurrent_client, "latency_claims@example.com")
+
+    legacy_p50 = await measure(concurrent_client, legacy_token)
+    claims_p50 = await measure(concurrent_client, claims_token)
+
+    print(
+        f"reservas p50 sob {CONCURRENT_REQUESTS} requisições simultâneas: "
+        f"token sub={legacy_p50 * 1000:.1f}ms, "
+        f"token com claims={claims_p50 * 1000:.1f}ms"
+    )
+
+    # Cache frio, duas rotas: o token só com sub carrega o usuário uma vez por
+    # requisição; com claims, nenhuma leitura do usuário, só a da versão.
+    assert await user_selects(concurrent_client, legacy_token, query_counter) == (
+        2,
+        0,
+    )
+    assert await user_selects(concurrent_client, claims_token, query_counter) == (
+        0,
+        2,
+    )
@@ -0,0 +1,62 @@
+import asyncio
+import io
+import os
+import time
+import pytest
+from PIL import Image
+
+from blog.infra.services.process_pool_image_processor import (
+    ProcessPoolImageProcessor,
+)
+
+PHOTOS = int(os.getenv("IMAGE_BENCH_PHOTOS", "4"))
+WORKERS = int(os.getenv("IMAGE_BENCH_WORKERS", "2"))
+
+
+def photo(seed: int) -> bytes:
+    # Ruído sobre degradê: comprime como foto, não como ilustração chapada.
+    size = (1600, 1000)
+    base = Image.linear_gradient("L").resize(size).convert("RGB")
+    noise = Image.effect_noise(size, 40 + seed).convert("RGB")
+    buffer = io.BytesIO()
+    Image.blend(base, noise, 0.35).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+async def derive_all(processor, photos) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(*(processor.store(data) for data in photos))
+    return time.perf_counter() - started
+
+
+@pytest.mark.asyncio
+async def test_listing_thumbnails_bytes_and_pool_throughput(tmp_path):
+    photos = [photo(i) for i in range(PHOTOS)]
+    options = dict(widths=[320, 640, 1280], formats=["avif", "webp"], quality=70)
+
+    inline = ProcessPoolImageProcessor(0, static_dir=str(tmp_path / "a"), **options)
+    inline_seconds = await derive_all(inline, photos)
+    pooled = ProcessPoolImageProcessor(
+        WORKERS, static_dir=str(tmp_path / "b"), **options
+    )
+    try:
+        await pooled.store(photo(99))  # sobe os processos fora da medição
+        pooled_seconds = await derive_all(pooled, photos)
+    finally:
+        pooled.shutdown()
+
+    _, variants = await inline.store(photos[0])
+    card = {
+        mime_type: (tmp_path / "a" / urls["320"].removeprefix("/static/"))
+        .stat()
+        .st_size
+        for mime_type, urls in variants.items()
+    }
+    print(
+        f"\nCard da listagem: PNG original {len(photos[0])} bytes | "
+        + " | ".join(f"{mime} 320w {size} bytes" for mime, size in card.items())
+        + f"\n{PHOTOS} fotos (3 larguras x 2 formatos): threads "
+        f"{PHOTOS / inline_seconds:.1f} fotos/s | {WORKERS} processos "
+        f"{PHOTOS / pooled_seconds:.1f} fotos/s"
+    )
+    assert max(card.values()) < len(photos[0]) / 10
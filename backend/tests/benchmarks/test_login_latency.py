@@ -0,0 +1,47 @@
+import asyncio
+import time
+import pytest
+
+CONCURRENT_LOGINS = 50
+BEDROOM_REQUESTS = 100
+
+
+async def timed_get(client, url: str) -> float:
+    start = time.perf_counter()
+    response = await client.get(url)
+    assert response.status_code == 200
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_bedrooms_p99_latency_during_concurrent_logins(concurrent_client):
+    credentials = {"email": "bench_login@example.com", "password": "Bench@123!"}
+    register_response = await concurrent_client.post(
+        "/auth/register", json={"name": "Bench User", "role": "user", **credentials}
+    )
+    assert register_response.status_code == 201
+
+    async def login():
+        response = await concurrent_client.post("/auth/login", json=credentials)
+        assert response.status_code == 200
+
+    async def poll_bedrooms():
+        latencies = []
+        for _ in range(BEDROOM_REQUESTS):
+            latencies.append(await timed_get(concurrent_client, "/bedrooms/"))
+        return latencies
+
+    logins = asyncio.gather(*(login() for _ in range(CONCURRENT_LOGINS)))
+    latencies, _ = await asyncio.gather(poll_bedrooms(), logins)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"/bedrooms/ com {CONCURRENT_LOGINS} logins simultâneos: "
+        f"p50={p50 * 1000:.1f}ms p99={p99 * 1000:.1f}ms"
+    )
+    # Um único bcrypt no event loop já custa ~250ms; com o pool, as leituras
+    # de quartos não devem esperar pela fila de logins.
+    assert p99 < 0.25
@@ -0,0 +1,92 @@
+import time
+import uuid
+import pytest
+
+from blog.api.security import pwd_context, verify_password
+from blog.domain.entities.user import User
+from blog.domain.value_objects.email_vo import Email
+from blog.domain.value_objects.password import Password
+from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+from blog.infra.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
+from blog.usecases.user.login_user import LoginUserUseCase
+
+LOGINS = 20
+# Um login deve custar um único bcrypt: no mínimo 75% da vazão de verifies
+# puros em um core (o fluxo antigo, com dois bcrypts, ficava em ~50%).
+MIN_THROUGHPUT_RATIO = 0.75
+
+
+async def register_bench_user(repo, hasher, plain: str) -> User:
+    user = User(
+        id=str(uuid.uuid4()),
+        name="Bench User",
+        email=Email("bench_throughput@example.com"),
+        password=Password(plain),
+        role="user",
+        phone=None,
+        document=None,
+        address=None,
+    )
+    await user.password.hash_with(hasher)
+    await repo.register(user)
+    return user
+
+
+@pytest.mark.asyncio
+async def test_login_costs_one_verify_and_no_hash(db_session, mocker):
+    hasher = ProcessPoolPasswordHasher(max_workers=0)
+    repo = SQLAlchemyUserRepository(db_session, hasher)
+    user = await register_bench_user(repo, hasher, "Bench@123!")
+
+    hash_spy = mocker.spy(pwd_context, "hash")
+    verify_spy = mocker.spy(pwd_context, "verify")
+    logged = await LoginUserUseCase(repo).execute(
+        user.email, Password.for_login("Bench@123!")
+    )
+
+    assert logged is not None
+    assert hash_spy.call_count == 0
+    assert verify_spy.call_count == 1
+
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_login_throughput_per_core(db_session):
+    # max_workers=0: uma thread por vez, ou seja, vazão de um core.
+    hasher = ProcessPoolPasswordHasher(max_workers=0)
+    repo = SQLAlchemyUserRepository(db_session, hasher)
+    plain = "Bench@123!"
+    user = await register_bench_user(repo, hasher, plain)
+    stored_hash = str(user.password)
+
+    start = time.perf_counter()
+    for _ in range(LOGINS):
+        assert verify_password(plain, stored_hash)
+    verify_rate = LOGINS / (time.perf_counter() - start)
+
+    usecase = LoginUserUseCase(repo)
+    start = time.perf_counter()
+    for _ in range(LOGINS):
+        logged = await usecase.execute(user.email, Password.for_login(plain))
+        assert logged is not None
+    login_rate = LOGINS / (time.perf_counter() - start)
+
+    print(f"verify puro: {verify_rate:.2f}/s, login: {login_rate:.2f}/s por core")
+    assert login_rate >= verify_rate * MIN_THROUGHPUT_RATIO
+
+
+@pytest.mark.asyncio
+async def test_login_unknown_email_costs_one_verify(db_session, mocker):
+    repo = SQLAlchemyUserRepository(db_session, ProcessPoolPasswordHasher(0))
+    verify_spy = mocker.spy(pwd_context, "verify")
+
+    result = await LoginUserUseCase(repo).execute(
+        Email("ghost@example.com"), Password.for_login("qualquer-senha")
+    )
+
+    assert result is None
+    assert verify_spy.call_count == 1
@@ -0,0 +1,123 @@
+import uuid
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+from blog.api import deps
+from blog.api.security import create_access_token
+from blog.infra.cache.principal_cache import principal_cache, token_version_cache
+from blog.infra.models.user_model import DIRTY_USER_IDS, UserModel
+from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+
+
+async def create_user_model(db_session) -> UserModel:
+    model = UserModel(
+        id=str(uuid.uuid4()),
+        name="Cache User",
+        email=f"{uuid.uuid4().hex}@example.com",
+        password="$2b$12$M2umlxuSaxTB0oilG4.d/OWSOKh2n2e3Zr3dAOOLRhUzHODHB19ua",
+        role="user",
+    )
+    db_session.add(model)
+    await db_session.commit()
+    return model
+
+
+@pytest.mark.asyncio
+async def test_repeat_requests_skip_the_database(db_session, query_counter):
+    model = await create_user_model(db_session)
+    # Token sem role/ver: o Principal vem do cache.
+    token = create_access_token(data={"sub": model.id})
+    query_counter.reset()
+
+    requests = 10
+    for _ in range(requests):
+        repo = SQLAlchemyUserRepository(db_session)
+        principal = await deps.get_current_principal(token=token, user_repo=repo)
+        assert principal.id == model.id
+
+    print(
+        f"{query_counter.count} queries em {requests} requisições, "
+        f"hit ratio={principal_cache.hit_ratio:.2f}"
+    )
+    assert query_counter.count == 1
+
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cached_principal(db_session):
+    model = await create_user_model(db_session)
+    token = create_access_token(data={"sub": model.id})
+    repo = SQLAlchemyUserRepository(db_session)
+    principal = await deps.get_current_principal(token=token, user_repo=repo)
+    assert principal.role == "user"
+
+    model.role = "admin"
+    await db_session.commit()
+
+    principal = await deps.get_current_principal(token=token, user_repo=repo)
+    assert (principal.role, principal.token_version) == ("admin", 1)
+
+
+@pytest.mark.asyncio
+async def test_cached_principal_is_kept_until_commit(db_session):
+    model = await create_user_model(db_session)
+    token = create_access_token(data={"sub": model.id})
+    repo = SQLAlchemyUserRepository(db_session)
+    await deps.get_current_principal(token=token, user_repo=repo)
+
+    # Flush sem COMMIT: outras sessões ainda leem o papel antigo.
+    model.role = "admin"
+    await db_session.flush()
+    assert db_session.info[DIRTY_USER_IDS] == {model.id}
+    principal = await deps.get_current_principal(token=token, user_repo=repo)
+    assert principal.role == "user"
+
+    await db_session.rollback()
+    assert DIRTY_USER_IDS not in db_session.info
+    principal = await deps.get_current_principal(token=token, user_repo=repo)
+    assert principal.role == "user"
+
+
+@pytest.mark.asyncio
+async def test_update_credentials_revokes_tokens_and_cached_principal(db_session):
+    model = await create_user_model(db_session)
+    token = create_access_token(data={"sub": model.id})
+    repo = SQLAlchemyUserRepository(db_session)
+    await deps.get_current_principal(token=token, user_repo=repo)
+    assert (
+        await token_version_cache.get_or_load(
+            model.id, lambda: repo.get_token_version(model.id), scope=model.id
+        )
+        == 0
+    )
+
+    # UPDATE do Core: sem eventos de mapper, o repositório invalida sozinho.
+    updated = await repo.update_credentials(model.id, role="admin")
+    assert (updated.role, updated.token_version) == ("admin", 1)
+
+    principal = await deps.get_current_principal(token=token, user_repo=repo)
+    assert (principal.role, principal.token_version) == ("admin", 1)
+    assert (
+        await token_version_cache.get_or_load(
+            model.id, lambda: repo.get_token_version(model.id), scope=model.id
+        )
+        == 1
+    )
+    assert await repo.update_credentials(str(uuid.uuid4()), role="admin") is None
+
+
+def test_plain_sync_session_commit_skips_the_async_cache_listener(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'sync.db'}")
+    UserModel.__table__.create(engine)
+    with Session(engine) as session:
+        model = UserModel(
+            name="Script", email="script@example.com", password="hash", role="user"
+        )
+        session.add(model)
+        session.commit()
+        model.role = "admin"
+        session.commit()
+        assert model.token_version == 1
+    engine.dispose()
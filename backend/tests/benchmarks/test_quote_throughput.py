@@ -0,0 +1,34 @@
+import datetime
+import time
+import pytest
+
+QUOTES_PER_REQUEST = 10_000
+
+
+@pytest.mark.asyncio
+async def test_quote_10k_stays_in_one_request(client):
+    bedrooms = (await client.get("/bedrooms")).json()["bedrooms"]
+    start = datetime.date(2032, 1, 1)
+    stays = [
+        {
+            "bedroom_id": bedrooms[i % len(bedrooms)]["id"],
+            "check_in": (start + datetime.timedelta(days=i % 365)).isoformat(),
+            "check_out": (
+                start + datetime.timedelta(days=i % 365 + 1 + i % 7)
+            ).isoformat(),
+        }
+        for i in range(QUOTES_PER_REQUEST)
+    ]
+
+    started = time.perf_counter()
+    response = await client.post("/bedrooms/quote", json={"stays": stays})
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    quotes = response.json()["quotes"]
+    assert len(quotes) == QUOTES_PER_REQUEST
+    assert all(q["total_cents"] > 0 for q in quotes)
+    print(
+        f"{QUOTES_PER_REQUEST} orçamentos em {elapsed * 1000:.0f}ms "
+        f"({QUOTES_PER_REQUEST / elapsed:,.0f} orçamentos/s)"
+    )
@@ -0,0 +1,48 @@
+import os
+import resource
+import time
+import tracemalloc
+import datetime
+import pytest
+
+from blog.api.reservation_export import export_reservations
+from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+    SQLAlchemyReservationRepository,
+)
+
+# Para o cenário de 1M de linhas: EXPORT_BENCH_ROWS=1000000 pytest tests/benchmarks
+EXPORT_BENCH_ROWS = int(os.getenv("EXPORT_BENCH_ROWS", "20000"))
+CHUNK_SIZE = 1000
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("export_format", ["ndjson", "csv"])
+async def test_export_memory_is_bounded_by_chunk_size(
+    db_session, reservation_seeder, export_format
+):
+    await reservation_seeder(db_session, EXPORT_BENCH_ROWS)
+    repo = SQLAlchemyReservationRepository(db_session)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    lines = 0
+    sent = 0
+    chunks = repo.stream_reservations(
+        CHUNK_SIZE, check_in_from=datetime.datetime(2032, 1, 1)
+    )
+    async for block in export_reservations(chunks, export_format):
+        lines += block.count(b"\n")
+        sent += len(block)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    header = 1 if export_format == "csv" else 0
+    print(
+        f"{export_format}: {lines - header} linhas, {sent / 1e6:.1f} MB em "
+        f"{elapsed:.2f}s, pico Python={peak / 1e6:.1f} MB, "
+        f"ru_maxrss={resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB"
+    )
+    assert lines - header == EXPORT_BENCH_ROWS
+    # O pico acompanha o tamanho do bloco, não o total exportado.
+    assert peak < 32 * 1024 * 1024
@@ -0,0 +1,79 @@
+import datetime
+import time
+import uuid
+import pytest
+
+from blog.api.schemas.reservation_schema import ReservationOutput
+from blog.domain.entities.reservation import DATETIME_FORMAT, Reservation
+from blog.infra.models.reservation_model import ReservationModel
+
+ROWS = 100_000
+
+
+def build_models(rows: int = ROWS) -> list[ReservationModel]:
+    start = datetime.datetime(2032, 1, 1, 14, 0)
+    return [
+        ReservationModel(
+            id=str(uuid.uuid4()),
+            user_id="user1",
+            title=f"Reserva {i}",
+            address="Rua do Benchmark, 1",
+            check_in=start + datetime.timedelta(minutes=i),
+            check_out=start + datetime.timedelta(minutes=i, days=2),
+            status="confirmed",
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_to_entity(model: ReservationModel) -> Reservation:
+    # Caminho anterior: datetime -> str no model, str -> datetime na entidade.
+    return Reservation(
+        id=model.id,
+        user_id=model.user_id,
+        title=model.title,
+        address=model.address,
+        check_in=model.check_in.strftime(DATETIME_FORMAT),
+        check_out=model.check_out.strftime(DATETIME_FORMAT),
+        status=model.status,
+    )
+
+
+def legacy_output(entity: Reservation) -> dict:
+    return {
+        "check_in": entity.check_in.strftime(DATETIME_FORMAT),
+        "check_out": entity.check_out.strftime(DATETIME_FORMAT),
+    }
+
+
+def test_hydrated_reservations_format_dates_like_the_string_path():
+    models = build_models(100)
+    legacy = [legacy_output(legacy_to_entity(model)) for model in models]
+    outputs = [ReservationOutput.from_entity(model.to_entity()) for model in models]
+
+    assert [(o.check_in, o.check_out) for o in outputs] == [
+        (row["check_in"], row["check_out"]) for row in legacy
+    ]
+
+
+@pytest.mark.benchmark
+def test_listing_100k_reservations_skips_date_round_trips():
+    models = build_models()
+
+    started = time.perf_counter()
+    legacy = [legacy_output(legacy_to_entity(model)) for model in models]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    entities = [model.to_entity() for model in models]
+    hydrate_elapsed = time.perf_counter() - started
+    outputs = [ReservationOutput.from_entity(entity) for entity in entities]
+    total_elapsed = time.perf_counter() - started
+
+    print(
+        f"{ROWS} reservas: conversões de data antigas={legacy_elapsed * 1000:.0f}ms, "
+        f"to_entity={hydrate_elapsed * 1000:.0f}ms, "
+        f"to_entity + ReservationOutput={total_elapsed * 1000:.0f}ms"
+    )
+    assert len(outputs) == len(legacy) == ROWS
+    assert hydrate_elapsed < legacy_elapsed
@@ -0,0 +1,81 @@
+import datetime
+import time
+import uuid
+import pytest
+
+from pydantic import TypeAdapter
+
+from blog.api.responses import ORJSONResponse
+from blog.api.schemas.reservation_schema import (
+    MessageReservationResponse,
+    ReservationOutput,
+    format_datetime,
+)
+from blog.domain.entities.reservation import Reservation
+
+ROWS = 10_000
+ROUNDS = 5
+
+page_adapter = TypeAdapter(MessageReservationResponse)
+
+
+def build_reservations(rows: int = ROWS) -> list[Reservation]:
+    start = datetime.datetime(2032, 1, 1, 14, 0)
+    return [
+        Reservation.hydrate(
+            id=str(uuid.uuid4()),
+            user_id="user1",
+            title=f"Reserva {i}",
+            address="Rua do Benchmark, 1",
+            check_in=start + datetime.timedelta(days=i % 365),
+            check_out=start + datetime.timedelta(days=i % 365 + 2),
+            status="confirmed",
+            bedroom_id=str(uuid.uuid4()),
+        )
+        for i in range(rows)
+    ]
+
+
+def legacy_body(reservations: list[Reservation]) -> bytes:
+    # Caminho anterior: modelos por item, revalidação do response_model e dump.
+    page = MessageReservationResponse(
+        message="ok",
+        reservations=[ReservationOutput.from_entity(r) for r in reservations],
+    )
+    return page_adapter.dump_json(page_adapter.validate_python(page))
+
+
+def fast_body(reservations: list[Reservation]) -> bytes:
+    content = MessageReservationResponse.content(
+        message="ok", reservations=[ReservationOutput.row(r) for r in reservations]
+    )
+    return ORJSONResponse(content).body
+
+
+def cpu_ms_per_response(render, reservations: list[Reservation]) -> float:
+    format_datetime.cache_clear()
+    started = time.process_time()
+    for _ in range(ROUNDS):
+        render(reservations)
+    return (time.process_time() - started) / ROUNDS * 1000
+
+
+def test_row_serialization_matches_the_validated_models():
+    reservations = build_reservations(500)
+
+    fast = fast_body(reservations)
+    assert fast == legacy_body(reservations)
+    assert len(page_adapter.validate_json(fast).reservations or []) == 500
+
+
+@pytest.mark.benchmark
+def test_listing_10k_reservations_skips_revalidation():
+    reservations = build_reservations()
+
+    legacy_ms = cpu_ms_per_response(legacy_body, reservations)
+    fast_ms = cpu_ms_per_response(fast_body, reservations)
+    print(
+        f"\nListagem de {ROWS} reservas: modelos + revalidação {legacy_ms:.1f} ms "
+        f"CPU | linhas + orjson {fast_ms:.1f} ms CPU"
+    )
+    assert fast_ms < legacy_ms
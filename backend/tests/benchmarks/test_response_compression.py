@@ -0,0 +1,54 @@
+import os
+import time
+import pytest
+
+from blog.infra.seeding.bedroom_catalog import seed_bedrooms
+
+COMPRESSION_BENCH_ROOMS = int(os.getenv("COMPRESSION_BENCH_ROOMS", "500"))
+REQUESTS = int(os.getenv("COMPRESSION_BENCH_REQUESTS", "100"))
+
+
+async def measure(client, encoding: str) -> tuple[int, float]:
+    """Bytes na rede por resposta e ms de CPU por requisição."""
+    headers = {"Accept-Encoding": encoding}
+    wire = 0
+    started = time.process_time()
+    for _ in range(REQUESTS):
+        response = await client.get("/bedrooms", headers=headers)
+        assert response.status_code == 200
+        wire = response.num_bytes_downloaded
+    return wire, (time.process_time() - started) / REQUESTS * 1000
+
+
+@pytest.mark.asyncio
+async def test_catalog_bytes_on_wire_and_cpu(setup_engine, db_session, client):
+    setup_engine[0].echo = False
+    await seed_bedrooms(
+        db_session,
+        (
+            {
+                "code": f"wire-{i}",
+                "title": f"Quarto {i}",
+                "description": f"Quarto {i} do benchmark de compressão, vista para o mar.",
+                "price": "R$ 200,00",
+                "image": f"/static/images/quarto{i % 6 + 1}.png",
+            }
+            for i in range(COMPRESSION_BENCH_ROOMS)
+        ),
+        1000,
+    )
+
+    results = {
+        encoding: await measure(client, encoding)
+        for encoding in ("identity", "gzip", "br")
+    }
+    print(
+        f"\nGET /bedrooms ({COMPRESSION_BENCH_ROOMS} quartos, cache quente): "
+        + " | ".join(
+            f"{encoding} {wire} bytes, {cpu:.2f} ms CPU"
+            for encoding, (wire, cpu) in results.items()
+        )
+    )
+    identity = results["identity"][0]
+    assert results["gzip"][0] < identity / 4
+    assert results["br"][0] < results["gzip"][0]
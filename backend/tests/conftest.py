@@ -1,11 +1,53 @@
+import io
 import os
+import uuid
+import datetime
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from blog.infra.database import Base
+from blog.infra.database import AppSession, Base
 from blog.api.main import app
 from blog.api import deps
 from asgi_lifespan import LifespanManager
+from sqlalchemy import event, insert
+from blog.infra.models.reservation_model import ReservationModel
+from blog.infra.models.user_model import UserModel
+from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+from blog.infra.cache.fake_redis_server import FakeRedisServer
+from blog.infra.cache.principal_cache import principal_cache, token_version_cache
+from blog.infra.cache.reservation_cache import reservation_list_cache
+from blog.infra.cache.resp_cache_backend import RespCacheBackend
+from blog.infra.services.process_pool_image_processor import (
+    ProcessPoolImageProcessor,
+)
+from PIL import Image
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmarks",
+        action="store_true",
+        help="Roda também os testes marcados com @pytest.mark.benchmark.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark: compara tempos de execução; fora da suíte padrão (--benchmarks)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Asserts de tempo dependem da máquina: só rodam quando pedidos.
+    if config.getoption("--benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark: rode com --benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
 
 TEST_DATABASE_URL = os.getenv(
     "DATABASE_URL_TEST",
@@ -26,7 +68,10 @@ def event_loop():
 async def setup_engine():
     engine = create_async_engine(TEST_DATABASE_URL, echo=True)
     async_session = async_sessionmaker(
-        bind=engine, class_=AsyncSession, expire_on_commit=False
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        sync_session_class=AppSession,
     )
 
     async with engine.begin() as conn:
@@ -43,6 +88,29 @@ async def db_session(setup_engine):
         yield session
 
 
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, *args, **kwargs):
+        self.count += 1
+        self.statements.append(statement)
+
+    def reset(self):
+        self.count = 0
+        self.statements.clear()
+
+
+@pytest_asyncio.fixture
+async def query_counter(setup_engine):
+    engine, _ = setup_engine
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+
 @pytest_asyncio.fixture
 async def client(db_session):
     async def override_get_db_session():
@@ -58,3 +126,117 @@ async def client(db_session):
             yield ac
 
     app.dependency_overrides.clear()
+
+
+@pytest_asyncio.fixture
+async def concurrent_client(setup_engine):
+    # Uma sessão por requisição: o fixture `client` compartilha uma única
+    # AsyncSession, que não aceita operações concorrentes.
+    _, async_session = setup_engine
+
+    async def override_get_db_session():
+        async with async_session() as session:
+            yield session
+
+    app.dependency_overrides[deps.get_db_session] = override_get_db_session
+
+    async with LifespanManager(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(
+            transport=transport, base_url="http://test", follow_redirects=True
+        ) as ac:
+            yield ac
+
+    app.dependency_overrides.clear()
+
+
+async def seed_reservations(db_session, rows: int) -> None:
+    user_id = str(uuid.uuid4())
+    await db_session.execute(
+        insert(UserModel).values(
+            id=user_id,
+            name="Export User",
+            email=f"{uuid.uuid4().hex}@example.com",
+            password="$2b$12$M2umlxuSaxTB0oilG4.d/OWSOKh2n2e3Zr3dAOOLRhUzHODHB19ua",
+            role="user",
+        )
+    )
+    start = datetime.datetime(2032, 1, 1, 14, 0)
+    for offset in range(0, rows, 10_000):
+        await db_session.execute(
+            insert(ReservationModel),
+            [
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user_id,
+                    "title": f"Reserva {i}",
+                    "address": "Rua do Export, 1",
+                    "check_in": start + datetime.timedelta(minutes=i),
+                    "check_out": start + datetime.timedelta(minutes=i, days=1),
+                    "status": "confirmed",
+                }
+                for i in range(offset, min(offset + 10_000, rows))
+            ],
+        )
+    await db_session.commit()
+
+
+@pytest.fixture
+def reservation_seeder():
+    # Insere N reservas em lotes (Core executemany) para os benchmarks.
+    return seed_reservations
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    # Stand-in do Redis para o RespCacheBackend (porta livre escolhida pelo SO).
+    server = await FakeRedisServer().start()
+    yield server
+    await server.stop()
+
+
+@pytest_asyncio.fixture
+async def shared_cache(fake_redis):
+    # Os caches da API passam a usar o servidor compartilhado, como com CACHE_URL.
+    caches = [
+        principal_cache,
+        token_version_cache,
+        bedroom_catalog_cache,
+        reservation_list_cache,
+    ]
+    previous = [cache.backend for cache in caches]
+    backend = RespCacheBackend(fake_redis.url, pool_size=10, timeout_seconds=1)
+    for cache in caches:
+        cache.backend = backend
+    yield fake_redis
+    for cache, original in zip(caches, previous):
+        cache.backend = original
+    await backend.close()
+
+
+@pytest.fixture
+def image_processor(tmp_path):
+    # Fotos e variantes num diretório temporário, geradas em threads.
+    processor = ProcessPoolImageProcessor(
+        0,
+        static_dir=str(tmp_path),
+        widths=[64, 128],
+        formats=["avif", "webp"],
+        quality=60,
+    )
+    app.dependency_overrides[deps.get_image_processor] = lambda: processor
+    yield processor
+    app.dependency_overrides.pop(deps.get_image_processor, None)
+
+
+def png_bytes(width: int, height: int) -> bytes:
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def png_factory():
+    # PNG em degradê com as dimensões pedidas, para os testes de imagens.
+    return png_bytes
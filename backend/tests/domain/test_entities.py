@@ -112,3 +112,21 @@ def test_create_bedroom():
     )
     assert bedroom.title == "Quarto Deluxe"
     assert bedroom.price == "R$ 300.00"
+
+
+def test_reservation_accepts_native_datetimes():
+    check_in = datetime(2031, 7, 10, 14, 0)
+    check_out = datetime(2031, 7, 13, 11, 0)
+    reservation = Reservation(
+        "res1", "user1", "Viagem", "Rua A, 123", check_in, check_out, "Pendente"
+    )
+    assert reservation.check_in is check_in
+
+    hydrated = Reservation.hydrate(
+        "res1", "user1", "Viagem", "Rua A, 123", check_in, check_out, "Pendente"
+    )
+    assert hydrated.check_out is check_out
+    assert hydrated.bedroom_id is None
+
+    reservation.update_reservation(new_check_in_str="11/07/2031 às 15h30")
+    assert reservation.check_in == datetime(2031, 7, 11, 15, 30)
@@ -1,6 +1,10 @@
 import pytest
 from blog.domain.value_objects.email_vo import Email
+from blog.domain.value_objects.money import Money
 from blog.domain.value_objects.password import Password, PasswordValidationError
+from blog.infra.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
 
 
 def test_valid_email():
@@ -49,3 +53,47 @@ def test_str_password_exibe_hash():
     senha = "Senha@123!"
     password = Password(senha)
     assert str(password) == password._hashed
+
+
+# Teste de hash assíncrono fora do event loop
+@pytest.mark.asyncio
+async def test_password_hash_with_hasher():
+    hasher = ProcessPoolPasswordHasher(max_workers=0)
+    password = Password("Senha@123!")
+    await password.hash_with(hasher)
+    assert await password.verify_with(hasher, str(password))
+    assert not await Password("Errada456@").verify_with(hasher, str(password))
+
+
+# Teste de senha carregada do banco (hash persistido)
+def test_password_from_hash_nao_revalida_nem_rehash():
+    hashed = Password("Senha@123!")._hashed
+    password = Password.from_hash(hashed)
+    assert str(password) == hashed
+    assert Password.from_hash("hash-legado-fraco") == Password.from_hash(
+        "hash-legado-fraco"
+    )
+
+
+# Credencial de login não passa pelas regras de força nem gera hash
+def test_password_for_login_nao_valida():
+    hashed = Password("Senha@123!")._hashed
+    assert Password.for_login("Senha@123!").verify(hashed)
+    assert not Password.for_login("fraca").verify(hashed)
+
+
+def test_money_parses_and_formats_display_prices():
+    assert Money.parse("R$ 280,00").cents == 28000
+    assert Money.parse("R$ 1.280,50").cents == 128050
+    assert Money.parse("R$ 200.00").cents == 20000
+    assert Money.parse("R$ 99").cents == 9900
+    assert Money(128050).format() == "R$ 1.280,50"
+    assert str(Money(500, "USD")) == "USD 5,00"
+    assert Money.parse("R$ 280,00") == Money(28000, "BRL")
+
+
+def test_money_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        Money.parse("sob consulta")
+    with pytest.raises(ValueError):
+        Money(-1)
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from blog.infra.repositories.in_memory.availability_index import AvailabilityIndex
+
+
+def day(n: int) -> datetime:
+    return datetime(2031, 1, n)
+
+
+def test_add_rejects_overlaps_and_keeps_disjoint_stays():
+    index = AvailabilityIndex()
+    assert index.add("a", "room", day(10), day(15))
+    assert index.add("b", "room", day(1), day(5))
+    assert index.add("c", "room", day(15), day(20))
+    assert index.add("d", "other", day(10), day(15))
+
+    assert not index.add("e", "room", day(4), day(6))
+    assert not index.add("e", "room", day(12), day(13))
+    assert not index.add("e", "room", day(1), day(28))
+    assert index.is_free("room", day(5), day(10))
+
+
+def test_moving_and_removing_a_stay_frees_the_old_interval():
+    index = AvailabilityIndex()
+    index.add("a", "room", day(10), day(15))
+    index.add("b", "room", day(15), day(20))
+
+    assert index.add("a", "room", day(8), day(12))
+    assert index.is_free("room", day(12), day(15))
+    assert not index.is_free("room", day(19), day(21))
+    assert index.is_free("room", day(19), day(21), ignore_id="b")
+
+    index.remove("b")
+    assert index.is_free("room", day(12), day(25))
@@ -0,0 +1,86 @@
+import csv
+import json
+import pytest
+from sqlalchemy import func, select
+
+from blog.api.bedrooms_mock import BedroomMock
+from blog.infra.models.bedroom_model import BedroomModel
+from blog.infra.seeding.bedroom_catalog import (
+    catalog_row,
+    read_catalog,
+    seed_bedrooms,
+    slugify,
+)
+
+RECORDS = [
+    {
+        "code": "suite-teste-1",
+        "title": "Suíte Teste 1",
+        "description": "Primeira suíte do catálogo.",
+        "price": "R$ 1.280,50",
+        "image": "/static/images/quarto1.png",
+    },
+    {
+        "code": "suite-teste-2",
+        "title": "Suíte Teste 2",
+        "description": "Segunda suíte do catálogo.",
+        "price_cents": "19900",
+        "image": "/static/images/quarto2.png",
+    },
+]
+
+
+def test_catalog_row_derives_code_id_and_cents():
+    row = catalog_row(BedroomMock[0])
+
+    assert row["code"] == slugify("Suíte Refúgio Tropical") == "suite-refugio-tropical"
+    assert row["price_cents"] == 28000
+    assert row["currency"] == "BRL"
+    assert catalog_row(BedroomMock[0])["id"] == row["id"]
+    assert catalog_row(RECORDS[0])["price_cents"] == 128050
+    assert catalog_row(RECORDS[1])["price_cents"] == 19900
+
+
+def test_read_catalog_from_json_and_csv(tmp_path):
+    json_path = tmp_path / "catalogo.json"
+    json_path.write_text(json.dumps(RECORDS), encoding="utf-8")
+    csv_path = tmp_path / "catalogo.csv"
+    with open(csv_path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(
+            file,
+            fieldnames=[
+                "code",
+                "title",
+                "description",
+                "price",
+                "price_cents",
+                "image",
+            ],
+        )
+        writer.writeheader()
+        writer.writerows(RECORDS)
+
+    assert [catalog_row(r) for r in read_catalog(str(json_path))] == [
+        catalog_row(r) for r in RECORDS
+    ]
+    assert [catalog_row(r) for r in read_catalog(str(csv_path))] == [
+        catalog_row(r) for r in RECORDS
+    ]
+    with pytest.raises(ValueError):
+        list(read_catalog(str(tmp_path / "catalogo.xml")))
+
+
+@pytest.mark.asyncio
+async def test_seed_is_idempotent_and_batched(db_session, query_counter):
+    query_counter.reset()
+    inserted = await seed_bedrooms(db_session, BedroomMock, batch_size=3)
+
+    assert inserted == len(BedroomMock)
+    inserts = [s for s in query_counter.statements if s.startswith("INSERT")]
+    assert len(inserts) == -(-len(BedroomMock) // 3)
+
+    assert await seed_bedrooms(db_session, BedroomMock, batch_size=3) == 0
+    assert await seed_bedrooms(db_session, BedroomMock + RECORDS, batch_size=100) == 2
+
+    total = await db_session.scalar(select(func.count()).select_from(BedroomModel))
+    assert total == len(BedroomMock) + len(RECORDS)
@@ -0,0 +1,21 @@
+from blog.api.http_cache import etag_matches
+from blog.infra.cache.bedroom_catalog_cache import CachedBody
+
+
+def test_cached_body_keeps_etag_through_the_backend():
+    entry = CachedBody(b'{"bedrooms":[]}')
+
+    decoded = CachedBody.decode(entry.encode())
+
+    assert entry.etag.startswith('"') and entry.etag.endswith('"')
+    assert (decoded.body, decoded.etag) == (entry.body, entry.etag)
+
+
+def test_etag_matches_if_none_match_lists():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"x", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abcd"', etag)
+    assert not etag_matches(None, etag)
+    assert etag_matches('"abc"', 'W/"abc"')
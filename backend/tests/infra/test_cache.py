@@ -0,0 +1,208 @@
+import asyncio
+import pytest
+
+from blog.infra.cache.cache import Cache
+from blog.infra.cache.cache_backend import CacheBackend
+from blog.infra.cache.lru_cache_backend import LRUCacheBackend
+from blog.infra.cache.resp_cache_backend import RespCacheBackend
+
+
+def bytes_cache(backend: CacheBackend, enabled: bool = True) -> Cache[bytes]:
+    return Cache(
+        "test", backend, ttl_seconds=60, encode=bytes, decode=bytes, enabled=enabled
+    )
+
+
+def resp_backend(url: str) -> RespCacheBackend:
+    return RespCacheBackend(url, pool_size=4, timeout_seconds=1)
+
+
+@pytest.mark.asyncio
+async def test_miss_storm_loads_once():
+    cache = bytes_cache(LRUCacheBackend(10))
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)
+        return b"valor"
+
+    values = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(50)))
+
+    assert values == [b"valor"] * 50
+    assert loads == 1
+    assert (cache.misses, cache.coalesced) == (50, 49)
+    assert await cache.get_or_load("k", load) == b"valor"
+    assert cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_reaches_every_waiter_and_is_not_cached():
+    cache = bytes_cache(LRUCacheBackend(10))
+
+    async def load():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("banco fora")
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("k", load) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_load_started_before_clear_is_not_stored():
+    cache = bytes_cache(LRUCacheBackend(10))
+
+    async def stale_load():
+        # Uma escrita termina (e limpa o cache) enquanto a leitura carrega.
+        await cache.clear()
+        return b"antigo"
+
+    assert await cache.get_or_load("k", stale_load) == b"antigo"
+    assert await cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_missing_values_and_disabled_cache_are_not_stored():
+    backend = LRUCacheBackend(10)
+    cache = bytes_cache(backend, enabled=False)
+
+    async def not_found():
+        return None
+
+    async def load():
+        return b"{}"
+
+    assert await bytes_cache(backend).get_or_load("x", not_found) is None
+    await cache.get_or_load("k", load)
+    assert (await backend.stats())["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_resp_backend_round_trip_ttl_and_prefix(fake_redis):
+    backend = resp_backend(fake_redis.url)
+    try:
+        await backend.set("a:1", b"um", 60)
+        await backend.set("a:2", b"\r\ndois\x00", 60)
+        await backend.set("b:1", b"outro", 60)
+        await backend.set("curto", b"x", 0.01)
+
+        assert await backend.get("a:2") == b"\r\ndois\x00"
+        await asyncio.sleep(0.02)
+        assert await backend.get("curto") is None
+
+        await backend.delete_prefix("a:")
+        assert (await backend.get("a:1"), await backend.get("b:1")) == (None, b"outro")
+        assert (await backend.stats())["size"] == 1
+    finally:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_workers_sharing_the_server_see_each_other_invalidations(fake_redis):
+    first = bytes_cache(resp_backend(fake_redis.url))
+    second = bytes_cache(resp_backend(fake_redis.url))
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        return b"catalogo"
+
+    await first.get_or_load("list", load)
+    assert await second.get_or_load("list", load) == b"catalogo"
+    assert loads == 1
+
+    await second.clear()
+    assert await first.get("list") is None
+
+    await first.backend.close()
+    await second.backend.close()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_server_degrades_to_miss(fake_redis):
+    url = fake_redis.url
+    await fake_redis.stop()
+    cache = bytes_cache(resp_backend(url))
+
+    async def load():
+        return b"do banco"
+
+    assert await cache.get_or_load("k", load) == b"do banco"
+    await cache.clear()
+    assert cache.errors == 3
+
+
+@pytest.mark.asyncio
+async def test_scope_invalidation_is_a_single_set_and_skips_stale_loads(fake_redis):
+    first = bytes_cache(resp_backend(fake_redis.url))
+    second = bytes_cache(resp_backend(fake_redis.url))
+    values = iter([b"v1", b"v2", b"v3"])
+
+    async def load():
+        return next(values)
+
+    async def stale_load():
+        # Outro worker grava e invalida enquanto esta carga lê o banco.
+        await second.invalidate("u1")
+        return b"antigo"
+
+    assert await first.get_or_load("u1:p1", load, scope="u1") == b"v1"
+
+    commands = fake_redis.commands
+    assert await second.get_or_load("u1:p1", load, scope="u1") == b"v1"
+    assert fake_redis.commands == commands + 1
+
+    commands = fake_redis.commands
+    await second.invalidate("u1")
+    assert fake_redis.commands == commands + 1
+    assert await first.get_or_load("u1:p1", load, scope="u1") == b"v2"
+
+    assert await first.get_or_load("u1:p2", stale_load, scope="u1") == b"antigo"
+    assert await second.get_or_load("u1:p2", load, scope="u1") == b"v3"
+
+    await first.backend.close()
+    await second.backend.close()
+
+
+@pytest.mark.asyncio
+async def test_scope_generation_has_a_ttl_and_its_loss_misses_the_scope(fake_redis):
+    backend = resp_backend(fake_redis.url)
+    cache = bytes_cache(backend)
+    values = iter([b"v1", b"v2"])
+
+    async def load():
+        return next(values)
+
+    try:
+        assert await cache.get_or_load("u1:p", load, scope="u1") == b"v1"
+        expires, _ = fake_redis._data[b"test:generation:u1"]
+        assert expires is not None
+
+        # Despejada pelo maxmemory: o valor antigo não volta a valer.
+        await backend.delete(["test:generation:u1"])
+        assert await cache.get_or_load("u1:p", load, scope="u1") == b"v2"
+    finally:
+        await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_lru_generations_are_bounded_and_eviction_misses_the_scope():
+    backend = LRUCacheBackend(2)
+    cache = bytes_cache(backend)
+    values = iter([b"v1", b"v2"])
+
+    async def load():
+        return next(values)
+
+    await cache.get_or_load("u1:p", load, scope="u1")
+    for user in range(5):
+        await cache.invalidate(f"outro{user}")
+
+    assert (await backend.stats())["size"] == 2
+    assert await cache.get_or_load("u1:p", load, scope="u1") == b"v2"
@@ -0,0 +1,59 @@
+import pytest
+import sqlalchemy as sa
+
+from blog.infra.database import engine, pool_status, pool_wait_metrics, PoolWaitMetrics
+
+
+def test_pool_wait_metrics_aggregate():
+    metrics = PoolWaitMetrics()
+    metrics.record(0.002)
+    metrics.record(0.004)
+
+    data = metrics.as_dict()
+    assert data["checkouts"] == 2
+    assert data["avg_wait_ms"] == pytest.approx(3.0)
+    assert data["max_wait_ms"] == pytest.approx(4.0)
+
+
+@pytest.mark.asyncio
+async def test_pool_status_reports_checked_out_connections():
+    before = pool_wait_metrics.checkouts
+    async with engine.connect() as conn:
+        await conn.execute(sa.text("SELECT 1"))
+        status = pool_status()
+        assert status["checked_out"] == 1
+    await engine.dispose()
+
+    assert pool_wait_metrics.checkouts == before + 1
+    assert {"idle", "overflow", "avg_wait_ms", "max_wait_ms"} <= set(status)
+
+
+@pytest.mark.asyncio
+async def test_checkout_wait_excludes_connect_time(tmp_path):
+    import time
+
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from blog.infra.database import InstrumentedAsyncQueuePool
+
+    slow_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+    )
+    connect_seconds = 0.05
+
+    @event.listens_for(slow_engine.sync_engine, "connect")
+    def slow_connect(dbapi_connection, connection_record):
+        time.sleep(connect_seconds)
+
+    before = (pool_wait_metrics.checkouts, pool_wait_metrics.total_wait)
+    started = time.perf_counter()
+    async with slow_engine.connect() as conn:
+        await conn.execute(sa.text("SELECT 1"))
+    assert time.perf_counter() - started >= connect_seconds
+    await slow_engine.dispose()
+
+    assert pool_wait_metrics.checkouts == before[0] + 1
+    assert pool_wait_metrics.total_wait - before[1] < connect_seconds / 2
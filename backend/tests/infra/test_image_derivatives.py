@@ -0,0 +1,95 @@
+import io
+import json
+
+import pytest
+from PIL import Image
+
+from blog.infra.services.image_derivatives import SOURCES_DIR, content_name
+from blog.infra.services.process_pool_image_processor import (
+    ProcessPoolImageProcessor,
+)
+
+
+def url_to_path(tmp_path, url: str):
+    return tmp_path / url.removeprefix("/static/")
+
+
+@pytest.mark.asyncio
+async def test_store_writes_content_addressed_original_and_variants(
+    tmp_path, image_processor, png_factory
+):
+    data = png_factory(300, 150)
+    image, variants = await image_processor.store(data)
+
+    assert image == f"/static/derived/{content_name(data, 'png')}"
+    assert url_to_path(tmp_path, image).read_bytes() == data
+    assert set(variants) == {"image/avif", "image/webp"}
+    for mime_type, urls in variants.items():
+        assert set(urls) == {"64", "128"}
+        for width, url in urls.items():
+            encoded = url_to_path(tmp_path, url).read_bytes()
+            # O nome é o sha256 do próprio conteúdo da variante.
+            assert url.endswith(content_name(encoded, url.rsplit(".", 1)[1]))
+            with Image.open(io.BytesIO(encoded)) as variant:
+                assert variant.get_format_mimetype() == mime_type
+                assert variant.size == (int(width), int(width) // 2)
+
+    # O mesmo original não é decodificado de novo: as variantes vêm do registro.
+    source = tmp_path / "derived" / SOURCES_DIR / content_name(data, "json")
+    assert json.loads(source.read_text()) == variants
+    assert await image_processor.store(data) == (image, variants)
+
+
+@pytest.mark.asyncio
+async def test_variants_never_upscale_the_original(image_processor, png_factory):
+    _, variants = await image_processor.store(png_factory(100, 40))
+    assert set(variants["image/webp"]) == {"64", "100"}
+
+
+@pytest.mark.asyncio
+async def test_store_rejects_invalid_images(image_processor):
+    with pytest.raises(ValueError, match="Invalid image file."):
+        await image_processor.store(b"not an image")
+
+
+@pytest.mark.asyncio
+async def test_derive_only_reads_files_inside_the_static_dir(
+    tmp_path, image_processor, png_factory
+):
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "q.png").write_bytes(png_factory(128, 128))
+    (tmp_path / "images" / "broken.png").write_bytes(b"broken")
+    (tmp_path.parent / "outside.png").write_bytes(png_factory(128, 128))
+
+    variants = await image_processor.derive_many(
+        [
+            "/static/images/q.png",
+            "/static/images/q.png",
+            "/static/images/broken.png",
+            "/static/../outside.png",
+            "/static/images/missing.png",
+            "https://cdn.example.com/q.png",
+        ]
+    )
+    assert set(variants["/static/images/q.png"]["image/webp"]) == {"64", "128"}
+    assert [
+        variants[image]
+        for image in (
+            "/static/images/broken.png",
+            "/static/../outside.png",
+            "/static/images/missing.png",
+            "https://cdn.example.com/q.png",
+        )
+    ] == [None, None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_process_pool_generates_variants(tmp_path, png_factory):
+    processor = ProcessPoolImageProcessor(
+        1, static_dir=str(tmp_path), widths=[32], formats=["webp"], quality=60
+    )
+    try:
+        _, variants = await processor.store(png_factory(64, 64))
+    finally:
+        processor.shutdown()
+    assert list(variants) == ["image/webp"]
@@ -0,0 +1,157 @@
+import time
+import pytest
+
+from datetime import datetime
+
+from blog.domain.entities.reservation import Reservation
+from blog.infra.repositories.in_memory.in_memory_reservation_repository import (
+    InMemoryReservationRepository,
+)
+from blog.infra.services.bitmap_occupancy_calendar import BitmapOccupancyCalendar
+from blog.usecases.bedroom.rebuild_occupancy_calendar import RebuildOccupancyCalendar
+
+
+def create_reservation(
+    check_in: str,
+    check_out: str,
+    bedroom_id: str = "quarto-1",
+    status="Pendente",
+    id: str = "res1",
+) -> Reservation:
+    return Reservation(
+        id=id,
+        user_id="user1",
+        title="Reserva",
+        address="Rua A, 123",
+        check_in=check_in,
+        check_out=check_out,
+        status=status,
+        bedroom_id=bedroom_id,
+    )
+
+
+def occupied_days(calendar, year: int, month: int, bedroom_id="quarto-1"):
+    days = calendar.month(bedroom_id, year, month)
+    return [day for day, busy in enumerate(days, start=1) if busy]
+
+
+def test_occupy_marks_nights_and_release_clears_them():
+    calendar = BitmapOccupancyCalendar()
+    reservation = create_reservation("10/07/2031 às 14h00", "13/07/2031 às 11h00")
+
+    calendar.occupy(reservation)
+    assert occupied_days(calendar, 2031, 7) == [10, 11, 12]
+    assert len(calendar.month("quarto-1", 2031, 7)) == 31
+    assert occupied_days(calendar, 2031, 7, bedroom_id="quarto-2") == []
+
+    calendar.release(reservation)
+    assert occupied_days(calendar, 2031, 7) == []
+
+
+def test_stays_across_year_and_leap_day_boundaries():
+    calendar = BitmapOccupancyCalendar()
+    calendar.occupy(create_reservation("30/12/2031 às 14h00", "02/01/2032 às 11h00"))
+    calendar.occupy(create_reservation("28/02/2032 às 14h00", "02/03/2032 às 11h00"))
+
+    assert occupied_days(calendar, 2031, 12) == [30, 31]
+    assert occupied_days(calendar, 2032, 1) == [1]
+    assert occupied_days(calendar, 2032, 2) == [28, 29]
+    assert occupied_days(calendar, 2032, 3) == [1]
+
+
+def test_cancelled_and_unlinked_reservations_do_not_occupy():
+    calendar = BitmapOccupancyCalendar()
+    calendar.occupy(
+        create_reservation(
+            "10/07/2031 às 14h00", "13/07/2031 às 11h00", status="cancelled"
+        )
+    )
+    calendar.occupy(
+        create_reservation("10/07/2031 às 14h00", "13/07/2031 às 11h00", None)
+    )
+    assert calendar.stats()["bitmaps"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replaces_state_and_month_view_is_fast():
+    calendar = BitmapOccupancyCalendar()
+    calendar.occupy(create_reservation("01/01/2031 às 14h00", "05/01/2031 às 11h00"))
+
+    async def chunks():
+        yield [create_reservation("10/07/2031 às 14h00", "13/07/2031 às 11h00")]
+
+    assert await calendar.rebuild(chunks()) == 1
+    assert occupied_days(calendar, 2031, 1) == []
+    assert occupied_days(calendar, 2031, 7) == [10, 11, 12]
+
+    calls = 10_000
+    started = time.perf_counter()
+    for _ in range(calls):
+        calendar.month("quarto-1", 2031, 7)
+    per_call = (time.perf_counter() - started) / calls
+    print(f"visão mensal: {per_call * 1e6:.1f}µs por chamada")
+    assert per_call < 1e-3
+
+
+@pytest.mark.asyncio
+async def test_rebuild_replays_writes_made_while_loading():
+    calendar = BitmapOccupancyCalendar()
+    read = create_reservation("10/07/2031 às 14h00", "13/07/2031 às 11h00")
+    created = create_reservation(
+        "20/07/2031 às 14h00", "22/07/2031 às 11h00", id="res2"
+    )
+
+    async def chunks():
+        yield [read]
+        # Gravadas depois que a carga leu (ou deixou de ler) essas linhas.
+        calendar.release(read)
+        calendar.occupy(created)
+        yield []
+
+    await calendar.rebuild(chunks())
+
+    assert occupied_days(calendar, 2031, 7) == [20, 21]
+    calendar.release(created)
+    assert occupied_days(calendar, 2031, 7) == []
+
+
+@pytest.mark.asyncio
+async def test_rebuild_keeps_stays_that_started_before_the_window():
+    repo = InMemoryReservationRepository()
+    calendar = BitmapOccupancyCalendar()
+    for id, check_in, check_out in [
+        ("antes", "28/12/2030 às 14h00", "03/01/2031 às 11h00"),
+        ("encerrada", "20/12/2030 às 14h00", "24/12/2030 às 11h00"),
+    ]:
+        await repo.create_reservation(create_reservation(check_in, check_out, id=id))
+
+    occupied = await RebuildOccupancyCalendar(repo, calendar).execute(
+        since=datetime(2031, 1, 1)
+    )
+
+    assert occupied == 1
+    assert occupied_days(calendar, 2031, 1) == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_refresh_task_keeps_reloading_after_errors(monkeypatch):
+    import asyncio
+
+    from blog.api import main
+
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        if loads == 1:
+            raise RuntimeError("banco fora")
+        return 0
+
+    monkeypatch.setattr(main, "load_occupancy_calendar", load)
+    refresh = asyncio.create_task(main.refresh_occupancy_calendar(0))
+    while loads < 3:
+        await asyncio.sleep(0)
+    refresh.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await refresh
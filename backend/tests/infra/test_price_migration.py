@@ -0,0 +1,43 @@
+import importlib.util
+from pathlib import Path
+
+import sqlalchemy as sa
+
+MIGRATION = (
+    Path(__file__).resolve().parents[2]
+    / "alembic"
+    / "versions"
+    / "9d1f3b5a7c20_numeric_bedroom_prices_and_rates.py"
+)
+
+
+def load_migration():
+    spec = importlib.util.spec_from_file_location("price_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_backfill_keeps_prices_without_decimals_in_reais(tmp_path):
+    migration = load_migration()
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'prices.db'}")
+    prices = {
+        "sem-decimais": ("R$ 99", 9900),
+        "virgula": ("R$ 280,00", 28000),
+        "milhar": ("R$ 1.280,50", 128050),
+        "ponto": ("R$ 200.5", 20050),
+        "sem-numero": ("sob consulta", 0),
+    }
+    with engine.begin() as connection:
+        connection.execute(
+            sa.text("CREATE TABLE bedrooms (id TEXT, price TEXT, price_cents INTEGER)")
+        )
+        connection.execute(
+            sa.text("INSERT INTO bedrooms (id, price) VALUES (:id, :price)"),
+            [{"id": id, "price": price} for id, (price, _) in prices.items()],
+        )
+        migration.backfill_price_cents(connection)
+        rows = connection.execute(sa.text("SELECT id, price_cents FROM bedrooms"))
+
+        assert dict(rows.all()) == {id: cents for id, (_, cents) in prices.items()}
+    engine.dispose()
@@ -0,0 +1,84 @@
+import asyncio
+import json
+import uuid
+import pytest
+
+from blog.domain.entities.principal import Principal
+from blog.infra.cache.cache import Cache
+from blog.infra.cache.lru_cache_backend import LRUCacheBackend
+from blog.infra.cache.principal_cache import decode_principal, encode_principal
+
+
+def create_principal() -> Principal:
+    return Principal(id=str(uuid.uuid4()), role="user")
+
+
+def user_cache(ttl_seconds: float = 60, max_size: int = 10) -> Cache[Principal]:
+    return Cache(
+        "principal",
+        LRUCacheBackend(max_size),
+        ttl_seconds=ttl_seconds,
+        encode=encode_principal,
+        decode=decode_principal,
+    )
+
+
+def test_principal_codec_round_trip_keeps_only_authorization_fields():
+    principal = Principal(id=str(uuid.uuid4()), role="admin", token_version=3)
+
+    data = encode_principal(principal)
+    cached = decode_principal(data)
+
+    assert (cached.id, cached.role, cached.token_version) == (principal.id, "admin", 3)
+    assert json.loads(data) == [principal.id, "admin", 3]
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_and_miss_update_ratio():
+    cache = user_cache()
+    user = create_principal()
+
+    assert await cache.get(user.id) is None
+    await cache.set(user.id, user)
+    assert (await cache.get(user.id)).id == user.id
+    assert (await cache.get(user.id)).id == user.id
+
+    assert cache.hits == 2
+    assert cache.misses == 1
+    assert cache.hit_ratio == 2 / 3
+
+
+@pytest.mark.asyncio
+async def test_cache_expires_after_ttl():
+    cache = user_cache(ttl_seconds=0.01)
+    user = create_principal()
+    await cache.set(user.id, user)
+    await asyncio.sleep(0.02)
+
+    assert await cache.get(user.id) is None
+    stats = await cache.stats()
+    assert (stats["size"], stats["expirations"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = user_cache(max_size=2)
+    first, second, third = create_principal(), create_principal(), create_principal()
+    await cache.set(first.id, first)
+    await cache.set(second.id, second)
+    await cache.get(first.id)
+    await cache.set(third.id, third)
+
+    assert await cache.get(second.id) is None
+    assert (await cache.get(first.id)).id == first.id
+    assert (await cache.stats())["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_delete():
+    cache = user_cache()
+    user = create_principal()
+    await cache.set(user.id, user)
+    await cache.delete(user.id)
+
+    assert await cache.get(user.id) is None
@@ -0,0 +1,97 @@
+import datetime
+import uuid
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+
+from blog.domain.value_objects.email_vo import Email
+from blog.infra.models.reservation_model import ReservationModel
+from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+    SQLAlchemyReservationRepository,
+)
+from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+    SQLAlchemyUserRepository,
+)
+
+
+class StatementRecorder:
+    def __init__(self):
+        self.executed: list[tuple[str, object]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, *args, **kwargs):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.executed.append((statement, parameters))
+
+
+@pytest_asyncio.fixture
+async def recorder(setup_engine):
+    engine, _ = setup_engine
+    recorder = StatementRecorder()
+    event.listen(engine.sync_engine, "before_cursor_execute", recorder)
+    yield recorder
+    event.remove(engine.sync_engine, "before_cursor_execute", recorder)
+
+
+async def explain(db_session, statement: str, parameters) -> list[str]:
+    conn = await db_session.connection()
+    if conn.dialect.name == "postgresql":
+        # Com tabelas pequenas o Postgres prefere Seq Scan mesmo com índice;
+        # desligá-lo faz o plano mostrar se existe um índice utilizável.
+        await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+        return [row[0] for row in result]
+    result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[-1] for row in result]
+
+
+def sequential_scans(plan: list[str], table: str) -> list[str]:
+    return [
+        line
+        for line in plan
+        if f"Seq Scan on {table}" in line or line.startswith(f"SCAN {table}")
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reservations_of_a_user_use_the_user_check_in_index(db_session, recorder):
+    repo = SQLAlchemyReservationRepository(db_session)
+    user_id = str(uuid.uuid4())
+
+    await repo.get_reservations_by_user_id(user_id)
+    await repo.list_reservations_page(limit=20, user_id=user_id)
+    await repo.list_reservations_page(
+        limit=20,
+        user_id=user_id,
+        after=(datetime.datetime(2032, 1, 1), str(uuid.uuid4())),
+    )
+
+    assert len(recorder.executed) == 3
+    for statement, parameters in recorder.executed:
+        plan = await explain(db_session, statement, parameters)
+        assert not sequential_scans(plan, "reservations"), plan
+
+
+@pytest.mark.asyncio
+async def test_status_and_check_out_filter_uses_index(db_session):
+    stmt = select(ReservationModel.id).where(
+        ReservationModel.status == "confirmed",
+        ReservationModel.check_out < datetime.datetime(2032, 1, 1),
+    )
+    compiled = stmt.compile(
+        dialect=(await db_session.connection()).dialect,
+        compile_kwargs={"literal_binds": True},
+    )
+
+    plan = await explain(db_session, str(compiled), ())
+    assert not sequential_scans(plan, "reservations"), plan
+
+
+@pytest.mark.asyncio
+async def test_email_lookup_is_case_insensitive_and_indexed(db_session, recorder):
+    repo = SQLAlchemyUserRepository(db_session)
+
+    assert await repo.get_by_email(Email("Someone@Example.com")) is None
+
+    [(statement, parameters)] = recorder.executed
+    plan = await explain(db_session, statement, parameters)
+    assert not sequential_scans(plan, "users"), plan
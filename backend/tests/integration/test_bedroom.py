@@ -1,5 +1,8 @@
+import asyncio
 import pytest
 import datetime
+import json
+import uuid
 
 
 @pytest.mark.asyncio
@@ -35,3 +38,419 @@ async def test_list_bedrooms(client):
     assert "message" in data
     assert "bedrooms" in data
     assert isinstance(data["bedrooms"], list)
+
+
+@pytest.mark.asyncio
+async def test_list_available_bedrooms(client):
+    credentials = {"email": "available_user@example.com", "password": "Available@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Available User", **credentials}
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    bedrooms = (await client.get("/bedrooms")).json()["bedrooms"]
+    booked_id = bedrooms[0]["id"]
+    response = await client.post(
+        "/reservations/",
+        headers=headers,
+        json={
+            "title": "Reserva Ocupada",
+            "address": "Rua Ocupada, 1",
+            "check_in": "10/08/2031 às 14h00",
+            "check_out": "15/08/2031 às 11h00",
+            "bedroom_id": booked_id,
+        },
+    )
+    assert response.status_code == 201
+
+    response = await client.get(
+        "/bedrooms/available",
+        params={"check_in": "2031-08-12T14:00:00", "check_out": "2031-08-20T11:00:00"},
+    )
+    assert response.status_code == 200
+    available_ids = {b["id"] for b in response.json()["bedrooms"]}
+    assert available_ids == {b["id"] for b in bedrooms} - {booked_id}
+
+    response = await client.get(
+        "/bedrooms/available",
+        params={"check_in": "2031-08-15T14:00:00", "check_out": "2031-08-20T11:00:00"},
+    )
+    assert len(response.json()["bedrooms"]) == len(bedrooms)
+
+    response = await client.get(
+        "/bedrooms/available",
+        params={"check_in": "2031-08-20T00:00:00", "check_out": "2031-08-12T00:00:00"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bedroom_calendar_follows_reservations_and_rebuild(client):
+    credentials = {"email": "calendar_admin@example.com", "password": "Calendar@123!"}
+    response = await client.post(
+        "/auth/register",
+        json={"name": "Calendar Admin", "role": "admin", **credentials},
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    bedroom_id = (await client.get("/bedrooms")).json()["bedrooms"][0]["id"]
+
+    async def occupied_days() -> list[int]:
+        response = await client.get(
+            f"/bedrooms/{bedroom_id}/calendar", params={"year": 2031, "month": 9}
+        )
+        assert response.status_code == 200
+        return [
+            day for day, busy in enumerate(response.json()["occupied"], start=1) if busy
+        ]
+
+    response = await client.post(
+        "/reservations/",
+        headers=headers,
+        json={
+            "title": "Reserva Calendário",
+            "address": "Rua Calendário, 1",
+            "check_in": "05/09/2031 às 14h00",
+            "check_out": "08/09/2031 às 11h00",
+            "bedroom_id": bedroom_id,
+        },
+    )
+    assert response.status_code == 201
+    assert await occupied_days() == [5, 6, 7]
+
+    for variant in (bedroom_id.upper(), bedroom_id.replace("-", "")):
+        response = await client.get(
+            f"/bedrooms/{variant}/calendar", params={"year": 2031, "month": 9}
+        )
+        assert response.status_code == 200
+        assert response.json()["occupied"][4:8] == [True, True, True, False]
+
+    response = await client.post(
+        "/internal/occupancy-calendar/rebuild", headers=headers
+    )
+    assert response.status_code == 200
+    assert await occupied_days() == [5, 6, 7]
+
+    response = await client.get(
+        f"/bedrooms/{bedroom_id}/calendar", params={"year": 2031, "month": 13}
+    )
+    assert response.status_code == 422
+    response = await client.get(
+        "/bedrooms/nao-e-uuid/calendar", params={"year": 2031, "month": 9}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_quote_stays_with_rate_override(client):
+    credentials = {"email": "rates_admin@example.com", "password": "RatesAdm@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Rates Admin", "role": "admin", **credentials}
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    bedroom = (await client.get("/bedrooms")).json()["bedrooms"][0]
+    assert isinstance(bedroom["price_cents"], int)
+    assert bedroom["currency"] == "BRL"
+
+    response = await client.post(
+        f"/bedrooms/{bedroom['id']}/rates",
+        headers=headers,
+        json={
+            "price_cents": 99900,
+            "start_date": "2031-12-24",
+            "end_date": "2031-12-26",
+        },
+    )
+    assert response.status_code == 201
+    assert response.json()["price_cents"] == 99900
+
+    # Id em maiúsculas: normalizado antes de chegar ao tarifador em memória.
+    response = await client.post(
+        "/bedrooms/quote",
+        json={
+            "stays": [
+                {
+                    "bedroom_id": bedroom["id"].upper(),
+                    "check_in": "2031-12-23",
+                    "check_out": "2031-12-26",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 200
+    quote = response.json()["quotes"][0]
+    assert quote["nights"] == 3
+    assert quote["total_cents"] == bedroom["price_cents"] + 2 * 99900
+
+    response = await client.post(
+        "/bedrooms/quote",
+        json={
+            "stays": [
+                {
+                    "bedroom_id": str(uuid.uuid4()),
+                    "check_in": "2031-12-23",
+                    "check_out": "2031-12-26",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/bedrooms/quote",
+        json={
+            "stays": [
+                {
+                    "bedroom_id": "nao-existe",
+                    "check_in": "2031-12-23",
+                    "check_out": "2031-12-26",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 422
+
+    # Estadia longa demais (422) e janela do lote longa demais (400).
+    response = await client.post(
+        "/bedrooms/quote",
+        json={
+            "stays": [
+                {
+                    "bedroom_id": bedroom["id"],
+                    "check_in": "0001-01-01",
+                    "check_out": "9999-12-31",
+                }
+            ]
+        },
+    )
+    assert response.status_code == 422
+    response = await client.post(
+        "/bedrooms/quote",
+        json={
+            "stays": [
+                {
+                    "bedroom_id": bedroom["id"],
+                    "check_in": "2031-01-01",
+                    "check_out": "2031-01-05",
+                },
+                {
+                    "bedroom_id": bedroom["id"],
+                    "check_in": "2041-01-01",
+                    "check_out": "2041-01-05",
+                },
+            ]
+        },
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_import_bedrooms_csv_and_jsonl(client):
+    credentials = {"email": "import_admin@example.com", "password": "Import@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Import Admin", "role": "admin", **credentials}
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    csv_body = (
+        "code,title,description,price,image\n"
+        "parceiro-1,Chalé Serra,Chalé com lareira e vista para a serra.,"
+        '"R$ 1.280,50",/static/images/quarto1.png\n'
+        "parceiro-2,X,Descrição curta demais?,R$ 10,img.png\n"
+        "parceiro-3,Cabana Lago,Cabana à beira do lago com deck.,,/static/c.png\n"
+    )
+    response = await client.post(
+        "/bedrooms/import",
+        headers=headers,
+        files={"file": ("parceiro.csv", csv_body.encode(), "text/csv")},
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert (report["rows"], report["imported"], report["failed"]) == (3, 1, 2)
+    assert [e["line"] for e in report["errors"]] == [3, 4]
+    assert report["rows_per_second"] >= 0
+
+    jsonl_body = "\n".join(
+        [
+            json.dumps(
+                {
+                    "code": "parceiro-1",
+                    "title": "Chalé Serra",
+                    "description": "Chalé com lareira e vista para a serra.",
+                    "price_cents": 99000,
+                    "image": "/static/images/quarto1.png",
+                }
+            ),
+            "{nao e json",
+        ]
+    )
+    response = await client.post(
+        "/bedrooms/import",
+        headers=headers,
+        params={"format": "jsonl"},
+        files={"file": ("parceiro.jsonl", jsonl_body.encode(), "application/x-ndjson")},
+    )
+    assert response.status_code == 200
+    assert response.json()["errors"] == [{"line": 2, "message": "Invalid JSON."}]
+
+    bedrooms = (await client.get("/bedrooms")).json()["bedrooms"]
+    imported = [b for b in bedrooms if b["code"] == "parceiro-1"]
+    assert len(imported) == 1
+    assert imported[0]["price_cents"] == 99000
+
+    response = await client.post(
+        "/auth/register",
+        json={
+            "name": "Import User",
+            "email": "import_user@example.com",
+            "password": "Import@123!",
+        },
+    )
+    response = await client.post(
+        "/auth/login",
+        json={"email": "import_user@example.com", "password": "Import@123!"},
+    )
+    response = await client.post(
+        "/bedrooms/import",
+        headers={"Authorization": f"Bearer {response.json()['access_token']}"},
+        files={"file": ("parceiro.csv", csv_body.encode(), "text/csv")},
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_bedroom_catalog_etag_and_invalidation(client, query_counter):
+    response = await client.get("/bedrooms")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "public, no-cache"
+    bedroom_id = response.json()["bedrooms"][0]["id"]
+
+    # Servido do cache: nenhuma consulta ao banco, mesmo ETag.
+    query_counter.reset()
+    response = await client.get("/bedrooms")
+    assert response.headers["etag"] == etag
+    response = await client.get("/bedrooms", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert query_counter.count == 0
+
+    response = await client.get(f"/bedrooms/{bedroom_id}")
+    detail_etag = response.headers["etag"]
+    response = await client.get(
+        f"/bedrooms/{bedroom_id}", headers={"If-None-Match": f"W/{detail_etag}"}
+    )
+    assert response.status_code == 304
+
+    credentials = {"email": "cache_admin@example.com", "password": "CacheAdm@123!"}
+    await client.post(
+        "/auth/register", json={"name": "Cache Admin", "role": "admin", **credentials}
+    )
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    csv_body = (
+        "code,title,description,price_cents,image\n"
+        "cache-1,Suíte Nova,Suíte recém-importada no catálogo.,45000,/static/s.png\n"
+    )
+    response = await client.post(
+        "/bedrooms/import",
+        headers=headers,
+        files={"file": ("parceiro.csv", csv_body.encode(), "text/csv")},
+    )
+    assert response.json()["imported"] == 1
+
+    response = await client.get("/bedrooms", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert "cache-1" in {b["code"] for b in response.json()["bedrooms"]}
+
+    response = await client.get(f"/bedrooms/{uuid.uuid4()}")
+    assert response.status_code == 404
+    assert "etag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_catalog_miss_storm_runs_a_single_query(concurrent_client, query_counter):
+    from blog.infra.cache.bedroom_catalog_cache import bedroom_catalog_cache
+
+    await bedroom_catalog_cache.clear()
+    query_counter.reset()
+
+    responses = await asyncio.gather(
+        *(concurrent_client.get("/bedrooms") for _ in range(30))
+    )
+
+    assert {r.status_code for r in responses} == {200}
+    assert len({r.headers["etag"] for r in responses}) == 1
+    catalog_queries = [s for s in query_counter.statements if "FROM bedrooms" in s]
+    assert len(catalog_queries) == 1
+
+
+@pytest.mark.asyncio
+async def test_bedroom_photo_upload_and_import_publish_variants(
+    client, image_processor, png_factory, tmp_path
+):
+    credentials = {"email": "photo_admin@example.com", "password": "PhotoAdm@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Photo Admin", "role": "admin", **credentials}
+    )
+    response = await client.post("/auth/login", json=credentials)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    (tmp_path / "images").mkdir()
+    (tmp_path / "images" / "serra.png").write_bytes(png_factory(256, 128))
+    csv_body = (
+        "code,title,description,price,image\n"
+        "foto-1,Chalé Serra,Chalé com lareira e vista para a serra.,"
+        '"R$ 300,00",/static/images/serra.png\n'
+    )
+    response = await client.post(
+        "/bedrooms/import",
+        headers=headers,
+        files={"file": ("parceiro.csv", csv_body.encode(), "text/csv")},
+    )
+    assert response.json()["imported"] == 1
+
+    bedrooms = (await client.get("/bedrooms")).json()["bedrooms"]
+    bedroom = next(b for b in bedrooms if b["code"] == "foto-1")
+    assert bedroom["image"] == "/static/images/serra.png"
+    assert bedroom["thumbnail"].endswith(".webp")
+    assert set(bedroom["srcset"]) == {"image/avif", "image/webp"}
+    widths = [
+        entry.rsplit(" ", 1)[1] for entry in bedroom["srcset"]["image/webp"].split(", ")
+    ]
+    assert widths == ["64w", "128w"]
+
+    response = await client.put(
+        f"/bedrooms/{bedroom['id']}/image",
+        headers=headers,
+        files={"file": ("nova.png", png_factory(512, 512), "image/png")},
+    )
+    assert response.status_code == 200
+    uploaded = response.json()
+    assert uploaded["image"].startswith("/static/derived/")
+    assert uploaded["thumbnail"] != bedroom["thumbnail"]
+    detail = (await client.get(f"/bedrooms/{bedroom['id']}")).json()
+    assert detail["srcset"] == uploaded["srcset"]
+
+    response = await client.put(
+        f"/bedrooms/{bedroom['id']}/image",
+        headers=headers,
+        files={"file": ("nova.png", b"not an image", "image/png")},
+    )
+    assert response.status_code == 400
+    response = await client.put(
+        f"/bedrooms/{uuid.uuid4()}/image",
+        headers=headers,
+        files={"file": ("nova.png", png_factory(32, 32), "image/png")},
+    )
+    assert response.status_code == 404
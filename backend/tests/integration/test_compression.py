@@ -0,0 +1,187 @@
+import gzip
+import json
+
+import brotli
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from blog.api.compression import negotiate_encoding
+from blog.api.settings import settings
+from blog.api.static_assets import (
+    PrecompressedStaticFiles,
+    asset_url,
+    build_static_assets,
+    is_immutable,
+)
+from blog.infra.seeding.bedroom_catalog import seed_bedrooms
+
+
+def test_negotiate_encoding_respects_weights():
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+    assert negotiate_encoding("gzip;q=0, br;q=0") is None
+    assert negotiate_encoding("*") == "br"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+@pytest.mark.asyncio
+async def test_json_listing_is_compressed_above_threshold(db_session, client):
+    await seed_bedrooms(
+        db_session,
+        (
+            {
+                "code": f"gzip-{i}",
+                "title": f"Quarto {i}",
+                "description": "Quarto para testar a compressão.",
+                "price": "R$ 200,00",
+                "image": "q.png",
+            }
+            for i in range(50)
+        ),
+        1000,
+    )
+
+    plain = await client.get("/bedrooms", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert "Accept-Encoding" in plain.headers["vary"]
+
+    for encoding in ("gzip", "br"):
+        response = await client.get("/bedrooms", headers={"Accept-Encoding": encoding})
+        assert response.headers["content-encoding"] == encoding
+        assert response.num_bytes_downloaded < len(plain.content) / 3
+        assert response.json() == plain.json()
+        # Outros bytes, mesmo conteúdo: o ETag do corpo comprimido é fraco.
+        assert response.headers["etag"] == f"W/{plain.headers['etag']}"
+
+    for etag in (plain.headers["etag"], response.headers["etag"]):
+        revalidated = await client.get(
+            "/bedrooms", headers={"Accept-Encoding": "br", "If-None-Match": etag}
+        )
+        assert revalidated.status_code == 304
+        assert "content-encoding" not in revalidated.headers
+        assert revalidated.headers["etag"] == etag
+
+    small = await client.get("/", headers={"Accept-Encoding": "br"})
+    assert "content-encoding" not in small.headers
+
+
+def build_site(tmp_path):
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css" / "app.css").write_text("body { margin: 0; }\n" * 200)
+    (tmp_path / "quarto.png").write_bytes(b"\x89PNG" + bytes(range(256)) * 4)
+    return build_static_assets(str(tmp_path))
+
+
+def test_build_static_assets_hashes_and_precompresses(tmp_path):
+    manifest = build_site(tmp_path)
+
+    css = manifest["css/app.css"]
+    assert css.startswith("css/app.") and css.endswith(".css")
+    data = (tmp_path / "css" / "app.css").read_bytes()
+    assert (tmp_path / css).read_bytes() == data
+    assert brotli.decompress((tmp_path / f"{css}.br").read_bytes()) == data
+    assert gzip.decompress((tmp_path / f"{css}.gz").read_bytes()) == data
+    # PNG já é comprimido: sem irmãos .br/.gz.
+    assert not (tmp_path / f"{manifest['quarto.png']}.br").exists()
+
+    # Rodar de novo não gera nomes com hash de arquivos já gerados.
+    assert build_static_assets(str(tmp_path)) == manifest
+    assert json.loads((tmp_path / "manifest.json").read_text()) == manifest
+
+
+@pytest.mark.asyncio
+async def test_static_files_serve_precompressed_immutable_assets(tmp_path):
+    manifest = build_site(tmp_path)
+    app = Starlette(
+        routes=[
+            Mount(
+                "/static",
+                PrecompressedStaticFiles(
+                    directory=str(tmp_path), immutable_max_age=31_536_000
+                ),
+            )
+        ]
+    )
+    css_path = f"/static/{manifest['css/app.css']}"
+    original = (tmp_path / "css" / "app.css").read_bytes()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        for encoding, sibling in (("br", ".br"), ("gzip", ".gz")):
+            response = await client.get(css_path, headers={"Accept-Encoding": encoding})
+            assert response.status_code == 200
+            assert response.headers["content-encoding"] == encoding
+            assert response.headers["content-type"].startswith("text/css")
+            assert response.headers["cache-control"] == (
+                "public, max-age=31536000, immutable"
+            )
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.num_bytes_downloaded == len(
+                (tmp_path / f"{manifest['css/app.css']}{sibling}").read_bytes()
+            )
+            assert response.content == original
+
+        response = await client.get(css_path, headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.content == original
+
+        # O original sem hash não é imutável.
+        response = await client.get("/static/css/app.css")
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+        response = await client.get(
+            f"/static/{manifest['quarto.png']}", headers={"Accept-Encoding": "br"}
+        )
+        assert "content-encoding" not in response.headers
+        assert "immutable" in response.headers["cache-control"]
+
+
+@pytest.mark.asyncio
+async def test_hex_looking_names_are_neither_skipped_nor_immutable(tmp_path):
+    names = [
+        "deadbeefcafe.png",
+        "0123456789abcdef0123456789abcdef01234567.js",
+        # Formato do build, mas o hash não é o do conteúdo.
+        "logo.0123456789ab.svg",
+    ]
+    for name in names:
+        (tmp_path / name).write_bytes(b"conteudo que pode mudar")
+
+    manifest = build_static_assets(str(tmp_path))
+    assert sorted(manifest) == sorted(names)
+    assert is_immutable(f"derived/ab/ab{'0' * 62}.avif")
+    assert not is_immutable(f"derived/ab/cd{'0' * 62}.avif")
+    assert build_static_assets(str(tmp_path)) == manifest
+
+    app = Starlette(
+        routes=[
+            Mount(
+                "/static",
+                PrecompressedStaticFiles(
+                    directory=str(tmp_path), immutable_max_age=31_536_000
+                ),
+            )
+        ]
+    )
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        for name in names[:2]:
+            response = await client.get(f"/static/{name}")
+            assert response.status_code == 200
+            assert "immutable" not in response.headers.get("cache-control", "")
+            response = await client.get(f"/static/{manifest[name]}")
+            assert "immutable" in response.headers["cache-control"]
+
+
+def test_asset_url_uses_the_manifest(tmp_path, monkeypatch):
+    manifest = build_site(tmp_path)
+    monkeypatch.setattr(settings, "STATIC_DIR", str(tmp_path))
+
+    assert asset_url("/static/quarto.png") == f"/static/{manifest['quarto.png']}"
+    assert asset_url("/static/outro.png") == "/static/outro.png"
+    assert asset_url("https://cdn.example.com/q.png") == "https://cdn.example.com/q.png"
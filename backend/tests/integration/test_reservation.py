@@ -1,3 +1,5 @@
+import asyncio
+import json
 import uuid
 import pytest
 import datetime
@@ -53,6 +55,12 @@ async def register_and_login_test_user(
     return login_response.json()["access_token"], login_response.json()["access_token"]
 
 
+async def get_bedroom_id(client, index: int = 0) -> str:
+    response = await client.get("/bedrooms")
+    assert response.status_code == 200
+    return response.json()["bedrooms"][index]["id"]
+
+
 @pytest.mark.asyncio
 async def test_create_and_get_reservation(client):
     user_token, _ = await register_and_login_test_user(
@@ -67,7 +75,7 @@ async def test_create_and_get_reservation(client):
         "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
         "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
         "status": "confirmed",
-        "bedroom_id": str(uuid.uuid4()),
+        "bedroom_id": await get_bedroom_id(client),
     }
 
     create_response = await client.post(
@@ -141,7 +149,7 @@ async def test_create_reservation_internal_server_error(client, mocker):
         "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
         "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
         "status": "confirmed",
-        "bedroom_id": str(uuid.uuid4()),
+        "bedroom_id": await get_bedroom_id(client),
     }
     create_response = await client.post(
         "/reservations/",
@@ -167,6 +175,12 @@ async def test_get_reservation_not_found(client):
     assert get_response.status_code == 404
     assert get_response.json()["detail"] == "Reservation not found"
 
+    malformed_response = await client.get(
+        "/reservations/nao-e-um-uuid",
+        headers={"Authorization": f"Bearer {user_token}"},
+    )
+    assert malformed_response.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_get_reservation_unauthorized_user(client):
@@ -184,7 +198,7 @@ async def test_get_reservation_unauthorized_user(client):
             "check_in": check_in_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": check_out_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response1.status_code == 201
@@ -251,7 +265,7 @@ async def test_get_reservations_by_user_id_with_reservations(client):
                 "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
                 "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
                 "status": "Pendente",
-                "bedroom_id": str(uuid.uuid4()),
+                "bedroom_id": await get_bedroom_id(client, i),
             },
         )
         assert create_response.status_code == 201
@@ -267,7 +281,7 @@ async def test_get_reservations_by_user_id_with_reservations(client):
 
 
 @pytest.mark.asyncio
-async def test_update_reservation(client):
+async def test_update_reservation(client, query_counter):
     user_token, _ = await register_and_login_test_user(
         client, "update_user@example.com", "Update@123!"
     )
@@ -283,7 +297,7 @@ async def test_update_reservation(client):
             "check_in": initial_check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": initial_check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
             "status": "confirmed",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response.status_code == 201
@@ -298,12 +312,17 @@ async def test_update_reservation(client):
         "status": "confirmed",
     }
 
+    query_counter.reset()
     update_response = await client.put(
         f"/reservations/{reservation_id}",
         headers={"Authorization": f"Bearer {user_token}"},
         json=update_data,
     )
     assert update_response.status_code == 200
+    # Sem SELECT prévio: a reserva é lida e gravada num único UPDATE.
+    statements = [s for s in query_counter.statements if "reservations" in s]
+    assert len(statements) == 1
+    assert "UPDATE reservations" in statements[0]
 
     updated_data = update_response.json()["reservation"]
     assert updated_data["id"] == reservation_id
@@ -330,7 +349,7 @@ async def test_update_reservation_internal_server_error(client, mocker):
             "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response.status_code == 201
@@ -368,7 +387,7 @@ async def test_cancel_reservation(client):
             "check_in": initial_check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": initial_check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response.status_code == 201
@@ -402,7 +421,7 @@ async def test_cancel_reservation_unauthorized_user(client):
             "check_in": check_in_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": check_out_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response1.status_code == 201
@@ -439,7 +458,7 @@ async def test_cancel_reservation_internal_server_error(client, mocker):
             "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response.status_code == 201
@@ -473,7 +492,7 @@ async def test_list_all_reservations_admin_access(client):
         "check_in": check_in_dt_admin.strftime("%d/%m/%Y às %Hh%M"),
         "check_out": check_out_dt_admin.strftime("%d/%m/%Y às %Hh%M"),
         "status": "confirmed",
-        "bedroom_id": str(uuid.uuid4()),
+        "bedroom_id": await get_bedroom_id(client),
     }
     create_admin_res_response = await client.post(
         "/reservations/",
@@ -491,6 +510,22 @@ async def test_list_all_reservations_admin_access(client):
     assert "reservations" in list_data
     assert len(list_data["reservations"]) >= 1
 
+    owner_id = create_admin_res_response.json()["reservation"]["user_id"]
+    list_response = await client.get(
+        "/reservations/",
+        params={"user_id": owner_id},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert {r["user_id"] for r in list_response.json()["reservations"]} == {owner_id}
+
+    # Um id que não é UUID não chega ao banco (a coluna é uuid no Postgres).
+    list_response = await client.get(
+        "/reservations/",
+        params={"user_id": "nao-e-uuid"},
+        headers={"Authorization": f"Bearer {admin_token}"},
+    )
+    assert list_response.status_code == 422
+
 
 @pytest.mark.asyncio
 async def test_list_all_reservations_user_forbidden(client):
@@ -525,7 +560,7 @@ async def test_delete_reservation(client):
             "check_in": initial_check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": initial_check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response.status_code == 201
@@ -563,7 +598,7 @@ async def test_delete_reservation_unauthorized_user(client):
             "check_in": check_in_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "check_out": check_out_dt1.strftime("%d/%m/%Y às %Hh%M"),
             "status": "Pendente",
-            "bedroom_id": str(uuid.uuid4()),
+            "bedroom_id": await get_bedroom_id(client),
         },
     )
     assert create_response1.status_code == 201
@@ -581,3 +616,367 @@ async def test_delete_reservation_unauthorized_user(client):
         delete_response_unauth.json()["detail"]
         == "Not authorized to delete this reservation"
     )
+
+
+@pytest.mark.asyncio
+async def test_reservation_writes_use_a_single_statement(db_session, query_counter):
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+        SQLAlchemyUserRepository,
+    )
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+        SQLAlchemyReservationRepository,
+    )
+
+    user = User(
+        id=str(uuid.uuid4()),
+        name="Query User",
+        email=Email("query_count_user@example.com"),
+        password=Password.from_hash("hash"),
+        role="user",
+        phone=None,
+        document=None,
+        address=None,
+    )
+    await SQLAlchemyUserRepository(db_session).register(user)
+    reservation_repo = SQLAlchemyReservationRepository(db_session)
+
+    check_in = datetime.datetime(2030, 1, 10, 14, 0)
+    check_out = datetime.datetime(2030, 1, 15, 11, 0)
+    query_counter.reset()
+    created = await reservation_repo.create_reservation(
+        Reservation(
+            id=None,
+            user_id=user.id,
+            title="Reserva Contada",
+            address="Rua das Queries, 1",
+            check_in=check_in.strftime("%d/%m/%Y às %Hh%M"),
+            check_out=check_out.strftime("%d/%m/%Y às %Hh%M"),
+            status="Pendente",
+        )
+    )
+    assert query_counter.count == 1
+    assert created.id is not None
+    assert created.check_in == check_in
+    assert created.status == "Pendente"
+
+    query_counter.reset()
+    previous, updated = await reservation_repo.update_reservation(
+        created.id,
+        title="Reserva Atualizada",
+        check_in=check_in + datetime.timedelta(days=1),
+        status="confirmed",
+    )
+    assert query_counter.count == 1
+    assert (previous.title, previous.check_in) == ("Reserva Contada", check_in)
+    assert updated.id == created.id
+    assert updated.title == "Reserva Atualizada"
+    assert updated.status == "confirmed"
+    assert updated.check_in == check_in + datetime.timedelta(days=1)
+    assert updated.check_out == check_out
+    assert updated.address == "Rua das Queries, 1"
+
+    # Datas mescladas com as gravadas: o check-out novo fica antes do check-in.
+    query_counter.reset()
+    with pytest.raises(ValueError):
+        await reservation_repo.update_reservation(
+            created.id, check_out=check_in - datetime.timedelta(days=1)
+        )
+    assert query_counter.count == 2
+
+    query_counter.reset()
+    assert await reservation_repo.update_reservation(str(uuid.uuid4())) is None
+    assert query_counter.count == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_delete_check_ownership_in_one_statement(
+    db_session, query_counter
+):
+    from blog.domain.repositories.reservation_repository import (
+        ReservationPermissionError,
+    )
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+        SQLAlchemyUserRepository,
+    )
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_reservation_repository import (
+        SQLAlchemyReservationRepository,
+    )
+
+    owners = []
+    for email in ["owner_scope@example.com", "other_scope@example.com"]:
+        user = User(
+            id=str(uuid.uuid4()),
+            name="Scope User",
+            email=Email(email),
+            password=Password.from_hash("hash"),
+            role="user",
+            phone=None,
+            document=None,
+            address=None,
+        )
+        owners.append(await SQLAlchemyUserRepository(db_session).register(user))
+    owner, other = owners
+    reservation_repo = SQLAlchemyReservationRepository(db_session)
+    reservation = await reservation_repo.create_reservation(
+        Reservation(
+            id=None,
+            user_id=owner.id,
+            title="Reserva com Dono",
+            address="Rua do Dono, 1",
+            check_in="10/01/2030 às 14h00",
+            check_out="15/01/2030 às 11h00",
+            status="Pendente",
+        )
+    )
+
+    query_counter.reset()
+    canceled = await reservation_repo.cancel_reservation(reservation.id, owner.id)
+    assert canceled.status == "cancelled"
+    assert query_counter.count == 1
+
+    with pytest.raises(ReservationPermissionError):
+        await reservation_repo.cancel_reservation(reservation.id, other.id)
+    with pytest.raises(ReservationPermissionError):
+        await reservation_repo.delete_reservation(reservation.id, other.id)
+
+    query_counter.reset()
+    deleted = await reservation_repo.delete_reservation(reservation.id, owner.id)
+    assert (deleted.id, deleted.bedroom_id) == (reservation.id, reservation.bedroom_id)
+    assert query_counter.count == 1
+    assert await reservation_repo.cancel_reservation(reservation.id, owner.id) is None
+
+
+@pytest.mark.asyncio
+async def test_list_my_reservations_paginates_with_cursor(client):
+    user_token, _ = await register_and_login_test_user(
+        client, "paged_user@example.com", "Paged@123!"
+    )
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    for i in range(5):
+        check_in_dt = datetime.datetime(2030, 3, 1 + i, 14, 0)
+        check_out_dt = check_in_dt + datetime.timedelta(days=2)
+        create_response = await client.post(
+            "/reservations/",
+            headers=headers,
+            json={
+                "title": f"Reserva Paginada {i}",
+                "address": f"Rua Paginada {i}",
+                "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
+                "check_out": check_out_dt.strftime("%d/%m/%Y às %Hh%M"),
+            },
+        )
+        assert create_response.status_code == 201
+
+    titles = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get("/reservations/me", headers=headers, params=params)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["reservations"]) <= 2
+        titles += [r["title"] for r in data["reservations"]]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert titles == [f"Reserva Paginada {i}" for i in range(5)]
+
+    response = await client.get(
+        "/reservations/me",
+        headers=headers,
+        params={
+            "check_in_from": "2030-03-02T00:00:00",
+            "check_in_to": "2030-03-04T00:00:00",
+        },
+    )
+    assert [r["title"] for r in response.json()["reservations"]] == [
+        "Reserva Paginada 1",
+        "Reserva Paginada 2",
+    ]
+
+    response = await client.get(
+        "/reservations/me", headers=headers, params={"cursor": "nao-e-um-cursor"}
+    )
+    assert response.status_code == 400
+
+    response = await client.get(
+        "/reservations/me", headers=headers, params={"limit": 100000}
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_export_reservations_streams_ndjson_and_csv(client):
+    admin_token, _ = await register_and_login_test_user(
+        client, "export_admin@example.com", "Export@123!", role="admin"
+    )
+    user_token, _ = await register_and_login_test_user(
+        client, "export_user@example.com", "Export@123!"
+    )
+    for i in range(3):
+        check_in_dt = datetime.datetime(2031, 5, 1 + i, 14, 0)
+        create_response = await client.post(
+            "/reservations/",
+            headers={"Authorization": f"Bearer {user_token}"},
+            json={
+                "title": f"Reserva Exportada {i}",
+                "address": f"Rua Exportada {i}",
+                "check_in": check_in_dt.strftime("%d/%m/%Y às %Hh%M"),
+                "check_out": (check_in_dt + datetime.timedelta(days=1)).strftime(
+                    "%d/%m/%Y às %Hh%M"
+                ),
+            },
+        )
+        assert create_response.status_code == 201
+
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    window = {
+        "check_in_from": "2031-05-02T00:00:00",
+        "check_in_to": "2031-06-01T00:00:00",
+    }
+
+    response = await client.get("/reservations/export", headers=headers, params=window)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["title"] for r in rows] == ["Reserva Exportada 1", "Reserva Exportada 2"]
+
+    response = await client.get(
+        "/reservations/export", headers=headers, params={**window, "format": "csv"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0].split(",")[:3] == ["id", "user_id", "title"]
+    assert len(lines) == 3
+
+    response = await client.get(
+        "/reservations/export", headers={"Authorization": f"Bearer {user_token}"}
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_overlapping_booking_for_same_bedroom_is_rejected(client):
+    user_token, _ = await register_and_login_test_user(
+        client, "overlap_user@example.com", "Overlap@123!"
+    )
+    headers = {"Authorization": f"Bearer {user_token}"}
+    bedroom_id = await get_bedroom_id(client)
+
+    def booking(check_in_day: int, check_out_day: int) -> dict:
+        return {
+            "title": "Reserva Sobreposta",
+            "address": "Rua Sobreposta, 1",
+            "check_in": f"{check_in_day:02d}/07/2031 às 14h00",
+            "check_out": f"{check_out_day:02d}/07/2031 às 11h00",
+            "bedroom_id": bedroom_id,
+        }
+
+    first = await client.post("/reservations/", headers=headers, json=booking(10, 15))
+    assert first.status_code == 201
+    assert first.json()["reservation"]["bedroom_id"] == bedroom_id
+
+    overlapping = await client.post(
+        "/reservations/", headers=headers, json=booking(14, 18)
+    )
+    assert overlapping.status_code == 409
+
+    # Check-out às 11h e check-in às 14h do mesmo dia não se sobrepõem.
+    back_to_back = await client.post(
+        "/reservations/", headers=headers, json=booking(15, 18)
+    )
+    assert back_to_back.status_code == 201
+
+    cancel = await client.post(
+        f"/reservations/{first.json()['reservation']['id']}/cancel", headers=headers
+    )
+    assert cancel.status_code == 200
+    rebooked = await client.post(
+        "/reservations/", headers=headers, json=booking(11, 13)
+    )
+    assert rebooked.status_code == 201
+
+    unknown_bedroom = await client.post(
+        "/reservations/",
+        headers=headers,
+        json={**booking(20, 22), "bedroom_id": str(uuid.uuid4())},
+    )
+    assert unknown_bedroom.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_for_same_night_accept_exactly_one(
+    concurrent_client,
+):
+    user_token, _ = await register_and_login_test_user(
+        concurrent_client, "race_user@example.com", "RaceUser@123!"
+    )
+    headers = {"Authorization": f"Bearer {user_token}"}
+    bedroom_id = await get_bedroom_id(concurrent_client)
+    payload = {
+        "title": "Reserva Disputada",
+        "address": "Rua Disputada, 1",
+        "check_in": "24/12/2031 às 14h00",
+        "check_out": "25/12/2031 às 11h00",
+        "bedroom_id": bedroom_id,
+    }
+
+    responses = await asyncio.gather(
+        *(
+            concurrent_client.post("/reservations/", headers=headers, json=payload)
+            for _ in range(200)
+        )
+    )
+
+    codes = [r.status_code for r in responses]
+    assert codes.count(201) == 1
+    assert codes.count(409) == 199
+
+
+@pytest.mark.asyncio
+async def test_my_reservations_cache_is_shared_and_invalidated(shared_cache, client):
+    from blog.infra.cache.reservation_cache import reservation_list_cache
+
+    token, _ = await register_and_login_test_user(
+        client, "cache_me@example.com", "CacheMe@123!"
+    )
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get("/reservations/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["reservations"] == []
+    hits = reservation_list_cache.hits
+    response = await client.get("/reservations/me", headers=headers)
+    assert response.json()["reservations"] == []
+    assert reservation_list_cache.hits == hits + 1
+
+    check_in = datetime.datetime.now() + datetime.timedelta(days=40)
+    response = await client.post(
+        "/reservations/",
+        headers=headers,
+        json={
+            "title": "Reserva em Cache",
+            "address": "Rua do Cache, 1",
+            "check_in": check_in.strftime("%d/%m/%Y às %Hh%M"),
+            "check_out": (check_in + datetime.timedelta(days=2)).strftime(
+                "%d/%m/%Y às %Hh%M"
+            ),
+            "bedroom_id": await get_bedroom_id(client),
+        },
+    )
+    assert response.status_code == 201
+    reservation_id = response.json()["reservation"]["id"]
+
+    response = await client.get("/reservations/me", headers=headers)
+    assert [r["id"] for r in response.json()["reservations"]] == [reservation_id]
+
+    response = await client.delete(f"/reservations/{reservation_id}", headers=headers)
+    assert response.status_code == 200
+    response = await client.get("/reservations/me", headers=headers)
+    assert response.json()["reservations"] == []
+    assert shared_cache.commands > 0
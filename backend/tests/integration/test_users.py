@@ -1,5 +1,7 @@
 import pytest
 
+from blog.api.settings import settings
+
 
 @pytest.mark.asyncio
 async def test_register_and_login(client):
@@ -36,6 +38,28 @@ async def test_register_and_login(client):
     assert data["email"] == "test@example.com"
 
 
+@pytest.mark.asyncio
+async def test_email_is_unique_and_matched_case_insensitively(client):
+    payload = {
+        "name": "Case",
+        "email": "Case.User@Example.com",
+        "password": "case@A123",
+        "role": "user",
+    }
+    response = await client.post("/auth/register", json=payload)
+    assert response.status_code == 201
+
+    response = await client.post(
+        "/auth/register", json={**payload, "email": "case.user@example.com"}
+    )
+    assert response.status_code == 400
+
+    response = await client.post(
+        "/auth/login", json={"email": "CASE.USER@EXAMPLE.COM", "password": "case@A123"}
+    )
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_admin_user_registration(client):
     response = await client.post(
@@ -54,3 +78,212 @@ async def test_admin_user_registration(client):
     assert response.status_code == 201
     data = response.json()
     assert data["user"]["role"] == "admin"
+
+
+@pytest.mark.asyncio
+async def test_internal_metrics_admin_only(client):
+    for email, role in [
+        ("metrics_admin@example.com", "admin"),
+        ("metrics_user@example.com", "user"),
+    ]:
+        response = await client.post(
+            "/auth/register",
+            json={
+                "name": "Metrics",
+                "email": email,
+                "password": "Metrics@123!",
+                "role": role,
+            },
+        )
+        assert response.status_code == 201
+
+    tokens = {}
+    for email in ["metrics_admin@example.com", "metrics_user@example.com"]:
+        response = await client.post(
+            "/auth/login", json={"email": email, "password": "Metrics@123!"}
+        )
+        tokens[email] = response.json()["access_token"]
+
+    response = await client.get(
+        "/internal/principal-cache",
+        headers={"Authorization": f"Bearer {tokens['metrics_admin@example.com']}"},
+    )
+    assert response.status_code == 200
+    assert "hit_ratio" in response.json()
+
+    response = await client.get(
+        "/internal/principal-cache",
+        headers={"Authorization": f"Bearer {tokens['metrics_user@example.com']}"},
+    )
+    assert response.status_code == 403
+
+    response = await client.get(
+        "/internal/pool",
+        headers={"Authorization": f"Bearer {tokens['metrics_admin@example.com']}"},
+    )
+    assert response.status_code == 200
+    assert "checked_out" in response.json()
+
+
+@pytest.mark.asyncio
+async def test_claims_token_authorizes_and_is_revoked_on_role_change(
+    client, db_session, monkeypatch
+):
+    from sqlalchemy import select
+    from jose import jwt
+    from blog.api.settings import settings
+    from blog.infra.models.user_model import UserModel
+
+    monkeypatch.setattr(settings, "JWT_CLAIMS_MODE", True)
+    credentials = {"email": "claims_user@example.com", "password": "Claims@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Claims", "role": "user", **credentials}
+    )
+    assert response.status_code == 201
+
+    response = await client.post("/auth/login", json=credentials)
+    token = response.json()["access_token"]
+    claims = jwt.get_unverified_claims(token)
+    assert claims["role"] == "user"
+    assert claims["ver"] == 0
+
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await client.get("/reservations/me", headers=headers)
+    assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(UserModel).where(UserModel.email == credentials["email"])
+    )
+    model = result.scalar_one()
+    model.role = "admin"
+    await db_session.commit()
+
+    response = await client.get("/reservations/me", headers=headers)
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_register_uses_a_single_insert(db_session, query_counter):
+    import uuid
+    from blog.domain.entities.user import User
+    from blog.domain.value_objects.email_vo import Email
+    from blog.domain.value_objects.password import Password
+    from blog.infra.repositories.sqlalchemy.sqlalchemy_user_repository import (
+        SQLAlchemyUserRepository,
+    )
+
+    user = User(
+        id=str(uuid.uuid4()),
+        name="Insert User",
+        email=Email("single_insert@example.com"),
+        password=Password.from_hash("hash"),
+        role="user",
+        phone="11999990000",
+        document=None,
+        address=None,
+    )
+    query_counter.reset()
+    registered = await SQLAlchemyUserRepository(db_session).register(user)
+
+    assert query_counter.count == 1
+    assert "RETURNING" in query_counter.statements[0]
+    assert registered.id == user.id
+    assert registered.phone == "11999990000"
+    assert registered.token_version == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_register_users(client, query_counter, monkeypatch):
+    from blog.api.security import get_password_hash
+
+    admin = {"email": "bulk_admin@example.com", "password": "BulkAdm@123!"}
+    response = await client.post(
+        "/auth/register", json={"name": "Bulk Admin", "role": "admin", **admin}
+    )
+    assert response.status_code == 201
+    response = await client.post("/auth/login", json=admin)
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    users = [
+        {
+            "name": f"Migrado {i}",
+            "email": f"migrado{i}@example.com",
+            "password": f"Migrado@{i}23",
+        }
+        for i in range(20)
+    ]
+    users += [
+        {
+            "name": "Legado",
+            "email": "legado@example.com",
+            "password_hash": get_password_hash("Legado@123"),
+        },
+        {"name": "Fraca", "email": "fraca@example.com", "password": "semforca"},
+        {
+            "name": "Repetido",
+            "email": "BULK_ADMIN@example.com",
+            "password": "Rep@12345",
+        },
+    ]
+    query_counter.reset()
+    response = await client.post(
+        "/auth/bulk-register", headers=headers, json={"users": users}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["received"] == 23
+    assert report["registered"] == 21
+    assert report["duplicates"] == ["BULK_ADMIN@example.com"]
+    assert [e["index"] for e in report["errors"]] == [21]
+    # Um SELECT de e-mails existentes e um INSERT por lote, fora a autenticação.
+    assert len([s for s in query_counter.statements if "INSERT" in s]) == 1
+    assert len([s for s in query_counter.statements if "lower(users.email)" in s]) == 1
+
+    response = await client.post(
+        "/auth/login", json={"email": "legado@example.com", "password": "Legado@123"}
+    )
+    assert response.status_code == 200
+    response = await client.post(
+        "/auth/login", json={"email": "migrado7@example.com", "password": "Migrado@723"}
+    )
+    assert response.status_code == 200
+
+    response = await client.post(
+        "/auth/bulk-register",
+        headers=headers,
+        json={"users": [{"name": "Sem Senha", "email": "sem@example.com"}]},
+    )
+    assert response.status_code == 422
+
+    # $2x$ é o prefixo do bug antigo do crypt_blowfish: não é aceito.
+    legacy = get_password_hash("Legado@123")
+    response = await client.post(
+        "/auth/bulk-register",
+        headers=headers,
+        json={
+            "users": [
+                {
+                    "name": "Bug Antigo",
+                    "email": "bug@example.com",
+                    "password_hash": "$2x$" + legacy[4:],
+                }
+            ]
+        },
+    )
+    assert response.status_code == 422
+
+    monkeypatch.setattr(settings, "USER_IMPORT_MAX_PLAIN_PASSWORDS", 2)
+    response = await client.post(
+        "/auth/bulk-register", headers=headers, json={"users": users[:3]}
+    )
+    assert response.status_code == 422
+
+    response = await client.post(
+        "/auth/login", json={"email": "migrado1@example.com", "password": "Migrado@123"}
+    )
+    response = await client.post(
+        "/auth/bulk-register",
+        headers={"Authorization": f"Bearer {response.json()['access_token']}"},
+        json={"users": users[:1]},
+    )
+    assert response.status_code == 403
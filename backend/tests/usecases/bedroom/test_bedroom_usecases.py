@@ -1,13 +1,26 @@
+import threading
 import uuid
 import pytest
+from datetime import date, datetime
 
 from blog.domain.entities.bedroom import Bedroom
+from blog.domain.entities.reservation import Reservation
+from blog.domain.entities.rate_override import RateOverride
 from blog.infra.repositories.in_memory.in_memory_bedroom_repository import (
     InMemoryBedroomRepository,
 )
+from blog.infra.repositories.in_memory.in_memory_reservation_repository import (
+    InMemoryReservationRepository,
+)
 
 from blog.usecases.bedroom.get_bedroom_by_id import GetBedroomById
 from blog.usecases.bedroom.list_bedroom import ListBedroom
+from blog.usecases.bedroom.list_available_bedroom import ListAvailableBedroom
+from blog.usecases.bedroom.quote_stays import QuoteStays
+from blog.usecases.bedroom.add_rate_override import AddRateOverride
+from blog.usecases.bedroom.bulk_import_bedrooms import BulkImportBedrooms
+from blog.usecases.bedroom.update_bedroom_image import UpdateBedroomImage
+from blog.domain.services.image_processor import ImageProcessor
 
 
 def create_test_bedroom() -> Bedroom:
@@ -66,3 +79,236 @@ async def test_list_bedroom_use_case_populated():
     assert len(bedrooms) == 2
     assert bedroom1 in bedrooms
     assert bedroom2 in bedrooms
+
+
+@pytest.mark.asyncio
+async def test_list_available_bedroom_use_case():
+    reservation_repo = InMemoryReservationRepository()
+    bedroom_repo = InMemoryBedroomRepository(reservation_repo)
+    busy, free = create_test_bedroom(), create_test_bedroom()
+    await bedroom_repo.create_bedroom(busy)
+    await bedroom_repo.create_bedroom(free)
+    await reservation_repo.create_reservation(
+        Reservation(
+            id=str(uuid.uuid4()),
+            user_id="user1",
+            title="Reserva",
+            address="Rua A, 123",
+            check_in="10/07/2031 às 14h00",
+            check_out="15/07/2031 às 11h00",
+            status="Pendente",
+            bedroom_id=busy.id,
+        )
+    )
+
+    usecase = ListAvailableBedroom(bedroom_repo)
+    available = await usecase.execute(datetime(2031, 7, 12), datetime(2031, 7, 20))
+    assert available == [free]
+
+    available = await usecase.execute(datetime(2031, 7, 15, 14), datetime(2031, 7, 20))
+    assert {b.id for b in available} == {busy.id, free.id}
+
+    with pytest.raises(ValueError):
+        await usecase.execute(datetime(2031, 7, 20), datetime(2031, 7, 12))
+
+
+@pytest.mark.asyncio
+async def test_quote_stays_applies_weekend_and_season_rates():
+    bedroom_repo = InMemoryBedroomRepository()
+    bedroom = create_test_bedroom()  # R$ 200.00 por noite
+    other = create_test_bedroom()
+    await bedroom_repo.create_bedroom(bedroom)
+    await bedroom_repo.create_bedroom(other)
+    add_rate = AddRateOverride(bedroom_repo)
+    # Sexta e sábado mais caros; temporada de julho acima de tudo.
+    await add_rate.execute(
+        RateOverride(None, bedroom.id, 30000, weekdays=[4, 5], priority=1)
+    )
+    await add_rate.execute(
+        RateOverride(
+            None,
+            bedroom.id,
+            50000,
+            start_date=date(2031, 7, 1),
+            end_date=date(2031, 8, 1),
+            priority=2,
+        )
+    )
+    with pytest.raises(ValueError):
+        await add_rate.execute(RateOverride(None, "nao-existe", 100))
+
+    quotes = await QuoteStays(bedroom_repo).execute(
+        [
+            # Qui 05/06 a Seg 09/06/2031: qui, sex, sáb, dom
+            (bedroom.id, date(2031, 6, 5), date(2031, 6, 9)),
+            # 30/06 a 02/07: uma noite normal (seg) e uma de temporada
+            (bedroom.id, date(2031, 6, 30), date(2031, 7, 2)),
+            (other.id, date(2031, 6, 5), date(2031, 6, 9)),
+        ]
+    )
+
+    assert [q.total_cents for q in quotes] == [
+        20000 + 30000 + 30000 + 20000,
+        20000 + 50000,
+        4 * 20000,
+    ]
+    assert [q.nights for q in quotes] == [4, 2, 4]
+    assert {q.currency for q in quotes} == {"BRL"}
+
+    with pytest.raises(ValueError):
+        await QuoteStays(bedroom_repo).execute(
+            [(str(uuid.uuid4()), date(2031, 6, 5), date(2031, 6, 9))]
+        )
+
+
+@pytest.mark.asyncio
+async def test_quote_stays_breaks_priority_ties_by_id_and_caps_the_window():
+    bedroom = create_test_bedroom()
+    stay = [(bedroom.id, date(2031, 6, 5), date(2031, 6, 6))]
+    rates = [
+        RateOverride("b", bedroom.id, 30000, priority=1),
+        RateOverride("a", bedroom.id, 10000, priority=1),
+    ]
+    for ordered in (rates, rates[::-1]):
+        bedroom_repo = InMemoryBedroomRepository()
+        await bedroom_repo.create_bedroom(bedroom)
+        for rate in ordered:
+            await bedroom_repo.add_rate_override(rate)
+        quotes = await QuoteStays(bedroom_repo).execute(stay)
+        assert quotes[0].total_cents == 30000
+
+    with pytest.raises(ValueError):
+        await QuoteStays(bedroom_repo, max_window_days=30).execute(
+            stay + [(bedroom.id, date(2031, 8, 1), date(2031, 8, 2))]
+        )
+    with pytest.raises(ValueError):
+        await QuoteStays(bedroom_repo).execute(
+            [(bedroom.id, date(2031, 6, 9), date(2031, 6, 5))]
+        )
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_bedrooms_merges_by_code_and_reports_row_errors():
+    bedroom_repo = InMemoryBedroomRepository()
+
+    def catalog_bedroom(code: str, price: str) -> Bedroom:
+        return Bedroom(
+            id=None,
+            title=f"Quarto {code}",
+            description="Quarto importado do catálogo do parceiro.",
+            price=price,
+            image=f"{code}.jpg",
+            code=code,
+        )
+
+    rows = [
+        (2, catalog_bedroom("a", "R$ 100,00")),
+        (3, "title: String should have at least 3 characters"),
+        (4, catalog_bedroom("b", "R$ 200,00")),
+        (5, catalog_bedroom("c", "R$ 300,00")),
+        (6, catalog_bedroom("a", "R$ 150,00")),
+    ]
+    report = await BulkImportBedrooms(bedroom_repo).execute(rows, chunk_size=2)
+
+    assert report.rows == 5
+    # "a" aparece em dois lotes: inserido no primeiro, atualizado no último.
+    assert report.imported == 4
+    assert report.failed == 1
+    assert report.errors == [(3, "title: String should have at least 3 characters")]
+
+    bedrooms = await bedroom_repo.get_all_bedrooms()
+    assert {b.code: b.price_cents for b in bedrooms} == {
+        "a": 15000,
+        "b": 20000,
+        "c": 30000,
+    }
+
+    report = await BulkImportBedrooms(bedroom_repo).execute(
+        [
+            (2, catalog_bedroom("b", "R$ 210,00")),
+            (3, catalog_bedroom("b", "R$ 220,00")),
+        ],
+        chunk_size=10,
+        max_errors=0,
+    )
+    assert (report.imported, report.failed, report.errors) == (1, 1, [])
+    assert len(await bedroom_repo.get_all_bedrooms()) == 3
+
+    # O parse/validação das linhas (o gerador) não roda no thread do event loop.
+    threads = set()
+
+    def parsed_rows():
+        for line, code in enumerate(["d", "e", "f"], start=2):
+            threads.add(threading.get_ident())
+            yield line, catalog_bedroom(code, "R$ 100,00")
+
+    report = await BulkImportBedrooms(bedroom_repo).execute(parsed_rows(), 2)
+    assert report.imported == 3
+    assert threading.get_ident() not in threads
+
+
+class FakeImageProcessor(ImageProcessor):
+    def __init__(self):
+        self.derived = []
+
+    async def store(self, data):
+        if not data:
+            raise ValueError("Invalid image file.")
+        return "/static/derived/original.png", {"image/webp": {"320": "/t.webp"}}
+
+    async def derive(self, image):
+        self.derived.append(image)
+        if not image.startswith("/static/"):
+            return None
+        return {"image/webp": {"320": f"{image}.320.webp"}}
+
+
+@pytest.mark.asyncio
+async def test_bulk_import_derives_each_distinct_image_once():
+    bedroom_repo = InMemoryBedroomRepository()
+    image_processor = FakeImageProcessor()
+
+    def catalog_bedroom(code: str, image: str) -> Bedroom:
+        return Bedroom(
+            id=None,
+            title=f"Quarto {code}",
+            description="Quarto importado do catálogo do parceiro.",
+            price="R$ 100,00",
+            image=image,
+            code=code,
+        )
+
+    rows = [
+        (2, catalog_bedroom("a", "/static/images/q1.png")),
+        (3, catalog_bedroom("b", "/static/images/q1.png")),
+        (4, catalog_bedroom("c", "https://cdn.example.com/q2.png")),
+    ]
+    await BulkImportBedrooms(bedroom_repo, image_processor).execute(rows, chunk_size=10)
+
+    assert image_processor.derived == [
+        "/static/images/q1.png",
+        "https://cdn.example.com/q2.png",
+    ]
+    variants = {b.code: b.image_variants for b in await bedroom_repo.get_all_bedrooms()}
+    assert variants == {
+        "a": {"image/webp": {"320": "/static/images/q1.png.320.webp"}},
+        "b": {"image/webp": {"320": "/static/images/q1.png.320.webp"}},
+        "c": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_bedroom_image_use_case():
+    bedroom_repo = InMemoryBedroomRepository()
+    bedroom = create_test_bedroom()
+    await bedroom_repo.create_bedroom(bedroom)
+    usecase = UpdateBedroomImage(bedroom_repo, FakeImageProcessor())
+
+    updated = await usecase.execute(bedroom.id, b"png")
+    assert updated is not None
+    assert updated.image == "/static/derived/original.png"
+    assert updated.image_variants == {"image/webp": {"320": "/t.webp"}}
+
+    assert await usecase.execute(str(uuid.uuid4()), b"png") is None
+    with pytest.raises(ValueError):
+        await usecase.execute(bedroom.id, b"")
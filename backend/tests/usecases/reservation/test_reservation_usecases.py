@@ -6,12 +6,14 @@ from blog.domain.entities.user import User
 from blog.domain.entities.reservation import Reservation
 from blog.domain.value_objects.email_vo import Email
 from blog.domain.value_objects.password import Password
+from blog.domain.repositories.reservation_repository import ReservationConflictError
 from blog.infra.repositories.in_memory.in_memory_user_repository import (
     InMemoryUserRepository,
 )
 from blog.infra.repositories.in_memory.in_memory_reservation_repository import (
     InMemoryReservationRepository,
 )
+from blog.infra.services.bitmap_occupancy_calendar import BitmapOccupancyCalendar
 
 from blog.usecases.reservation.create_reservation import CreateReservation
 from blog.usecases.reservation.get_user_reservation_by_id import GetUserReservationById
@@ -202,3 +204,145 @@ async def test_list_reservation_use_case():
     assert reservation1 in reservations
     assert reservation2 in reservations
     assert reservation3 in reservations
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_delete_reservation_respect_owner():
+    from blog.domain.repositories.reservation_repository import (
+        ReservationPermissionError,
+    )
+
+    reservation_repo = InMemoryReservationRepository()
+    owner = create_test_user()
+    reservation = create_test_reservation(owner.id)
+    await reservation_repo.create_reservation(reservation)
+
+    with pytest.raises(ReservationPermissionError):
+        await CancelReservation(reservation_repo).execute(reservation.id, "outro")
+    with pytest.raises(ReservationPermissionError):
+        await DeleteReservation(reservation_repo).execute(reservation.id, "outro")
+    assert reservation.status == "Pendente"
+
+    canceled = await CancelReservation(reservation_repo).execute(
+        reservation.id, owner.id
+    )
+    assert canceled.status == "cancelled"
+    assert await DeleteReservation(reservation_repo).execute(reservation.id, owner.id)
+    assert await CancelReservation(reservation_repo).execute(reservation.id) is None
+
+
+@pytest.mark.asyncio
+async def test_list_reservation_page_use_case():
+    from blog.usecases.reservation.list_reservation_page import ListReservationPage
+
+    reservation_repo = InMemoryReservationRepository()
+    user = create_test_user()
+    for days in [3, 1, 2, 5, 4]:
+        reservation = create_test_reservation(user.id)
+        reservation.check_in = datetime.datetime(2030, 1, days, 14, 0)
+        await reservation_repo.create_reservation(reservation)
+    await reservation_repo.create_reservation(create_test_reservation("outro"))
+
+    usecase = ListReservationPage(reservation_repo)
+    first, cursor = await usecase.execute(limit=2, user_id=user.id)
+    second, cursor2 = await usecase.execute(limit=2, user_id=user.id, after=cursor)
+    third, cursor3 = await usecase.execute(limit=2, user_id=user.id, after=cursor2)
+
+    days = [r.check_in.day for r in first + second + third]
+    assert days == [1, 2, 3, 4, 5]
+    assert cursor3 is None
+
+    filtered, _ = await usecase.execute(
+        limit=10,
+        user_id=user.id,
+        check_in_from=datetime.datetime(2030, 1, 2),
+        check_in_to=datetime.datetime(2030, 1, 4),
+    )
+    assert [r.check_in.day for r in filtered] == [2, 3]
+
+    first[0].cancel_reservation()
+    cancelled, _ = await usecase.execute(limit=10, status="cancelled")
+    assert cancelled == [first[0]]
+
+
+@pytest.mark.asyncio
+async def test_create_reservation_rejects_overlapping_stay():
+    user_repo = InMemoryUserRepository()
+    reservation_repo = InMemoryReservationRepository()
+    user = create_test_user()
+    await user_repo.register(user)
+    usecase = CreateReservation(reservation_repo, user_repo)
+
+    async def book(check_in_str: str, check_out_str: str) -> Reservation:
+        return await usecase.execute(
+            user_id=user.id,
+            title="Reserva de Exemplo",
+            address="Endereço Teste",
+            check_in_str=check_in_str,
+            check_out_str=check_out_str,
+            bedroom_id="quarto-1",
+        )
+
+    first = await book("10/07/2031 às 14h00", "15/07/2031 às 11h00")
+    with pytest.raises(ReservationConflictError):
+        await book("09/07/2031 às 14h00", "11/07/2031 às 11h00")
+    await book("15/07/2031 às 14h00", "18/07/2031 às 11h00")
+    with pytest.raises(ValueError):
+        await book("20/07/2031 às 14h00", "19/07/2031 às 11h00")
+
+    assert not await reservation_repo.is_bedroom_available(
+        "quarto-1", datetime.datetime(2031, 7, 12), datetime.datetime(2031, 7, 13)
+    )
+    await CancelReservation(reservation_repo).execute(first.id)
+    assert await reservation_repo.is_bedroom_available(
+        "quarto-1", datetime.datetime(2031, 7, 12), datetime.datetime(2031, 7, 13)
+    )
+
+
+@pytest.mark.asyncio
+async def test_reservation_use_cases_keep_occupancy_calendar_in_sync():
+    user_repo = InMemoryUserRepository()
+    reservation_repo = InMemoryReservationRepository()
+    calendar = BitmapOccupancyCalendar()
+    user = create_test_user()
+    await user_repo.register(user)
+
+    def occupied_days(month: int):
+        days = calendar.month("quarto-1", 2031, month)
+        return [day for day, busy in enumerate(days, start=1) if busy]
+
+    reservation = await CreateReservation(
+        reservation_repo, user_repo, calendar=calendar
+    ).execute(
+        user_id=user.id,
+        title="Reserva de Exemplo",
+        address="Endereço Teste",
+        check_in_str="10/07/2031 às 14h00",
+        check_out_str="13/07/2031 às 11h00",
+        bedroom_id="quarto-1",
+    )
+    assert occupied_days(7) == [10, 11, 12]
+
+    await UpdateReservation(reservation_repo, calendar).execute(
+        reservation.id,
+        new_check_in_str="20/07/2031 às 14h00",
+        new_check_out_str="22/07/2031 às 11h00",
+    )
+    assert occupied_days(7) == [20, 21]
+
+    await CancelReservation(reservation_repo, calendar).execute(reservation.id)
+    assert occupied_days(7) == []
+
+    other = await CreateReservation(
+        reservation_repo, user_repo, calendar=calendar
+    ).execute(
+        user_id=user.id,
+        title="Outra Reserva",
+        address="Endereço Teste",
+        check_in_str="01/08/2031 às 14h00",
+        check_out_str="03/08/2031 às 11h00",
+        bedroom_id="quarto-1",
+    )
+    assert occupied_days(8) == [1, 2]
+    assert await DeleteReservation(reservation_repo, calendar).execute(other.id)
+    assert occupied_days(8) == []
@@ -11,6 +11,10 @@ from blog.usecases.user.login_user import LoginUserUseCase
 from blog.usecases.user.logout_user import LogoutUserUseCase
 from blog.usecases.user.get_current_user import GetCurrentUserUseCase
 from blog.usecases.user.set_current_user import SetCurrentUserUseCase
+from blog.usecases.user.bulk_register_users import BulkRegisterUsers
+from blog.infra.services.process_pool_password_hasher import (
+    ProcessPoolPasswordHasher,
+)
 
 
 def create_test_user() -> User:
@@ -30,13 +34,28 @@ def create_test_user() -> User:
 @pytest.mark.asyncio
 async def test_register_user():
     repo = InMemoryUserRepository()
-    usecase = RegisterUserUseCase(repo)
+    usecase = RegisterUserUseCase(repo, ProcessPoolPasswordHasher(max_workers=0))
     user = create_test_user()
 
     result = await usecase.execute(user)
 
     assert result == user
     assert await repo.get_current_user() == user
+    assert user.password.verify(str(user.password))
+
+
+@pytest.mark.asyncio
+async def test_register_user_hashes_with_process_pool():
+    hasher = ProcessPoolPasswordHasher(max_workers=1)
+    repo = InMemoryUserRepository()
+    usecase = RegisterUserUseCase(repo, hasher)
+    user = create_test_user()
+
+    try:
+        await usecase.execute(user)
+        assert await hasher.verify("secur3@Pass", str(user.password))
+    finally:
+        hasher.shutdown()
 
 
 @pytest.mark.asyncio
@@ -87,3 +106,60 @@ async def test_set_current_user():
     await usecase.execute(user)
 
     assert await repo.get_current_user() == user
+
+
+@pytest.mark.asyncio
+async def test_login_user_with_plain_credential():
+    repo = InMemoryUserRepository()
+    user = create_test_user()
+    await repo.register(user)
+
+    usecase = LoginUserUseCase(repo)
+    result = await usecase.execute(user.email, Password.for_login("secur3@Pass"))
+    wrong = await usecase.execute(user.email, Password.for_login("outra-senha"))
+
+    assert result == user
+    assert wrong is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_register_users_hashes_in_pool_and_skips_duplicates():
+    legacy_hash = "$2b$12$M2umlxuSaxTB0oilG4.d/OWSOKh2n2e3Zr3dAOOLRhUzHODHB19ua"
+
+    def user(email: str, password: Password) -> User:
+        return User(
+            str(uuid.uuid4()),
+            "Bulk User",
+            Email(email),
+            password,
+            "user",
+            None,
+            None,
+            None,
+        )
+
+    repo = InMemoryUserRepository()
+    await repo.register(user("taken@example.com", Password.from_hash(legacy_hash)))
+    users = [
+        user("a@example.com", Password("secur3@Pass")),
+        user("b@example.com", Password("secur3@Pass2")),
+        user("Taken@Example.com", Password("secur3@Pass")),
+        user("A@example.com", Password("secur3@Pass")),
+        user("legacy@example.com", Password.from_hash(legacy_hash)),
+    ]
+
+    hasher = ProcessPoolPasswordHasher(max_workers=2)
+    try:
+        report = await BulkRegisterUsers(repo, hasher).execute(users, batch_size=3)
+        # O cadastro em massa não ocupa o pool do login.
+        assert hasher._bulk_executor is not None and hasher._executor is None
+        assert report.received == 5
+        assert report.registered == 3
+        assert sorted(report.duplicates) == ["A@example.com", "Taken@Example.com"]
+        assert await hasher.verify("secur3@Pass2", str(users[1].password))
+    finally:
+        hasher.shutdown()
+
+    assert str(users[4].password) == legacy_hash
+    # Duplicados são descartados antes do bcrypt.
+    assert [u.password.is_hashed for u in users] == [True, True, False, False, True]